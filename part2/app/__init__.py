@@ -1,11 +1,6 @@
 from flask import Flask
 from flask_restx import Api
 from flask_jwt_extended import JWTManager
-from app.api.v1.users import api as users_ns
-from app.api.v1.auth import api as auth_ns
-from app.api.v1.amenities import api as amenities_ns
-from app.api.v1.places import api as places_ns
-from app.api.v1.reviews import api as reviews_ns
 import os
 from dotenv import load_dotenv
 
@@ -23,6 +18,13 @@ def create_app():
 
     jwt = JWTManager(app)
 
+    # Imported here: each namespace builds the facade and its repositories
+    from app.api.v1.users import api as users_ns
+    from app.api.v1.auth import api as auth_ns
+    from app.api.v1.amenities import api as amenities_ns
+    from app.api.v1.places import api as places_ns
+    from app.api.v1.reviews import api as reviews_ns
+
     api.add_namespace(users_ns, path='/api/v1/users')
     api.add_namespace(auth_ns, path='/api/v1/auth')
     api.add_namespace(amenities_ns, path='/api/v1/amenities')
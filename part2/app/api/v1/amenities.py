@@ -1,5 +1,6 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import hbnb_facade as facade
+from app.api.v1.pagination import pagination_parser, page_args, page_headers
 
 api = Namespace('amenities', description='Amenity related operations')
 
@@ -32,12 +33,17 @@ class AmenityList(Resource):
         except ValueError as e:
             return {'error': str(e)}, 400
 
+    @ api.expect(pagination_parser)
     @ api.response(200, 'List of amenities retrieved successfully')
+    @ api.response(400, 'Invalid cursor')
     def get(self):
-        """Retrieve a list of all amenities"""
+        """Retrieve a page of amenities"""
         try:
-            amenities = facade.get_all_amenities()
-            return [amenity.to_dict() for amenity in amenities], 200
+            amenities, next_cursor = facade.get_amenities_page(*page_args())
+            return [amenity.to_dict() for amenity in amenities], 200, \
+                page_headers(next_cursor)
+        except ValueError as e:
+            return {'error': str(e)}, 400
         except Exception as e:
             return {'message': str(e)}, 500
 
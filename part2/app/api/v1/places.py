@@ -1,5 +1,7 @@
-from flask_restx import Namespace, Resource, fields
+from flask import current_app
+from flask_restx import Namespace, Resource, fields, inputs, reqparse
 from app.services.facade import hbnb_facade as facade
+from app.api.v1.pagination import pagination_parser, page_args, page_headers
 import logging
 
 logger = logging.getLogger(__name__)
@@ -72,12 +74,108 @@ class PlaceList(Resource):
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500
 
+    @api.expect(pagination_parser)
     @api.response(200, 'List of places retrieved successfully')
+    @api.response(400, 'Invalid cursor')
     def get(self):
-        """Retrieve a list of all places"""
+        """Retrieve a page of places"""
         try:
-            places = facade.get_all_places()
+            places, next_cursor = facade.get_places_page(*page_args())
+            return [place.to_dict() for place in places], 200, \
+                page_headers(next_cursor)
+        except ValueError as e:
+            logger.error(f"ValueError: {str(e)}")
+            return {'error': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Exception: {str(e)}")
+            return {'message': str(e)}, 500
+
+
+# Query parameters of the geographic searches
+radius_search_parser = reqparse.RequestParser()
+radius_search_parser.add_argument('lat', type=float, required=True,
+                                  location='args', help='Latitude')
+radius_search_parser.add_argument('lon', type=float, required=True,
+                                  location='args', help='Longitude')
+radius_search_parser.add_argument('radius_km', type=float, required=True,
+                                  location='args',
+                                  help='Search radius in kilometres')
+radius_search_parser.add_argument('limit', type=inputs.positive,
+                                  location='args',
+                                  help='Maximum number of places to return')
+
+box_search_parser = reqparse.RequestParser()
+for name, help_text in (('min_lat', 'Southern latitude'),
+                        ('min_lon', 'Western longitude'),
+                        ('max_lat', 'Northern latitude'),
+                        ('max_lon', 'Eastern longitude, may be lower '
+                                    'than min_lon across the antimeridian')):
+    box_search_parser.add_argument(name, type=float, required=True,
+                                   location='args', help=help_text)
+box_search_parser.add_argument('limit', type=inputs.positive,
+                               location='args',
+                               help='Maximum number of places to return')
+
+
+def validate_coordinates(latitude, longitude):
+    if not -90 <= latitude <= 90:
+        raise ValueError("Latitude is outside the range.")
+    if not -180 <= longitude <= 180:
+        raise ValueError("Longitude is outside the range.")
+
+
+def search_limit(args):
+    return min(args['limit'] or current_app.config.get('PAGE_SIZE', 100),
+               current_app.config.get('MAX_PAGE_SIZE', 1000))
+
+
+@api.route('/search')
+class PlaceRadiusSearch(Resource):
+    @api.expect(radius_search_parser)
+    @api.response(200, 'Places within the radius, nearest first')
+    @api.response(400, 'Invalid search parameters')
+    def get(self):
+        """Find the places within a radius of a coordinate"""
+        args = radius_search_parser.parse_args()
+        max_radius = current_app.config.get('MAX_SEARCH_RADIUS_KM', 500)
+        try:
+            validate_coordinates(args['lat'], args['lon'])
+            if not 0 < args['radius_km'] <= max_radius:
+                raise ValueError(
+                    f"radius_km must be between 0 and {max_radius}.")
+            matches = facade.search_places_by_radius(
+                args['lat'], args['lon'], args['radius_km'],
+                search_limit(args))
+            return [dict(place.to_dict(), distance_km=round(distance, 3))
+                    for place, distance in matches], 200
+        except ValueError as e:
+            logger.error(f"ValueError: {str(e)}")
+            return {'error': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Exception: {str(e)}")
+            return {'message': str(e)}, 500
+
+
+@api.route('/search/bbox')
+class PlaceBoxSearch(Resource):
+    @api.expect(box_search_parser)
+    @api.response(200, 'Places inside the bounding box')
+    @api.response(400, 'Invalid search parameters')
+    def get(self):
+        """Find the places inside a bounding box"""
+        args = box_search_parser.parse_args()
+        try:
+            validate_coordinates(args['min_lat'], args['min_lon'])
+            validate_coordinates(args['max_lat'], args['max_lon'])
+            if args['min_lat'] > args['max_lat']:
+                raise ValueError("min_lat must not exceed max_lat.")
+            places = facade.search_places_by_box(
+                args['min_lat'], args['min_lon'], args['max_lat'],
+                args['max_lon'], search_limit(args))
             return [place.to_dict() for place in places], 200
+        except ValueError as e:
+            logger.error(f"ValueError: {str(e)}")
+            return {'error': str(e)}, 400
         except Exception as e:
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500
@@ -1,5 +1,6 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import hbnb_facade as facade
+from app.api.v1.pagination import pagination_parser, page_args, page_headers
 import logging
 
 logger = logging.getLogger(__name__)
@@ -78,14 +79,19 @@ class ReviewList(Resource):
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500
 
+    @api.expect(pagination_parser)
     @api.response(200, 'List of reviews retrieved successfully')
+    @api.response(400, 'Invalid cursor')
     def get(self):
-        """Retrieve a list of all reviews"""
+        """Retrieve a page of reviews"""
         try:
-            reviews = facade.get_all_reviews()
+            reviews, next_cursor = facade.get_reviews_page(*page_args())
             return {
                 'reviews': [review.to_dict() for review in reviews]
-            }, 200
+            }, 200, page_headers(next_cursor)
+        except ValueError as e:
+            logger.error(f"ValueError: {str(e)}")
+            return {'message': str(e)}, 400
         except Exception as e:
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500
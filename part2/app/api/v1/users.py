@@ -1,5 +1,6 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import hbnb_facade as facade
+from app.api.v1.pagination import pagination_parser, page_args, page_headers
 
 api = Namespace('users', description='User operations')
 
@@ -59,15 +60,22 @@ class UserList(Resource):
         return {'id': user.id, 'first_name': user.first_name,
                 'last_name': user.last_name, 'email': user.email}, 201
 
+    @api.expect(pagination_parser)
     @api.response(200, 'List of users retrieved successfully')
+    @api.response(400, 'Invalid cursor')
     def get(self):
         """
-        Retrieve the list of all users.
+        Retrieve a page of users.
 
-        This method retrieves all registered users and returns their
-        details including `id`, `first_name`, `last_name`, and `email`.
+        This method retrieves registered users ordered by creation date
+        and returns their details including `id`, `first_name`,
+        `last_name`, and `email`. Pass the `X-Next-Cursor` header of a
+        response as `cursor` to fetch the following page.
         """
-        users = facade.get_all_users()
+        try:
+            users, next_cursor = facade.get_users_page(*page_args())
+        except ValueError as e:
+            return {'error': str(e)}, 400
         return [{'id': user.id, 'first_name': user.first_name,
                  'last_name': user.last_name, 'email': user.email,
                  'is_admin': user.is_admin, 'is_owner': user.is_owner,
@@ -75,7 +83,7 @@ class UserList(Resource):
                  'rented_places': [place.id for place in user.rented_places],
                  'created_at': user.created_at.isoformat(),
                  'updated_at': user.updated_at.isoformat()
-                 } for user in users], 200
+                 } for user in users], 200, page_headers(next_cursor)
 
 
 @api.route('/<user_id>')
@@ -123,7 +131,10 @@ class UserResource(Resource):
         """
         user_data = api.payload
 
-        updated_user = facade.update_user(user_id, user_data)
+        try:
+            updated_user = facade.update_user(user_id, user_data)
+        except ValueError as e:
+            return {'error': str(e)}, 400
         if not updated_user:
             return {'error': 'User not found'}, 404
         return {
@@ -1,4 +1,24 @@
 from abc import ABC, abstractmethod
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from app.persistence.spatial import KDTree
+
+
+def encode_cursor(obj):
+    """Build an opaque keyset cursor pointing just after ``obj``."""
+    key = f"{obj.created_at.isoformat()}|{obj.id}"
+    return urlsafe_b64encode(key.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Return the ``(created_at, id)`` key encoded in a cursor."""
+    try:
+        created_at, obj_id = urlsafe_b64decode(
+            cursor.encode()).decode().split('|', 1)
+        return datetime.fromisoformat(created_at), obj_id
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
 
 
 class Repository(ABC):
@@ -26,13 +46,55 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def find_by_attribute(self, attr_name, attr_value):
+        pass
+
+    @abstractmethod
+    def get_page(self, limit, cursor=None):
+        pass
+
 
 class InMemoryRepository(Repository):
-    def __init__(self):
+    def __init__(self, indexes=(), unique=()):
+        """Create an empty repository.
+
+        Args:
+            indexes (iterable): Attribute names to index for lookups.
+            unique (iterable): Attribute names to index whose values must
+                be unique across stored objects.
+        """
         self._storage = {}
+        # (created_at, id) keys kept sorted for keyset pagination
+        self._order = []
+        # attr_name -> {value: set of object ids}
+        self._indexes = {}
+        self._unique = set()
+        # obj_id -> {attr_name: value} as last indexed, so that objects
+        # mutated in place can still be found and re-indexed
+        self._indexed_values = {}
+        for attr_name in indexes:
+            self.add_index(attr_name)
+        for attr_name in unique:
+            self.add_index(attr_name, unique=True)
+
+    def add_index(self, attr_name, unique=False):
+        """Declare a hash index on ``attr_name`` and build it."""
+        self._indexes[attr_name] = {}
+        if unique:
+            self._unique.add(attr_name)
+        for obj in self._storage.values():
+            self._check_unique(obj, attr_name)
+            self._index_value(obj.id, attr_name, getattr(obj, attr_name, None))
 
     def add(self, obj):
+        for attr_name in self._unique:
+            self._check_unique(obj, attr_name)
+        if obj.id in self._storage:
+            self._unindex(self._storage[obj.id])
         self._storage[obj.id] = obj
+        insort(self._order, self._order_key(obj))
+        self._index(obj)
 
     def get(self, obj_id):
         return self._storage.get(obj_id)
@@ -40,20 +102,116 @@ class InMemoryRepository(Repository):
     def get_all(self):
         return list(self._storage.values())
 
+    def get_page(self, limit, cursor=None):
+        """Return up to ``limit`` objects ordered by ``(created_at, id)``.
+
+        Returns a ``(items, next_cursor)`` tuple; ``next_cursor`` is None
+        once the last page has been reached.
+        """
+        start = bisect_right(self._order, decode_cursor(cursor)) \
+            if cursor else 0
+        keys = self._order[start:start + limit + 1]
+        items = [self._storage[obj_id] for _, obj_id in keys[:limit]]
+        if len(keys) > limit:
+            return items, encode_cursor(items[-1])
+        return items, None
+
     def update(self, obj_id, data):
         obj = self.get(obj_id)
         if obj:
+            # restored when the update breaks a unique index
+            previous = vars(obj).copy()
             obj.update(data)
+            try:
+                for attr_name in self._unique:
+                    self._check_unique(obj, attr_name)
+            except ValueError:
+                vars(obj).clear()
+                vars(obj).update(previous)
+                raise
+            self._unindex_values(obj_id)
+            self._index(obj)
 
     def delete(self, obj_id):
         if obj_id in self._storage:
-            del self._storage[obj_id]
+            self._unindex(self._storage.pop(obj_id))
             return True
         return False
 
     def get_by_attribute(self, attr_name, attr_value):
+        if attr_name in self._indexes:
+            obj_ids = self._indexes[attr_name].get(attr_value)
+            return self._storage[next(iter(obj_ids))] if obj_ids else None
         return next(
             (obj for obj in self._storage.values()
              if getattr(obj, attr_name) == attr_value),
             None
         )
+
+    def find_by_attribute(self, attr_name, attr_value):
+        """Return every stored object whose attribute equals the value."""
+        if attr_name in self._indexes:
+            obj_ids = self._indexes[attr_name].get(attr_value, ())
+            return [self._storage[obj_id] for obj_id in obj_ids]
+        return [obj for obj in self._storage.values()
+                if getattr(obj, attr_name) == attr_value]
+
+    @staticmethod
+    def _order_key(obj):
+        return obj.created_at, obj.id
+
+    def _unindex(self, obj):
+        del self._order[bisect_left(self._order, self._order_key(obj))]
+        self._unindex_values(obj.id)
+
+    def _index(self, obj):
+        for attr_name in self._indexes:
+            self._index_value(obj.id, attr_name, getattr(obj, attr_name, None))
+
+    def _index_value(self, obj_id, attr_name, value):
+        self._indexes[attr_name].setdefault(value, set()).add(obj_id)
+        self._indexed_values.setdefault(obj_id, {})[attr_name] = value
+
+    def _unindex_values(self, obj_id):
+        for attr_name, value in self._indexed_values.pop(obj_id, {}).items():
+            obj_ids = self._indexes[attr_name][value]
+            obj_ids.discard(obj_id)
+            if not obj_ids:
+                del self._indexes[attr_name][value]
+
+    def _check_unique(self, obj, attr_name):
+        value = getattr(obj, attr_name, None)
+        obj_ids = self._indexes[attr_name].get(value, ())
+        if any(obj_id != obj.id for obj_id in obj_ids):
+            raise ValueError(
+                f"Duplicate value for unique attribute '{attr_name}'")
+
+
+class PlaceRepository(InMemoryRepository):
+    """In-memory place repository with a spatial index for searches."""
+
+    def __init__(self, indexes=(), unique=()):
+        super().__init__(indexes, unique)
+        self._tree = None
+
+    def add(self, obj):
+        super().add(obj)
+        self._tree = None
+
+    def update(self, obj_id, data):
+        super().update(obj_id, data)
+        self._tree = None
+
+    def delete(self, obj_id):
+        self._tree = None
+        return super().delete(obj_id)
+
+    def find_in_boxes(self, boxes):
+        """Return the places located inside any of the given
+        ``(min_lat, max_lat, min_lon, max_lon)`` boxes."""
+        if self._tree is None:
+            self._tree = KDTree((place.latitude, place.longitude, place.id)
+                                for place in self._storage.values())
+        obj_ids = {obj_id for box in boxes
+                   for obj_id in self._tree.query_box(box)}
+        return [self._storage[obj_id] for obj_id in obj_ids]
@@ -0,0 +1,82 @@
+"""
+Spatial index for the in-memory place repository.
+
+Places are kept in a 2-d tree on (latitude, longitude). The tree is
+rebuilt lazily on the first search after a write, so bursts of writes
+cost nothing and searches only visit the branches overlapping the
+searched box. Callers apply the exact distance check on the candidates.
+"""
+import math
+from operator import itemgetter
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+class KDTree:
+    """Static 2-d tree over ``(latitude, longitude, obj_id)`` points."""
+
+    def __init__(self, points):
+        self._root = self._build(list(points), 0)
+
+    def _build(self, points, axis):
+        if not points:
+            return None
+        points.sort(key=itemgetter(axis))
+        middle = len(points) // 2
+        return (points[middle], axis,
+                self._build(points[:middle], 1 - axis),
+                self._build(points[middle + 1:], 1 - axis))
+
+    def query_box(self, box):
+        """Return the ids of the points inside a
+        ``(min_lat, max_lat, min_lon, max_lon)`` box."""
+        min_lat, max_lat, min_lon, max_lon = box
+        lows, highs = (min_lat, min_lon), (max_lat, max_lon)
+        found, stack = [], [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            point, axis, left, right = node
+            if min_lat <= point[0] <= max_lat and \
+                    min_lon <= point[1] <= max_lon:
+                found.append(point[2])
+            if lows[axis] <= point[axis]:
+                stack.append(left)
+            if point[axis] <= highs[axis]:
+                stack.append(right)
+        return found
+
+
+def split_box(min_lat, max_lat, min_lon, max_lon):
+    """Split a box crossing the antimeridian (min_lon > max_lon) in two."""
+    if min_lon <= max_lon:
+        return [(min_lat, max_lat, min_lon, max_lon)]
+    return [(min_lat, max_lat, min_lon, 180.0),
+            (min_lat, max_lat, -180.0, max_lon)]
+
+
+def radius_boxes(latitude, longitude, radius_km):
+    """Return the boxes bounding a circle, split at the antimeridian."""
+    delta_lat = radius_km / KM_PER_DEGREE
+    min_lat = max(latitude - delta_lat, -90.0)
+    max_lat = min(latitude + delta_lat, 90.0)
+    # Near a pole the circle covers every longitude
+    widest = max(abs(min_lat), abs(max_lat))
+    if widest >= 90.0:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+    delta_lon = delta_lat / math.cos(math.radians(widest))
+    if delta_lon >= 180.0:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+    min_lon = (longitude - delta_lon + 180.0) % 360.0 - 180.0
+    max_lon = (longitude + delta_lon + 180.0) % 360.0 - 180.0
+    return split_box(min_lat, max_lat, min_lon, max_lon)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance between two coordinates, in kilometres."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
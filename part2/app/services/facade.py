@@ -1,4 +1,5 @@
-from app.persistence.repository import InMemoryRepository
+from app.persistence.repository import InMemoryRepository, PlaceRepository
+from app.persistence import spatial
 from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
@@ -15,8 +16,8 @@ class HBnBFacade:
 
     def __init__(self):
         """Initialize the HBnBFacade with in-memory repositories."""
-        self.user_repo = InMemoryRepository()
-        self.place_repo = InMemoryRepository()
+        self.user_repo = InMemoryRepository(unique=['email'])
+        self.place_repo = PlaceRepository()
         self.review_repo = InMemoryRepository()
         self.amenity_repo = InMemoryRepository()
 
@@ -34,6 +35,10 @@ class HBnBFacade:
         """Retrieve all users in the repository."""
         return self.user_repo.get_all()
 
+    def get_users_page(self, limit, cursor=None):
+        """Retrieve one page of users and the cursor of the next one."""
+        return self.user_repo.get_page(limit, cursor)
+
     def get_user_by_email(self, email):
         """Retrieve a user by their email address."""
         return self.user_repo.get_by_attribute('email', email)
@@ -42,8 +47,6 @@ class HBnBFacade:
         """Update an existing user with new data."""
         user = self.get_user(user_id)
         if user:
-            for key, value in user_data.items():
-                setattr(user, key, value)
             self.user_repo.update(user_id, user_data)
             return user
         return None
@@ -86,6 +89,40 @@ class HBnBFacade:
         """Retrieve all places."""
         return self.place_repo.get_all()
 
+    def get_places_page(self, limit, cursor=None):
+        """Retrieve one page of places and the cursor of the next one."""
+        return self.place_repo.get_page(limit, cursor)
+
+    def search_places_by_radius(self, latitude, longitude, radius_km,
+                                limit):
+        """Find the places within ``radius_km`` of a coordinate.
+
+        Returns:
+            list: Up to ``limit`` ``(place, distance_km)`` tuples, nearest
+                first.
+        """
+        boxes = spatial.radius_boxes(latitude, longitude, radius_km)
+        matches = []
+        for place in self.place_repo.find_in_boxes(boxes):
+            distance = spatial.haversine_km(latitude, longitude,
+                                            place.latitude, place.longitude)
+            if distance <= radius_km:
+                matches.append((place, distance))
+        matches.sort(key=lambda match: match[1])
+        return matches[:limit]
+
+    def search_places_by_box(self, min_lat, min_lon, max_lat, max_lon,
+                             limit):
+        """Find the places inside a bounding box.
+
+        A box whose ``min_lon`` is greater than its ``max_lon`` crosses
+        the antimeridian.
+        """
+        boxes = spatial.split_box(min_lat, max_lat, min_lon, max_lon)
+        places = self.place_repo.find_in_boxes(boxes)
+        places.sort(key=lambda place: (place.created_at, place.id))
+        return places[:limit]
+
     def update_place(self, place_id, place_data):
         """Update an existing place's information."""
         place = self.get_place(place_id)
@@ -141,6 +178,10 @@ class HBnBFacade:
         """
         return self.amenity_repo.get_all()
 
+    def get_amenities_page(self, limit, cursor=None):
+        """Retrieve one page of amenities and the cursor of the next one."""
+        return self.amenity_repo.get_page(limit, cursor)
+
     def update_amenity(self, amenity_id, amenity_data):
         """
         Args:
@@ -210,6 +251,10 @@ class HBnBFacade:
         """Retrieve all reviews in the repository."""
         return self.review_repo.get_all()
 
+    def get_reviews_page(self, limit, cursor=None):
+        """Retrieve one page of reviews and the cursor of the next one."""
+        return self.review_repo.get_page(limit, cursor)
+
     def update_review(self, review_id, review_data):
         """Update an existing review with new data."""
         review = self.get_review(review_id)
@@ -0,0 +1,64 @@
+"""Cost of InMemoryRepository.get_by_attribute('email', ...) by user count.
+
+Compares a repository with a unique hash index on ``email`` against the
+unindexed linear scan. Users are lightweight stand-ins so that building
+a million of them does not hash a million passwords.
+
+Usage::
+
+    python -m benchmarks.bench_user_lookup [size ...]
+"""
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.persistence.repository import InMemoryRepository
+
+SIZES = [10_000, 100_000, 1_000_000]
+LOOKUPS = 1_000
+# The linear scan is only timed on a sample of lookups
+SCAN_LOOKUPS = 20
+
+
+def make_user(i, start):
+    return SimpleNamespace(id=str(uuid.uuid4()),
+                           email=f'user{i}@example.com',
+                           created_at=start + timedelta(microseconds=i))
+
+
+def per_lookup_us(repo, emails):
+    start = time.perf_counter()
+    for email in emails:
+        repo.get_by_attribute('email', email)
+    return (time.perf_counter() - start) / len(emails) * 1_000_000
+
+
+def run(size):
+    start = datetime.utcnow()
+    users = [make_user(i, start) for i in range(size)]
+    emails = [user.email for user in random.choices(users, k=LOOKUPS)]
+
+    results = {}
+    for label, repo in (('indexed', InMemoryRepository(unique=['email'])),
+                        ('scan', InMemoryRepository())):
+        start = time.perf_counter()
+        for user in users:
+            repo.add(user)
+        build_s = time.perf_counter() - start
+        sample = emails if label == 'indexed' else emails[:SCAN_LOOKUPS]
+        results[label] = (build_s, per_lookup_us(repo, sample))
+    return results
+
+
+def main(argv):
+    print(f"{'users':>10} {'index':>8} {'build s':>8} {'lookup us':>10}")
+    for size in [int(arg) for arg in argv] or SIZES:
+        for label, (build_s, lookup_us) in run(size).items():
+            print(f"{size:>10} {label:>8} {build_s:>8.2f} {lookup_us:>10.2f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,138 @@
+import unittest
+from datetime import datetime, timedelta
+from app.persistence.repository import InMemoryRepository
+
+
+class Item:
+    def __init__(self, obj_id, created_at):
+        self.id = obj_id
+        self.created_at = created_at
+
+
+class TestInMemoryRepositoryPagination(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = InMemoryRepository()
+        start = datetime(2024, 1, 1)
+        # Inserted out of order, with a created_at tie broken by id
+        self.items = [Item('c', start), Item('a', start + timedelta(1)),
+                      Item('b', start), Item('d', start + timedelta(2))]
+        for item in self.items:
+            self.repo.add(item)
+
+    def ids(self, items):
+        return [item.id for item in items]
+
+    def test_pages_follow_created_at_then_id(self):
+        items, cursor = self.repo.get_page(2)
+        self.assertEqual(self.ids(items), ['b', 'c'])
+        items, cursor = self.repo.get_page(2, cursor)
+        self.assertEqual(self.ids(items), ['a', 'd'])
+        self.assertIsNone(cursor)
+
+    def test_delete_removes_item_from_pages(self):
+        self.repo.delete('c')
+        items, cursor = self.repo.get_page(10)
+        self.assertEqual(self.ids(items), ['b', 'a', 'd'])
+        self.assertIsNone(cursor)
+
+    def test_readding_an_object_does_not_duplicate_it(self):
+        self.repo.add(self.items[0])
+        items, _ = self.repo.get_page(10)
+        self.assertEqual(self.ids(items), ['b', 'c', 'a', 'd'])
+
+    def test_cursor_survives_deletion_of_its_item(self):
+        _, cursor = self.repo.get_page(2)
+        self.repo.delete('c')
+        items, _ = self.repo.get_page(2, cursor)
+        self.assertEqual(self.ids(items), ['a', 'd'])
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            self.repo.get_page(2, 'not-a-cursor')
+
+
+class User:
+    def __init__(self, obj_id, email, city):
+        self.id = obj_id
+        self.email = email
+        self.city = city
+        self.created_at = datetime(2024, 1, 1)
+
+    def update(self, data):
+        for key, value in data.items():
+            setattr(self, key, value)
+
+
+class TestInMemoryRepositoryIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = InMemoryRepository(indexes=['city'], unique=['email'])
+        self.alice = User('1', 'alice@example.com', 'Paris')
+        self.bob = User('2', 'bob@example.com', 'Paris')
+        self.repo.add(self.alice)
+        self.repo.add(self.bob)
+
+    def test_get_by_indexed_attribute(self):
+        self.assertIs(
+            self.repo.get_by_attribute('email', 'bob@example.com'), self.bob)
+        self.assertIsNone(
+            self.repo.get_by_attribute('email', 'eve@example.com'))
+
+    def test_find_by_non_unique_attribute(self):
+        self.assertCountEqual(self.repo.find_by_attribute('city', 'Paris'),
+                              [self.alice, self.bob])
+        self.assertEqual(self.repo.find_by_attribute('city', 'Lyon'), [])
+
+    def test_find_by_unindexed_attribute_scans(self):
+        self.assertEqual(self.repo.find_by_attribute('id', '1'),
+                         [self.alice])
+
+    def test_unique_index_rejects_duplicates(self):
+        with self.assertRaises(ValueError):
+            self.repo.add(User('3', 'alice@example.com', 'Lyon'))
+        self.assertIsNone(self.repo.get('3'))
+
+    def test_update_reindexes_mutated_objects(self):
+        # The facade mutates objects before calling update()
+        self.alice.email = 'alice@new.example.com'
+        self.repo.update('1', {'city': 'Lyon'})
+
+        self.assertIsNone(
+            self.repo.get_by_attribute('email', 'alice@example.com'))
+        self.assertIs(self.repo.get_by_attribute(
+            'email', 'alice@new.example.com'), self.alice)
+        self.assertEqual(self.repo.find_by_attribute('city', 'Paris'),
+                         [self.bob])
+        self.assertEqual(self.repo.find_by_attribute('city', 'Lyon'),
+                         [self.alice])
+
+    def test_update_rejects_duplicate_unique_value(self):
+        with self.assertRaises(ValueError):
+            self.repo.update('2', {'email': 'alice@example.com',
+                                   'city': 'Lyon'})
+
+        self.assertEqual((self.bob.email, self.bob.city),
+                         ('bob@example.com', 'Paris'))
+        self.assertIs(
+            self.repo.get_by_attribute('email', 'bob@example.com'), self.bob)
+        self.assertIs(
+            self.repo.get_by_attribute('email', 'alice@example.com'),
+            self.alice)
+        self.assertCountEqual(self.repo.find_by_attribute('city', 'Paris'),
+                              [self.alice, self.bob])
+
+    def test_delete_removes_index_entries(self):
+        self.repo.delete('1')
+        self.assertIsNone(
+            self.repo.get_by_attribute('email', 'alice@example.com'))
+        self.assertEqual(self.repo.find_by_attribute('city', 'Paris'),
+                         [self.bob])
+
+    def test_index_declared_on_populated_repository(self):
+        self.repo.add_index('id', unique=True)
+        self.assertIs(self.repo.get_by_attribute('id', '2'), self.bob)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import random
+import unittest
+from app.persistence.spatial import KDTree, haversine_km, radius_boxes
+from app.services.facade import HBnBFacade
+
+PARIS = (48.8566, 2.3522)
+VERSAILLES = (48.8049, 2.1204)
+LYON = (45.7640, 4.8357)
+
+
+class TestKDTree(unittest.TestCase):
+
+    def test_box_query_matches_brute_force(self):
+        rng = random.Random(42)
+        points = [(rng.uniform(-90, 90), rng.uniform(-180, 180), i)
+                  for i in range(2000)]
+        tree = KDTree(points)
+        for _ in range(50):
+            lat, lon = rng.uniform(-80, 80), rng.uniform(-170, 170)
+            box = (lat - 5, lat + 5, lon - 10, lon + 10)
+            expected = {i for p_lat, p_lon, i in points
+                        if box[0] <= p_lat <= box[1] and
+                        box[2] <= p_lon <= box[3]}
+            self.assertEqual(set(tree.query_box(box)), expected)
+
+    def test_empty_tree(self):
+        self.assertEqual(KDTree([]).query_box((-90, 90, -180, 180)), [])
+
+    def test_radius_boxes_wrap_the_antimeridian(self):
+        boxes = radius_boxes(-17.0, 179.99, 20)
+        self.assertEqual(len(boxes), 2)
+        self.assertEqual(boxes[0][3], 180.0)
+        self.assertEqual(boxes[1][2], -180.0)
+
+    def test_haversine(self):
+        self.assertAlmostEqual(haversine_km(*PARIS, *LYON), 392, delta=2)
+
+
+class TestFacadeSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.facade = HBnBFacade()
+        owner = self.facade.create_user({
+            'first_name': 'Alice', 'last_name': 'Smith',
+            'email': 'alice@example.com', 'password': 'password123'})
+        self.places = {}
+        for name, (lat, lon) in (('Paris', PARIS),
+                                 ('Versailles', VERSAILLES),
+                                 ('Lyon', LYON)):
+            self.places[name] = self.facade.create_place({
+                'title': name, 'description': '', 'price': 100,
+                'latitude': lat, 'longitude': lon, 'owner_id': owner.id})
+
+    def test_radius_search_returns_nearest_first(self):
+        matches = self.facade.search_places_by_radius(*PARIS, 25, 10)
+        self.assertEqual([place.title for place, _ in matches],
+                         ['Paris', 'Versailles'])
+
+    def test_search_follows_updates_and_deletes(self):
+        self.facade.update_place(self.places['Lyon'].id,
+                                 {'latitude': 48.86, 'longitude': 2.35})
+        self.facade.place_repo.delete(self.places['Versailles'].id)
+        matches = self.facade.search_places_by_radius(*PARIS, 25, 10)
+        self.assertEqual(sorted(place.title for place, _ in matches),
+                         ['Lyon', 'Paris'])
+
+    def test_box_search(self):
+        places = self.facade.search_places_by_box(45, 2.2, 49, 5, 10)
+        self.assertEqual(sorted(place.title for place in places),
+                         ['Lyon', 'Paris'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,10 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import hbnb_facade as facade
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.api.v1.pagination import pagination_parser, page_args, page_headers
+from app.api.v1.conditional import (
+    collection_validators, is_not_modified, not_modified,
+    resource_validators, validator_headers)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -49,7 +53,7 @@ class AmenityList(Resource):
 
         try:
             amenity = facade.create_amenity(amenity_data)
-            return amenity.to_dict(), 201
+            return amenity.to_dict(raw_datetimes=True), 201
         except ValueError as e:
             logger.error(f"ValueError: {str(e)}")
             return {'error': str(e)}, 400
@@ -57,12 +61,22 @@ class AmenityList(Resource):
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500
 
+    @api.expect(pagination_parser)
     @api.response(200, 'List of amenities retrieved successfully')
+    @api.response(400, 'Invalid cursor')
     def get(self):
-        """Retrieve a list of all amenities"""
+        """Retrieve a page of amenities"""
+        validators = collection_validators('amenity')
+        if is_not_modified(validators):
+            return not_modified(validators)
         try:
-            amenities = facade.get_all_amenities()
-            return [amenity.to_dict() for amenity in amenities], 200
+            amenities, next_cursor = facade.get_amenities_page(*page_args())
+            return [amenity.to_dict(raw_datetimes=True)
+                    for amenity in amenities], 200, \
+                {**page_headers(next_cursor), **validator_headers(validators)}
+        except ValueError as e:
+            logger.error(f"ValueError: {str(e)}")
+            return {'error': str(e)}, 400
         except Exception as e:
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500
@@ -77,8 +91,12 @@ class AmenityResource(Resource):
         try:
             amenity = facade.get_amenity(amenity_id)  # Fetch amenity by ID
             if amenity:
+                validators = resource_validators(amenity)
+                if is_not_modified(validators):
+                    return not_modified(validators)
                 # Return the amenity details
-                return {'amenity': amenity.to_dict()}, 200
+                return {'amenity': amenity.to_dict(raw_datetimes=True)}, 200, \
+                    validator_headers(validators)
             else:
                 # Return not found message
                 return {'message': 'Amenity not found'}, 404
@@ -100,7 +118,7 @@ class AmenityResource(Resource):
         try:
             updated_amenity = facade.update_amenity(amenity_id, amenity_data)
             if updated_amenity:
-                return updated_amenity.to_dict(), 200
+                return updated_amenity.to_dict(raw_datetimes=True), 200
             else:
                 return {'error': 'Amenity not found'}, 404
         except ValueError as e:
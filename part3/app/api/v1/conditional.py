@@ -0,0 +1,55 @@
+from datetime import timezone
+from hashlib import sha1
+from flask import Response, request
+from werkzeug.http import http_date, quote_etag
+from app.persistence.versions import get_versions
+
+
+def resource_validators(obj):
+    """Return the ``(etag, last_modified)`` pair of a single object,
+    derived from its id and ``updated_at``."""
+    updated_at = obj.updated_at
+    return f"{obj.id}-{updated_at:%Y%m%d%H%M%S%f}", updated_at
+
+
+def collection_validators(*table_names, versions=None):
+    """Return the ``(etag, last_modified)`` pair of a collection built
+    from ``table_names``, for the current query string.
+
+    ``versions`` are the counters of the tables when the caller already
+    read them, see ``app.persistence.versions.get_versions``.
+    """
+    if versions is None:
+        versions = get_versions(table_names)
+    key = ','.join(f"{name}:{versions[name][0]}" for name in table_names)
+    key += '?' + request.query_string.decode()
+    changes = [updated_at for _, updated_at in versions.values()
+               if updated_at is not None]
+    return sha1(key.encode()).hexdigest(), max(changes, default=None)
+
+
+def is_not_modified(validators):
+    """Check ``If-None-Match``, or failing that ``If-Modified-Since``."""
+    etag, last_modified = validators
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified:
+        last_modified = last_modified.replace(
+            microsecond=0, tzinfo=timezone.utc)
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def validator_headers(validators):
+    """Headers letting clients revalidate the response."""
+    etag, last_modified = validators
+    headers = {'ETag': quote_etag(etag), 'Cache-Control': 'no-cache'}
+    if last_modified:
+        headers['Last-Modified'] = http_date(
+            last_modified.replace(tzinfo=timezone.utc))
+    return headers
+
+
+def not_modified(validators):
+    """Build the 304 response sent when the client copy is current."""
+    return Response(status=304, headers=validator_headers(validators))
@@ -0,0 +1,77 @@
+"""
+JSON encoding of the API responses.
+
+``JSON_ENCODER`` picks the encoder of every JSON document the API
+sends: the flask-restx responses, the native views of the ASGI app and
+the lines of the place export.
+
+* ``json``   -- the standard library (default)
+* ``orjson`` -- orjson, several times faster on large listings; an
+  optional dependency, ``pip install orjson``
+* any callable ``dumps(data, pretty=False) -> bytes``
+
+Every encoder writes datetimes as ``isoformat()`` does, so views hand
+them ``to_dict(raw_datetimes=True)`` and leave the formatting to the
+encoder, which orjson does natively.
+"""
+import json
+from datetime import date
+from flask import current_app
+
+
+def encode_default(obj):
+    """Encode what the json module does not know: datetimes."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} "
+                    "is not JSON serializable")
+
+
+def json_dumps(data, pretty=False):
+    return json.dumps(data, default=encode_default,
+                      indent=4 if pretty else None).encode('utf-8')
+
+
+def orjson_dumps(data, pretty=False):
+    import orjson  # optional dependency, only needed for JSON_ENCODER
+    return orjson.dumps(data, default=encode_default,
+                        option=orjson.OPT_INDENT_2 if pretty else 0)
+
+
+ENCODERS = {
+    'json': json_dumps,
+    'orjson': orjson_dumps,
+}
+
+
+def get_encoder(config):
+    """Return the ``dumps`` function selected by ``JSON_ENCODER``."""
+    encoder = config.get('JSON_ENCODER') or 'json'
+    if callable(encoder):
+        return encoder
+    if encoder not in ENCODERS:
+        raise ValueError(f"Unknown JSON_ENCODER '{encoder}', "
+                         f"expected one of {', '.join(ENCODERS)}")
+    dumps = ENCODERS[encoder]
+    dumps({})  # fail at startup when an optional dependency is missing
+    return dumps
+
+
+def dumps(data):
+    """Encode ``data`` with the encoder of the current app."""
+    return current_app.extensions['hbnb_json'](data)
+
+
+def output_json(data, code, headers=None):
+    """flask-restx representation of ``application/json``."""
+    body = current_app.extensions['hbnb_json'](data, current_app.debug)
+    response = current_app.response_class(
+        body + b'\n', status=code, mimetype='application/json')
+    response.headers.extend(headers or {})
+    return response
+
+
+def install_encoder(app, api):
+    """Encode the responses of ``api`` with ``JSON_ENCODER``."""
+    app.extensions['hbnb_json'] = get_encoder(app.config)
+    api.representations['application/json'] = output_json
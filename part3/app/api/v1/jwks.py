@@ -0,0 +1,34 @@
+"""
+JSON Web Key Set of the token signing keys.
+
+Served at ``/.well-known/jwks.json`` when tokens are signed with an
+asymmetric algorithm (see app.services.signing), so that other services
+verify them locally, caching the set for ``JWKS_MAX_AGE`` seconds and
+revalidating it with its ETag.
+"""
+import json
+from hashlib import sha256
+from flask import Response, current_app
+from app.api.v1.conditional import (
+    is_not_modified, not_modified, validator_headers)
+
+
+def jwks_view():
+    body, etag = current_app.extensions['hbnb_jwks']
+    validators = (etag, None)
+    if is_not_modified(validators):
+        response = not_modified(validators)
+    else:
+        response = Response(body, mimetype='application/json',
+                            headers=validator_headers(validators))
+    max_age = current_app.config.get('JWKS_MAX_AGE', 300)
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response
+
+
+def install_jwks(app):
+    """Serve the public keys of ``signing_keys`` from memory."""
+    from app.services.signing import signing_keys
+    body = json.dumps(signing_keys.jwks, separators=(',', ':')).encode()
+    app.extensions['hbnb_jwks'] = (body, sha256(body).hexdigest())
+    app.add_url_rule('/.well-known/jwks.json', 'jwks', jwks_view)
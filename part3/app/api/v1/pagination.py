@@ -0,0 +1,26 @@
+from flask import current_app
+from flask_restx import reqparse
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Query parameters shared by every collection endpoint
+pagination_parser = reqparse.RequestParser()
+pagination_parser.add_argument('limit', type=int, location='args',
+                               help='Maximum number of items to return')
+pagination_parser.add_argument('cursor', type=str, location='args',
+                               help='X-Next-Cursor value of the previous page')
+
+
+def page_args():
+    """Read and clamp the ``limit`` and ``cursor`` query parameters."""
+    args = pagination_parser.parse_args()
+    limit = args['limit'] or current_app.config.get(
+        'PAGE_SIZE', DEFAULT_PAGE_SIZE)
+    max_limit = current_app.config.get('MAX_PAGE_SIZE', MAX_PAGE_SIZE)
+    return max(1, min(limit, max_limit)), args['cursor']
+
+
+def page_headers(next_cursor):
+    """Expose the cursor of the next page, if there is one."""
+    return {'X-Next-Cursor': next_cursor} if next_cursor else {}
@@ -0,0 +1,64 @@
+"""
+Swagger spec served from memory.
+
+flask-restx builds the spec once per ``Api`` but serializes it again on
+every ``/swagger.json`` request and sends no validator, while the API
+gateway polls it. ``install_spec`` replaces that view: the JSON is
+serialized once per process and served with a strong ETag, the digest
+of its bytes, so an unchanged spec costs the gateway a 304.
+
+With ``SWAGGER_SPEC_FILE`` set, the spec is never generated at runtime.
+The file, written at build time by::
+
+    flask --app run export-spec swagger.json
+
+is served as is and also stands in for the spec flask-restx would build
+to validate request payloads. It must be exported again whenever the
+API models change.
+"""
+import json
+from hashlib import sha256
+from flask import Response, current_app
+from app.api.v1.conditional import (
+    is_not_modified, not_modified, validator_headers)
+
+
+def render_spec(api):
+    """Serialize the spec of ``api``; needs a request context."""
+    schema = api.__schema__
+    if 'error' in schema:
+        raise RuntimeError("flask-restx could not build the Swagger spec")
+    return json.dumps(schema, separators=(',', ':')).encode('utf-8')
+
+
+def cached_spec(app):
+    """Return the ``(body, etag)`` of the spec of ``app``, serializing it
+    on the first call."""
+    spec = app.extensions.get('hbnb_spec')
+    if spec is None:
+        body = render_spec(app.extensions['hbnb_api'])
+        spec = app.extensions['hbnb_spec'] = (
+            body, sha256(body).hexdigest())
+    return spec
+
+
+def spec_view():
+    body, etag = cached_spec(current_app)
+    validators = (etag, None)
+    if is_not_modified(validators):
+        return not_modified(validators)
+    return Response(body, mimetype='application/json',
+                    headers=validator_headers(validators))
+
+
+def install_spec(app, api):
+    """Serve the spec of ``api`` from memory, loading it from
+    ``SWAGGER_SPEC_FILE`` when set."""
+    path = app.config.get('SWAGGER_SPEC_FILE')
+    if path:
+        with open(path, 'rb') as spec_file:
+            body = spec_file.read()
+        # cached_property: flask-restx will not build its own
+        vars(api)['__schema__'] = json.loads(body)
+        app.extensions['hbnb_spec'] = (body, sha256(body).hexdigest())
+    app.view_functions[api.endpoint('specs')] = spec_view
@@ -0,0 +1,29 @@
+"""
+Maintenance commands, run with ``flask --app run <command>``.
+"""
+import click
+
+
+def register_commands(app):
+    """Attach the maintenance commands to ``app.cli``."""
+
+    @app.cli.command('rebuild-ratings')
+    def rebuild_ratings():
+        """Recompute the rating aggregates of every place."""
+        from app.services.facade import hbnb_facade
+        updated = hbnb_facade.rebuild_rating_aggregates()
+        click.echo(f"Rebuilt rating aggregates of {updated} places")
+
+    @app.cli.command('export-spec')
+    @click.argument('path', type=click.Path(dir_okay=False, writable=True))
+    def export_spec(path):
+        """Write the Swagger spec, to be served with SWAGGER_SPEC_FILE."""
+        from flask import current_app
+        from app.api.v1.spec import render_spec
+        from app.startup import load_api
+        api = load_api(current_app)
+        with current_app.test_request_context():
+            body = render_spec(api)
+        with open(path, 'wb') as spec_file:
+            spec_file.write(body)
+        click.echo(f"Wrote the Swagger spec to {path}")
@@ -1,6 +1,8 @@
 import uuid
 from datetime import datetime
+from sqlalchemy.orm import declared_attr
 from app import db
+from app.persistence.unit_of_work import commit
 
 
 class BaseModel:
@@ -16,9 +18,13 @@ class BaseModel:
         updated_at (datetime): Timestamp for when the model instance was last updated.
 
     Methods:
-        save(): Updates the updated_at timestamp to the current time.
+        save(): Updates the updated_at timestamp and commits the object.
         to_dict(): Converts the model instance to a dictionary representation.
         update(data): Updates model attributes based on the provided dictionary.
+
+    Constructors and setters only validate and assign: SQLAlchemy records
+    the changed fields and the repository writes them, with a fresh
+    updated_at, in the one commit of the facade operation.
     """
     id = db.Column(db.String(36), primary_key=True,
                    default=lambda: str(uuid.uuid4()))
@@ -26,6 +32,12 @@ class BaseModel:
     updated_at = db.Column(
         db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    @declared_attr
+    def __table_args__(cls):
+        """Index the (created_at, id) key used for keyset pagination."""
+        return (db.Index(f'ix_{cls.__tablename__}_created_at_id',
+                         'created_at', 'id'),)
+
     def __init__(self, *args, **kwargs):
         if kwargs:
             for key, value in kwargs.items():
@@ -43,17 +55,20 @@ class BaseModel:
             self.updated_at = datetime.utcnow()
 
     def save(self):
-        """Update the updated_at timestamp whenever the object is modified"""
+        """Update the updated_at timestamp and commit the object, for code
+        working outside the facade"""
         self.updated_at = datetime.utcnow()
         db.session.add(self)
-        db.session.commit()
+        commit()
 
-    def to_dict(self):
-        """Convert the object to a dictionary"""
+    def to_dict(self, raw_datetimes=False):
+        """Convert the object to a dictionary, with the timestamps as
+        ISO 8601 strings unless ``raw_datetimes``"""
         result = self.__dict__.copy()
         result['__class__'] = self.__class__.__name__
-        result['created_at'] = self.created_at.isoformat()
-        result['updated_at'] = self.updated_at.isoformat()
+        if not raw_datetimes:
+            result['created_at'] = self.created_at.isoformat()
+            result['updated_at'] = self.updated_at.isoformat()
         return result
 
     def update(self, data):
@@ -61,4 +76,14 @@ class BaseModel:
         for key, value in data.items():
             if key not in ['id', 'created_at', 'updated_at', '__class__']:
                 setattr(self, key, value)
-        self.save()
+
+
+@db.event.listens_for(db.session, 'before_flush')
+def touch_relationship_changes(session, flush_context, instances):
+    """Bump ``updated_at`` of objects whose only change is to a
+    relationship, which ``onupdate`` does not see, so that ETags derived
+    from it follow every change of ``to_dict()``."""
+    for obj in session.dirty:
+        if isinstance(obj, BaseModel) and \
+                not session.is_modified(obj, include_collections=False):
+            obj.updated_at = datetime.utcnow()
@@ -30,32 +30,39 @@ class Amenity(BaseModel, db.Model):
         self.set_name(name)
         self.description = description  # Optional attribute
 
-    def set_name(self, name: str):
+    @staticmethod
+    def validate_name(name):
         """
-        Sets or updates the name of the amenity with validation.
+        Validates an amenity name and returns it.
         """
-        # Validate the new name before setting
         if not isinstance(name, str):
             raise ValueError("Name must be a string.")
         if not name:
             raise ValueError("Name must not be empty.")
         if len(name) > 50:
             raise ValueError("Name must not exceed 50 characters.")
+        return name
 
-        # Update the name and save the object to update the timestamp
-        self.name = name
-        self.save()
+    def set_name(self, name: str):
+        """
+        Sets or updates the name of the amenity with validation.
+        """
+        # The repository writes the change; updated_at is set on flush
+        self.name = self.validate_name(name)
 
-    def to_dict(self):
+    def to_dict(self, raw_datetimes=False):
         """Convert the Amenity instance to a dictionary."""
         amenity_dict = {
             'id': self.id,
             'name': self.name,
             'description': self.description,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
             '__class__': self.__class__.__name__
         }
+        if not raw_datetimes:
+            amenity_dict['created_at'] = self.created_at.isoformat()
+            amenity_dict['updated_at'] = self.updated_at.isoformat()
         return amenity_dict
 
     def __repr__(self):
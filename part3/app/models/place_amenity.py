@@ -4,5 +4,8 @@ place_amenity = db.Table('place_amenity',
                          db.Column('place_id', db.String(36), db.ForeignKey(
                              'place.id'), primary_key=True),
                          db.Column('amenity_id', db.String(36), db.ForeignKey(
-                             'amenity.id'), primary_key=True)
+                             'amenity.id'), primary_key=True),
+                         # The primary key covers lookups by place_id
+                         db.Index('ix_place_amenity_amenity_id',
+                                  'amenity_id')
                          )
@@ -0,0 +1,23 @@
+from datetime import datetime
+from app import db
+
+
+class TableVersion(db.Model):
+    """
+    Change counter of a table, bumped by every write to it.
+
+    Collection endpoints derive their ETag and Last-Modified headers
+    from these rows, see app.persistence.versions.
+
+    Attributes:
+    - name (str): The name of the table.
+    - version (int): Incremented on each flush or bulk statement
+        writing to the table.
+    - updated_at (datetime): Time of the last bump.
+    """
+    __tablename__ = 'table_version'
+
+    name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False,
+                           default=datetime.utcnow)
@@ -0,0 +1,125 @@
+"""
+Async read access to the database, for the ASGI entry point.
+
+``async_db`` owns an asyncio engine on the same database as ``db``
+(through aiosqlite, asyncpg or aiomysql) and a session scoped to the
+current asyncio task. The repositories below are the async
+counterparts of the read methods of ``SQLAlchemyRepository`` and
+``PlaceRepository`` and build the very same queries.
+
+Writes keep going through the sync repositories: the cache, the table
+versions and the read-replica stickiness all hook into ``db.session``.
+
+Requires ``sqlalchemy[asyncio]`` and the async driver of the database.
+"""
+import asyncio
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    async_scoped_session, async_sessionmaker, create_async_engine)
+from app.models.place import Place
+from app.persistence.engine import engine_options, install_pragmas, is_sqlite
+from app.persistence.place_repository import search_query, split_search_page
+from app.persistence.repository import page_query, split_page
+from app.persistence.versions import versions_by_name, versions_query
+
+# Async driver used for each backend when ASYNC_DATABASE_URL is not set
+ASYNC_DRIVERS = {
+    'sqlite': 'aiosqlite',
+    'postgresql': 'asyncpg',
+    'mysql': 'aiomysql',
+}
+
+
+def async_database_uri(config):
+    """Return ``ASYNC_DATABASE_URL``, or the database URI of the app
+    with its driver swapped for the async one."""
+    if config.get('ASYNC_DATABASE_URL'):
+        return config['ASYNC_DATABASE_URL']
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver known for '{backend}', "
+                         "set ASYNC_DATABASE_URL")
+    url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+    return url.render_as_string(hide_password=False)
+
+
+class AsyncDatabase:
+    """Async engine and task-scoped session of the ASGI app."""
+
+    def __init__(self):
+        self.engine = None
+        self.session = None
+
+    def init_app(self, app):
+        """Create the engine; must run after ``configure_engine(app)``."""
+        uri = async_database_uri(app.config)
+        self.engine = create_async_engine(
+            uri, **engine_options(app.config, uri))
+        if is_sqlite(uri):
+            install_pragmas(self.engine.sync_engine, app.config)
+        self.session = async_scoped_session(
+            async_sessionmaker(self.engine, expire_on_commit=False),
+            scopefunc=asyncio.current_task)
+
+    async def remove(self):
+        """Close the session of the current task."""
+        await self.session.remove()
+
+    async def dispose(self):
+        await self.engine.dispose()
+
+
+async_db = AsyncDatabase()
+
+
+async def get_versions(table_names):
+    """Async ``app.persistence.versions.get_versions``."""
+    rows = await async_db.session.execute(versions_query(table_names))
+    return versions_by_name(rows, table_names)
+
+
+class AsyncSQLAlchemyRepository:
+    """Async read methods of ``SQLAlchemyRepository``.
+
+    Relationships cannot load lazily on an async session, so callers
+    serializing them pass the matching loading profile as ``options``.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.db = async_db
+
+    async def get(self, obj_id, options=()):
+        if obj_id is None:
+            return None
+        return await self.db.session.get(self.model, obj_id, options=options)
+
+    async def get_page(self, limit, cursor=None, options=()):
+        query = page_query(select(self.model).options(*options), self.model,
+                           limit, cursor)
+        items = (await self.db.session.scalars(query)).all()
+        return split_page(items, limit)
+
+    async def get_all_by_attribute(self, attr_name, attr_value, options=()):
+        query = select(self.model).options(*options).filter(
+            getattr(self.model, attr_name) == attr_value)
+        return (await self.db.session.scalars(query)).all()
+
+
+class AsyncPlaceRepository(AsyncSQLAlchemyRepository):
+    def __init__(self):
+        super().__init__(Place)
+
+    async def search_page(self, limit, cursor=None, min_price=None,
+                          max_price=None, min_rating=None, amenity_ids=(),
+                          sort=None, options=()):
+        """Async ``PlaceRepository.search_page``."""
+        query = search_query(
+            select(Place).options(*options), limit, cursor,
+            min_price=min_price, max_price=max_price, min_rating=min_rating,
+            amenity_ids=amenity_ids, sort=sort)
+        result = await self.db.session.execute(query)
+        rows = result.all() if sort else result.scalars().all()
+        return split_search_page(rows, limit, sort)
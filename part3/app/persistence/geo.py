@@ -0,0 +1,120 @@
+"""
+Helpers for the spatial index on places.
+
+The globe is cut into a grid of GRID_CELL_DEGREES wide cells numbered
+row by row, and every place stores the number of the cell it falls in
+(``place.grid_cell``, indexed). A rectangle of latitudes/longitudes then
+maps to one contiguous range of cell numbers per grid row, which the
+database answers with index range scans. Callers apply the exact
+distance check on the few candidates those ranges return.
+"""
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+GRID_CELL_DEGREES = 0.1
+GRID_ROWS = int(180 / GRID_CELL_DEGREES) + 1
+GRID_COLUMNS = int(360 / GRID_CELL_DEGREES) + 1
+
+
+def _grid_row(latitude):
+    return min(int((latitude + 90) / GRID_CELL_DEGREES), GRID_ROWS - 1)
+
+
+def _grid_column(longitude):
+    return min(int((longitude + 180) / GRID_CELL_DEGREES), GRID_COLUMNS - 1)
+
+
+def grid_cell(latitude, longitude):
+    """Return the number of the grid cell containing a coordinate."""
+    return _grid_row(latitude) * GRID_COLUMNS + _grid_column(longitude)
+
+
+def grid_ranges(box):
+    """Return the ``(first, last)`` cell ranges covering a box.
+
+    ``box`` is ``(min_lat, max_lat, min_lon, max_lon)`` and must not
+    cross the antimeridian, see ``split_box``.
+    """
+    min_lat, max_lat, min_lon, max_lon = box
+    first_column, last_column = _grid_column(min_lon), _grid_column(max_lon)
+    return [(row * GRID_COLUMNS + first_column,
+             row * GRID_COLUMNS + last_column)
+            for row in range(_grid_row(min_lat), _grid_row(max_lat) + 1)]
+
+
+def split_box(min_lat, max_lat, min_lon, max_lon):
+    """Split a box crossing the antimeridian (min_lon > max_lon) in two."""
+    if min_lon <= max_lon:
+        return [(min_lat, max_lat, min_lon, max_lon)]
+    return [(min_lat, max_lat, min_lon, 180.0),
+            (min_lat, max_lat, -180.0, max_lon)]
+
+
+def radius_boxes(latitude, longitude, radius_km):
+    """Return the boxes bounding a circle, split at the antimeridian."""
+    delta_lat = radius_km / KM_PER_DEGREE
+    min_lat = max(latitude - delta_lat, -90.0)
+    max_lat = min(latitude + delta_lat, 90.0)
+    # Near a pole the circle covers every longitude
+    widest = max(abs(min_lat), abs(max_lat))
+    if widest >= 90.0:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+    delta_lon = delta_lat / math.cos(math.radians(widest))
+    if delta_lon >= 180.0:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+    min_lon = (longitude - delta_lon + 180.0) % 360.0 - 180.0
+    max_lon = (longitude + delta_lon + 180.0) % 360.0 - 180.0
+    return split_box(min_lat, max_lat, min_lon, max_lon)
+
+
+def in_box(latitude, longitude, box):
+    min_lat, max_lat, min_lon, max_lon = box
+    return min_lat <= latitude <= max_lat and min_lon <= longitude <= max_lon
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance between two coordinates, in kilometres."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class NearestOrder:
+    """Ranking of coordinates by distance to a centre that SQL can
+    evaluate with arithmetic only.
+
+    The key of a coordinate is ``dlat ** 2 + (cosine * dlon) ** 2`` in
+    degrees, ``cosine`` being the smallest cosine of a latitude in the
+    boxes searched. It does not always rank like the great-circle
+    distance, but it bounds it from below: ``lower_bound_km`` of the
+    key of the last place read tells how near the places not read yet
+    can be.
+    """
+
+    def __init__(self, latitude, longitude, boxes):
+        self.latitude = latitude
+        self.longitude = longitude
+        widest = max(max(abs(box[0]), abs(box[1])) for box in boxes)
+        self.cosine = math.cos(math.radians(widest))
+        lat_span = max(box[1] for box in boxes) - min(box[0] for box in boxes)
+        lon_span = sum(box[3] - box[2] for box in boxes)
+        # Half-angles inside the boxes stay below ``half``, where
+        # sin(x) >= x * sin(half) / half
+        half = math.radians(min(180.0, max(lat_span, lon_span))) / 2
+        self.scale = math.sin(half) / half if half else 1.0
+
+    def key(self, latitude, longitude):
+        """Return the key of a coordinate, as ranked in SQL."""
+        delta_lon = abs(longitude - self.longitude)
+        if delta_lon > 180:
+            delta_lon = 360 - delta_lon
+        delta_lat = latitude - self.latitude
+        return delta_lat * delta_lat + (self.cosine * delta_lon) ** 2
+
+    def lower_bound_km(self, key):
+        """Return the shortest distance a coordinate of ``key`` can be
+        from the centre, in kilometres."""
+        half_angle = self.scale * math.radians(math.sqrt(key)) / 2
+        return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, half_angle))
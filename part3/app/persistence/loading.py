@@ -0,0 +1,35 @@
+"""
+Named eager-loading profiles.
+
+Each profile lists the loader options a query needs so that serializing
+its results with ``to_dict()`` does not trigger one lazy load per row.
+Serializers read foreign key columns directly, so only collections
+have to be loaded up front, and only their ids. Profiles are built on
+demand because loader options need every mapper to be configured.
+"""
+from sqlalchemy.orm import selectinload
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.models.place import Place
+
+LOAD_PROFILES = {
+    'user_list': lambda: (
+        selectinload(User.owned_places).load_only(Place.id),
+        selectinload(User.rented_places).load_only(Place.id),
+    ),
+    'place_list': lambda: (
+        selectinload(Place.amenities).load_only(Amenity.id),
+    ),
+    # Reviews serialize user_id/place_id columns: nothing to preload
+    'review_list': lambda: (),
+    'amenity_list': lambda: (),
+}
+
+
+def load_profile(name):
+    """Return the loader options registered under ``name``."""
+    try:
+        profile = LOAD_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown loading profile '{name}'")
+    return profile()
@@ -0,0 +1,195 @@
+from sqlalchemy import and_, case, func, or_, select, update
+from app.models.place import Place
+from app.persistence.geo import grid_ranges
+from app.models.place_amenity import place_amenity
+from app.persistence.replicas import replica_read
+from app.persistence.repository import (
+    SQLAlchemyRepository, decode_cursor, encode_cursor, split_page)
+
+# Above this many grid rows a box query falls back to a coordinate scan
+MAX_GRID_ROWS = 200
+
+# Sort orders of place listings: name -> (sort column, descending)
+PLACE_SORTS = {
+    'price': ('price', False),
+    '-price': ('price', True),
+    'rating': ('avg_rating', True),
+}
+
+
+def search_query(query, limit, cursor=None, min_price=None, max_price=None,
+                 min_rating=None, amenity_ids=(), sort=None):
+    """Apply the filters, order and keyset of a place search page to
+    ``query``, a legacy ``Query`` or a ``select()`` of places.
+
+    When ``sort`` orders on a value, the rows are ``(place, value)``.
+    """
+    if min_price is not None:
+        query = query.filter(Place.price >= min_price)
+    if max_price is not None:
+        query = query.filter(Place.price <= max_price)
+    if amenity_ids:
+        amenity_ids = set(amenity_ids)
+        matching = (
+            select(place_amenity.c.place_id)
+            .where(place_amenity.c.amenity_id.in_(amenity_ids))
+            .group_by(place_amenity.c.place_id)
+            .having(func.count() == len(amenity_ids)))
+        query = query.filter(Place.id.in_(matching))
+
+    if min_rating is not None:
+        query = query.filter(Place.avg_rating >= min_rating)
+
+    sort_column, descending = PLACE_SORTS[sort] if sort else (None, False)
+    sort_key = getattr(Place, sort_column) if sort_column else None
+    if cursor:
+        if sort_key is None:
+            created_at, obj_id = decode_cursor(cursor)
+        else:
+            value, created_at, obj_id = decode_cursor(cursor, True)
+        after_key = or_(Place.created_at > created_at,
+                        and_(Place.created_at == created_at,
+                             Place.id > obj_id))
+        if sort_key is not None:
+            beyond = sort_key < value if descending else sort_key > value
+            after_key = or_(beyond, and_(sort_key == value, after_key))
+        query = query.filter(after_key)
+
+    order = [Place.created_at, Place.id]
+    if sort_key is None:
+        return query.order_by(*order).limit(limit + 1)
+    order.insert(0, sort_key.desc() if descending else sort_key)
+    return query.add_columns(sort_key).order_by(*order).limit(limit + 1)
+
+
+def split_search_page(rows, limit, sort=None):
+    """Return the ``(places, next_cursor)`` tuple of a ``search_query``."""
+    if not sort:
+        return split_page(rows, limit)
+    places = [place for place, _ in rows]
+    if len(rows) > limit:
+        last, value = rows[limit - 1]
+        return places[:limit], encode_cursor(last, value)
+    return places, None
+
+
+def nearest_order_key(order):
+    """SQL expression of ``order.key``, see ``geo.NearestOrder``."""
+    delta_lon = func.abs(Place.longitude - order.longitude)
+    delta_lon = case((delta_lon > 180, 360 - delta_lon), else_=delta_lon)
+    delta_lon = delta_lon * order.cosine
+    delta_lat = Place.latitude - order.latitude
+    return delta_lat * delta_lat + delta_lon * delta_lon
+
+
+class PlaceRepository(SQLAlchemyRepository):
+    """Place repository with the place/amenity association helpers
+    needed by bulk import and export."""
+
+    def __init__(self):
+        super().__init__(Place)
+
+    @replica_read
+    def find_in_boxes(self, boxes, options=(), limit=None, near=None,
+                      offset=0):
+        """Return the places located inside any of the given boxes.
+
+        Each ``(min_lat, max_lat, min_lon, max_lon)`` box is answered
+        with range scans on the indexed ``grid_cell`` column, one per
+        grid row, then trimmed to the exact box on the coordinates.
+        Boxes spanning more than MAX_GRID_ROWS rows are too large for
+        the index to help and only filter on the coordinates. With a
+        ``limit`` the places are ordered by ``(created_at, id)``, or by
+        the keys of ``near``, a ``geo.NearestOrder``; ``offset`` skips
+        as many places in that order.
+        """
+        conditions = []
+        for box in boxes:
+            min_lat, max_lat, min_lon, max_lon = box
+            condition = and_(Place.latitude.between(min_lat, max_lat),
+                             Place.longitude.between(min_lon, max_lon))
+            ranges = grid_ranges(box)
+            if len(ranges) <= MAX_GRID_ROWS:
+                cells = or_(*(Place.grid_cell.between(first, last)
+                              for first, last in ranges))
+                condition = and_(cells, condition)
+            conditions.append(condition)
+        query = self.model.query.options(*options).filter(or_(*conditions))
+        if near is not None:
+            query = query.order_by(nearest_order_key(near), Place.id)
+        else:
+            query = query.order_by(Place.created_at, Place.id)
+        if limit is not None:
+            query = query.limit(limit).offset(offset)
+        return query.all()
+
+    @replica_read
+    def preload(self, places, options):
+        """Apply loader options to places already loaded, with one
+        query for their rows plus the ones the options issue."""
+        if places:
+            self.model.query.options(*options).filter(
+                Place.id.in_([place.id for place in places])).all()
+
+    @replica_read
+    def search_page(self, limit, cursor=None, min_price=None,
+                    max_price=None, min_rating=None, amenity_ids=(),
+                    sort=None, options=()):
+        """Return one page of the places matching the given filters.
+
+        Every filter is applied in SQL: prices and ratings through the
+        ``(price|avg_rating, created_at, id)`` indexes and amenities
+        through a grouped lookup on ``place_amenity`` (a place must have
+        all of them). Unrated places have an average rating of 0. Pages
+        are keyset paginated on the ``sort`` value (see PLACE_SORTS)
+        followed by ``(created_at, id)``.
+
+        Returns a ``(places, next_cursor)`` tuple like ``get_page``.
+        """
+        query = search_query(
+            self.model.query.options(*options), limit, cursor,
+            min_price=min_price, max_price=max_price, min_rating=min_rating,
+            amenity_ids=amenity_ids, sort=sort)
+        return split_search_page(query.all(), limit, sort)
+
+    def rebuild_rating_aggregates(self):
+        """Recompute ``avg_rating`` and ``review_count`` of every place
+        from the review table in a single UPDATE.
+
+        Returns the number of places updated.
+        """
+        result = self.db.session.execute(
+            update(Place).values(**Place.rating_aggregates())
+            .execution_options(synchronize_session=False))
+        self._commit("rebuilding rating aggregates")
+        return result.rowcount
+
+    def add_amenity_links(self, rows):
+        """Insert ``{'place_id', 'amenity_id'}`` rows in one statement."""
+        if rows:
+            self.db.session.execute(place_amenity.insert(), rows)
+            self._commit("linking amenities")
+        return len(rows)
+
+    def get_amenity_ids(self, place_ids):
+        """Return ``{place_id: [amenity_id, ...]}`` with one IN query."""
+        amenity_ids = {place_id: [] for place_id in place_ids}
+        if place_ids:
+            links = self.db.session.execute(
+                select(place_amenity.c.place_id, place_amenity.c.amenity_id)
+                .where(place_amenity.c.place_id.in_(place_ids)))
+            for place_id, amenity_id in links:
+                amenity_ids[place_id].append(amenity_id)
+        return amenity_ids
+
+    def iter_rows(self, chunk_size):
+        """Yield lists of place rows read through a streaming cursor.
+
+        Rows are plain mappings of the ``place`` columns, so the table
+        is never materialized as ORM objects.
+        """
+        result = self.db.session.execute(
+            select(Place.__table__).order_by(Place.created_at, Place.id),
+            execution_options={'yield_per': chunk_size})
+        for partition in result.mappings().partitions():
+            yield partition
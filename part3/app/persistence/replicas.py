@@ -0,0 +1,117 @@
+"""
+Read-replica routing.
+
+Replicas are the ``replica_<n>`` binds built from
+``DATABASE_REPLICA_URLS``. Repository read methods run inside
+``read_replica()``, which picks one replica for the whole call, so its
+eager loads see the same snapshot. Everything else, including lazy
+loads and every write, stays on the primary.
+
+Reads are pinned to the primary:
+
+* inside a unit of work, and for the rest of a session once it wrote;
+* for ``REPLICA_STICKY_SECONDS`` after a write by the same principal
+  (the JWT identity, see app.services.principal, or the client
+  address), so users read their own writes while the replicas catch
+  up. The window is tracked per process, for the MAX_TRACKED_WRITERS
+  principals that wrote last;
+* for the rest of a session once it loaded an object to write it, see
+  ``SQLAlchemyRepository.get_for_update``.
+"""
+import random
+import time
+from contextlib import contextmanager
+from functools import wraps
+from flask import current_app, has_request_context, request
+from app import db
+from app.persistence.engine import REPLICA_BIND_PREFIX
+from app.persistence.session import REPLICA_ENGINE_KEY
+from app.persistence.unit_of_work import in_unit_of_work
+from app.services.cache import LRUCache
+from app.services.principal import request_identity
+
+MAX_TRACKED_WRITERS = 10000
+
+_PINNED_KEY = 'pinned_to_primary'
+# principal -> time.monotonic() deadline of its read-your-writes window
+_recent_writers = LRUCache(MAX_TRACKED_WRITERS, ttl=float('inf'))
+
+
+def replica_engines():
+    """Return the engines of the configured replicas."""
+    return [engine for key, engine in db.engines.items()
+            if key and key.startswith(REPLICA_BIND_PREFIX)]
+
+
+def requesting_principal():
+    """Identify who issues the current request, if there is one."""
+    if not has_request_context():
+        return None
+    identity = request_identity()
+    if isinstance(identity, dict):
+        identity = identity.get('id')
+    return identity or request.remote_addr
+
+
+def pinned_to_primary():
+    """Tell whether reads must currently see the primary."""
+    if db.session.info.get(_PINNED_KEY) or in_unit_of_work():
+        return True
+    deadline = _recent_writers.get(requesting_principal())
+    return deadline is not None and deadline > time.monotonic()
+
+
+@contextmanager
+def read_replica():
+    """Send the reads of the block to a replica, when allowed."""
+    session = db.session
+    if REPLICA_ENGINE_KEY in session.info:
+        yield
+        return
+    engines = replica_engines()
+    session.info[REPLICA_ENGINE_KEY] = random.choice(engines) \
+        if engines and not pinned_to_primary() else None
+    try:
+        yield
+    finally:
+        session.info.pop(REPLICA_ENGINE_KEY, None)
+
+
+def replica_read(method):
+    """Decorator running a repository read method in ``read_replica()``."""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with read_replica():
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def pin_to_primary(session=None):
+    """Send the rest of the session's reads to the primary."""
+    if session is None:
+        session = db.session
+    session.info[_PINNED_KEY] = True
+
+
+def record_write(session):
+    """Pin the session and the requesting principal to the primary."""
+    pin_to_primary(session)
+    if not replica_engines():
+        return
+    principal = requesting_principal()
+    if principal is None:
+        return
+    _recent_writers.set(principal, time.monotonic() + current_app.config.get(
+        'REPLICA_STICKY_SECONDS', 5))
+
+
+@db.event.listens_for(db.session, 'after_flush')
+def record_flush(session, flush_context):
+    record_write(session)
+
+
+@db.event.listens_for(db.session, 'do_orm_execute')
+def record_bulk_statement(execute_state):
+    if execute_state.is_insert or execute_state.is_update \
+            or execute_state.is_delete:
+        record_write(execute_state.session)
@@ -1,12 +1,68 @@
 from abc import ABC, abstractmethod
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_
+from sqlalchemy import and_, insert, or_
+from app.persistence.replicas import pin_to_primary, replica_read
+from app.persistence.unit_of_work import commit
 
 
 class RepositoryException(Exception):
     pass
 
 
+def encode_cursor(obj, sort_value=None):
+    """Build an opaque keyset cursor pointing just after ``obj``.
+
+    Pages ordered on a value before ``(created_at, id)`` pass the value
+    of ``obj`` as ``sort_value``.
+    """
+    key = f"{obj.created_at.isoformat()}|{obj.id}"
+    if sort_value is not None:
+        key = f"{float(sort_value)!r}|{key}"
+    return urlsafe_b64encode(key.encode()).decode()
+
+
+def decode_cursor(cursor, sorted_by_value=False):
+    """Return the ``(created_at, id)`` key encoded in a cursor.
+
+    With ``sorted_by_value`` the key is ``(sort_value, created_at, id)``.
+    """
+    try:
+        key = urlsafe_b64decode(cursor.encode()).decode()
+        if not sorted_by_value:
+            created_at, obj_id = key.split('|', 1)
+            return datetime.fromisoformat(created_at), obj_id
+        sort_value, created_at, obj_id = key.split('|', 2)
+        return float(sort_value), datetime.fromisoformat(created_at), obj_id
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+
+def page_query(query, model, limit, cursor=None):
+    """Restrict ``query`` to the page of ``model`` objects after
+    ``cursor``, in ``(created_at, id)`` order.
+
+    ``query`` may be a legacy ``Query`` or a ``select()``. One row more
+    than ``limit`` is fetched to tell whether another page follows.
+    """
+    query = query.order_by(model.created_at, model.id)
+    if cursor:
+        created_at, obj_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            model.created_at > created_at,
+            and_(model.created_at == created_at, model.id > obj_id)
+        ))
+    return query.limit(limit + 1)
+
+
+def split_page(items, limit):
+    """Return the ``(items, next_cursor)`` tuple of a ``page_query``."""
+    if len(items) > limit:
+        return items[:limit], encode_cursor(items[limit - 1])
+    return items, None
+
+
 class Repository(ABC):
     @abstractmethod
     def add(self, obj):
@@ -32,6 +88,14 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def get_all_by_attribute(self, attr_name, attr_value):
+        pass
+
+    @abstractmethod
+    def get_page(self, limit, cursor=None):
+        pass
+
 
 class SQLAlchemyRepository(Repository):
     def __init__(self, model):
@@ -40,45 +104,112 @@ class SQLAlchemyRepository(Repository):
         self.db = db
 
     def add(self, obj):
-        try:
-            self.db.session.add(obj)
-            self.db.session.commit()
-            return obj
-        except SQLAlchemyError as e:
-            self.db.session.rollback()
-            raise RepositoryException(f"Error adding object: {str(e)}")
-
+        self.db.session.add(obj)
+        self._commit("adding object")
+        return obj
+
+    def add_many(self, objs):
+        """Add several objects and commit them together."""
+        self.db.session.add_all(objs)
+        self._commit("adding objects")
+        return objs
+
+    def add_mappings(self, rows):
+        """Insert plain dict rows with one executemany INSERT.
+
+        Skips object construction and identity-map bookkeeping, which is
+        what bulk imports want. Column defaults such as ``id`` and the
+        timestamps are still applied.
+        """
+        if rows:
+            self.db.session.execute(insert(self.model), rows)
+            self._commit("inserting rows")
+        return len(rows)
+
+    @replica_read
     def get(self, obj_id):
         return self.model.query.get(obj_id)
 
-    def get_all(self):
-        return self.model.query.all()
+    @replica_read
+    def get_all(self, options=()):
+        return self.model.query.options(*options).all()
+
+    @replica_read
+    def get_page(self, limit, cursor=None, options=()):
+        """Return up to ``limit`` objects ordered by ``(created_at, id)``.
+
+        Returns a ``(items, next_cursor)`` tuple; ``next_cursor`` is None
+        once the last page has been reached. ``options`` are loader
+        options applied to the query, see ``app.persistence.loading``.
+        """
+        query = page_query(self.model.query.options(*options), self.model,
+                           limit, cursor)
+        return split_page(query.all(), limit)
+
+    def get_for_update(self, obj_id):
+        """Return the object with ``obj_id`` as the primary has it, to
+        write it: the session is pinned to the primary and an instance
+        loaded earlier from a replica is refreshed."""
+        pin_to_primary()
+        return self.db.session.get(self.model, obj_id,
+                                   populate_existing=True)
+
+    def get_existing_ids(self, obj_ids):
+        """Return the subset of ``obj_ids`` present in the table."""
+        if not obj_ids:
+            return set()
+        rows = self.db.session.query(self.model.id).filter(
+            self.model.id.in_(obj_ids))
+        return {obj_id for obj_id, in rows}
+
+    def get_many(self, obj_ids):
+        """Return the objects with the given ids, keyed by id."""
+        if not obj_ids:
+            return {}
+        objs = self.model.query.filter(self.model.id.in_(obj_ids)).all()
+        return {obj.id: obj for obj in objs}
 
     def update(self, obj_id, data):
-        obj = self.get(obj_id)
+        obj = self._get_from_primary(obj_id)
         if obj:
-            try:
-                for key, value in data.items():
-                    setattr(obj, key, value)
-                self.db.session.commit()
-                return obj
-            except SQLAlchemyError as e:
-                self.db.session.rollback()
-                raise RepositoryException(f"Error updating object: {str(e)}")
+            for key, value in data.items():
+                setattr(obj, key, value)
+            self._commit("updating object")
+            return obj
         return None
 
+    def update_many(self, updates):
+        """Apply ``{obj_id: data}`` updates and commit them together.
+
+        Returns the updated objects; unknown ids are skipped.
+        """
+        objs = self.get_many(list(updates))
+        for obj_id, obj in objs.items():
+            for key, value in updates[obj_id].items():
+                setattr(obj, key, value)
+        self._commit("updating objects")
+        return list(objs.values())
+
     def delete(self, obj_id):
-        obj = self.get(obj_id)
+        obj = self._get_from_primary(obj_id)
         if obj:
-            try:
-                self.db.session.delete(obj)
-                self.db.session.commit()
-                return True
-            except SQLAlchemyError as e:
-                self.db.session.rollback()
-                raise RepositoryException(f"Error deleting object: {str(e)}")
+            self.db.session.delete(obj)
+            self._commit("deleting object")
+            return True
         return False
 
+    def delete_many(self, obj_ids):
+        """Delete the objects with the given ids in one commit.
+
+        Returns the number of objects deleted.
+        """
+        objs = self.get_many(obj_ids)
+        for obj in objs.values():
+            self.db.session.delete(obj)
+        self._commit("deleting objects")
+        return len(objs)
+
+    @replica_read
     def get_by_attribute(self, attr_name, attr_value):
         return (
             self.model.query
@@ -86,8 +217,31 @@ class SQLAlchemyRepository(Repository):
             .first()
         )
 
+    @replica_read
     def get_by_attributes(self, attributes):
+        return self._filter_by_attributes(attributes).first()
+
+    def get_all_by_attribute(self, attr_name, attr_value, options=()):
+        """Return every object whose attribute matches, filtered in SQL."""
+        return self.get_all_by_attributes({attr_name: attr_value}, options)
+
+    @replica_read
+    def get_all_by_attributes(self, attributes, options=()):
+        """Return every object matching all the given attributes."""
+        return self._filter_by_attributes(attributes).options(*options).all()
+
+    def _get_from_primary(self, obj_id):
+        return self.db.session.get(self.model, obj_id)
+
+    def _commit(self, action):
+        try:
+            commit()
+        except SQLAlchemyError as e:
+            self.db.session.rollback()
+            raise RepositoryException(f"Error {action}: {str(e)}")
+
+    def _filter_by_attributes(self, attributes):
         query = self.model.query
         for attr_name, attr_value in attributes.items():
             query = query.filter(getattr(self.model, attr_name) == attr_value)
-        return query.first()
+        return query
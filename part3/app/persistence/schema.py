@@ -0,0 +1,79 @@
+"""
+Schema version check.
+
+The schema is managed by the Alembic migrations in ``migrations/`` and
+applied by a separate command::
+
+    flask --app run db upgrade
+
+``create_app`` no longer creates tables: ``verify_schema`` reads the
+revision of the database with a single query. On a mismatch the error
+is logged and every request is answered with a 503, so that the
+``db`` commands still run and a preforked worker fails its warm-up.
+
+Throwaway databases (``SCHEMA_AUTO_CREATE``, set for the tests) are
+created from the models instead and stamped at SCHEMA_REVISION.
+"""
+import logging
+from sqlalchemy import Column, MetaData, String, Table, select
+from sqlalchemy.exc import DBAPIError
+from app import db
+from app.persistence.versions import ensure_versions
+
+logger = logging.getLogger(__name__)
+
+# Head of migrations/versions, checked by tests/test_part4/test_schema.py
+SCHEMA_REVISION = '0002'
+
+alembic_version = Table(
+    'alembic_version', MetaData(),
+    Column('version_num', String(32), primary_key=True))
+
+
+def current_revision():
+    """Return the migration revision of the database, or None."""
+    try:
+        with db.engine.connect() as connection:
+            return connection.execute(
+                select(alembic_version.c.version_num)).scalar()
+    except DBAPIError:
+        return None
+
+
+def create_schema():
+    """Create the tables from the models, stamped at SCHEMA_REVISION."""
+    # The API, which imports the models, may not be loaded yet
+    from app.models import (  # noqa: F401
+        amenity, place, place_amenity, review, table_version, user)
+    db.create_all(bind_key=None)
+    with db.engine.begin() as connection:
+        alembic_version.create(connection, checkfirst=True)
+        connection.execute(alembic_version.delete())
+        connection.execute(alembic_version.insert(),
+                           {'version_num': SCHEMA_REVISION})
+    ensure_versions()
+
+
+def verify_schema(app):
+    """Check that the database is at SCHEMA_REVISION.
+
+    Must run inside an application context. Returns True when it is.
+    """
+    revision = current_revision()
+    if revision == SCHEMA_REVISION:
+        return True
+    if revision is None and app.config.get('SCHEMA_AUTO_CREATE'):
+        create_schema()
+        return True
+
+    message = (f"Database schema is at revision {revision}, expected "
+               f"{SCHEMA_REVISION}: run `flask --app run db upgrade`")
+    if revision is None:
+        message += (" (databases created before migrations are at the "
+                    "baseline: `flask --app run db stamp 0001` first)")
+    logger.error(message)
+
+    @app.before_request
+    def schema_out_of_date():
+        return {'message': message}, 503
+    return False
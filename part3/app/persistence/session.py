@@ -0,0 +1,23 @@
+"""
+Session class of the ``db`` extension.
+
+It only differs from Flask-SQLAlchemy's in ``get_bind``: inside a
+``read_replica()`` block (see app.persistence.replicas) reads go to the
+replica engine chosen for the block. Flushes and INSERT/UPDATE/DELETE
+statements always go to the primary.
+"""
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+REPLICA_ENGINE_KEY = 'replica_engine'
+
+
+class RoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        replica = self.info.get(REPLICA_ENGINE_KEY)
+        if replica is not None and bind is None and clause is not None \
+                and not self._flushing \
+                and not isinstance(clause, UpdateBase):
+            return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind,
+                                **kwargs)
@@ -0,0 +1,68 @@
+"""
+Async counterpart of the HBnBFacade read methods, served by the ASGI
+entry point (see app.asgi). Objects are loaded with the same loading
+profiles as their listings, so ``to_dict()`` never lazy loads.
+"""
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.models.review import Review
+from app.persistence.async_repository import (
+    AsyncPlaceRepository, AsyncSQLAlchemyRepository, get_versions)
+from app.persistence.loading import load_profile
+from app.services.facade import check_place_filters
+
+
+class AsyncHBnBFacade:
+    """Read-only async facade over the async repositories."""
+
+    def __init__(self):
+        self.user_repository = AsyncSQLAlchemyRepository(User)
+        self.place_repository = AsyncPlaceRepository()
+        self.review_repository = AsyncSQLAlchemyRepository(Review)
+        self.amenity_repository = AsyncSQLAlchemyRepository(Amenity)
+
+    async def get_versions(self, table_names):
+        """Return the version counters of ``table_names``."""
+        return await get_versions(table_names)
+
+    async def get_user(self, user_id):
+        return await self.user_repository.get(
+            user_id, load_profile('user_list'))
+
+    async def get_users_page(self, limit, cursor=None):
+        return await self.user_repository.get_page(
+            limit, cursor, load_profile('user_list'))
+
+    async def get_place(self, place_id):
+        return await self.place_repository.get(
+            place_id, load_profile('place_list'))
+
+    async def get_places_page(self, limit, cursor=None, min_price=None,
+                              max_price=None, min_rating=None,
+                              amenity_ids=(), sort=None):
+        check_place_filters(min_price, max_price, sort)
+        return await self.place_repository.search_page(
+            limit, cursor, min_price=min_price, max_price=max_price,
+            min_rating=min_rating, amenity_ids=amenity_ids, sort=sort,
+            options=load_profile('place_list'))
+
+    async def get_amenity(self, amenity_id):
+        return await self.amenity_repository.get(amenity_id)
+
+    async def get_amenities_page(self, limit, cursor=None):
+        return await self.amenity_repository.get_page(
+            limit, cursor, load_profile('amenity_list'))
+
+    async def get_review(self, review_id):
+        return await self.review_repository.get(review_id)
+
+    async def get_reviews_page(self, limit, cursor=None):
+        return await self.review_repository.get_page(
+            limit, cursor, load_profile('review_list'))
+
+    async def get_reviews_by_place(self, place_id):
+        return await self.review_repository.get_all_by_attribute(
+            'place_id', place_id, load_profile('review_list'))
+
+
+async_facade = AsyncHBnBFacade()
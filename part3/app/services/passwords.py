@@ -0,0 +1,121 @@
+"""
+Password hashing off the request thread.
+
+bcrypt is deliberately slow, so hashing and verification run in a
+bounded process pool instead of pinning the request threads. At most
+``PASSWORD_HASH_QUEUE_SIZE`` jobs are in flight; beyond that callers
+get ``PasswordHasherBusy`` straight away and the API answers 503 rather
+than queueing logins behind each other.
+
+Settings:
+
+* ``BCRYPT_LOG_ROUNDS``        work factor of new hashes. Hashes made with
+  another cost are upgraded on the next successful login.
+* ``PASSWORD_HASH_WORKERS``    pool size, defaults to the CPU count; 0
+  hashes inline on the calling thread.
+* ``PASSWORD_HASH_QUEUE_SIZE`` maximum number of jobs in flight.
+* ``PASSWORD_HASH_TIMEOUT``    seconds to wait for a job.
+"""
+import os
+import threading
+import bcrypt
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full."""
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _check(password, hashed):
+    return bcrypt.checkpw(password, hashed)
+
+
+def hash_cost(hashed):
+    """Return the work factor encoded in a ``$2b$<cost>$...`` hash."""
+    try:
+        return int(hashed.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """bcrypt hashing service backed by a bounded process pool."""
+
+    def __init__(self, rounds=12, workers=0, queue_size=None, timeout=30):
+        self.configure(rounds, workers, queue_size, timeout)
+
+    def init_app(self, app):
+        workers = app.config.get('PASSWORD_HASH_WORKERS')
+        self.configure(
+            app.config.get('BCRYPT_LOG_ROUNDS', 12),
+            os.cpu_count() if workers is None else workers,
+            app.config.get('PASSWORD_HASH_QUEUE_SIZE'),
+            app.config.get('PASSWORD_HASH_TIMEOUT', 30))
+
+    def configure(self, rounds, workers, queue_size=None, timeout=30):
+        """Apply new settings, replacing the pool if there is one."""
+        self.shutdown()
+        self.rounds = rounds
+        self.workers = workers
+        self.queue_size = queue_size or max(workers, 1) * 4
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.queue_size)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pool_pid = None
+
+    def shutdown(self):
+        pool = getattr(self, '_pool', None)
+        if pool is not None and self._pool_pid == os.getpid():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
+    def hash(self, password):
+        """Return the bcrypt hash of ``password`` as a string."""
+        return self._run(_hash, password.encode('utf-8'),
+                         self.rounds).decode('utf-8')
+
+    def verify(self, hashed, password):
+        """Check ``password`` against a stored hash."""
+        if not hashed or not password:
+            return False
+        return self._run(_check, password.encode('utf-8'),
+                         hashed.encode('utf-8'))
+
+    def needs_rehash(self, hashed):
+        """Tell whether ``hashed`` was made with another work factor."""
+        return hash_cost(hashed) != self.rounds
+
+    def _run(self, func, *args):
+        if not self.workers:
+            return func(*args)
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("Too many password operations queued")
+        try:
+            future = self._executor().submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is held until the job ends, not until we stop waiting
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            raise PasswordHasherBusy("Password operation timed out")
+
+    def _executor(self):
+        # A forked worker process cannot reuse its parent's pool
+        with self._lock:
+            if self._pool is None or self._pool_pid != os.getpid():
+                # imported here: multiprocessing is slow to import and
+                # most processes never hash a password
+                from concurrent.futures import ProcessPoolExecutor
+                self._pool = ProcessPoolExecutor(self.workers)
+                self._pool_pid = os.getpid()
+            return self._pool
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,216 @@
+"""
+Revoked access tokens.
+
+flask-jwt-extended asks ``revocations.is_revoked`` about every token it
+accepts. Two kinds of entries are kept, both dropped once the tokens
+they match have expired anyway:
+
+* a token, by ``jti`` (``revoke_token``, used by the logout endpoint)
+* every token of a user issued up to a point in time (``revoke_user``,
+  forced revocation by an administrator)
+
+Each kind lives in an ``ExpiringMap``, dicts grouping the entries by
+expiry: a token is looked up in the one dict its ``exp`` claim points
+to, and expired entries go a whole dict at a time, so memory stays
+proportional to the revoked tokens still alive.
+
+Revocations are per process unless a shared backend is configured
+(Redis when ``REVOCATION_REDIS_URL`` is set). Lookups check the local
+map first, then the shared backend.
+"""
+import math
+import threading
+import time
+from datetime import timedelta
+
+
+class ExpiringMap:
+    """Thread-safe mapping whose entries are dropped after their expiry.
+
+    Entries live in one dict per ``granularity`` seconds of expiry time,
+    dropped as a whole once its last second has passed: an entry may
+    outlive its expiry by up to ``granularity`` seconds. A lookup given
+    the expiry the entry was stored with reads a single dict; others try
+    each of them. ``expires_at`` is a POSIX timestamp, None for never.
+
+    Keys are strings and values numbers: the dicts then hold nothing the
+    garbage collector tracks, and a million entries add nothing to its
+    collections.
+    """
+
+    def __init__(self, granularity=60, clock=time.time):
+        self.granularity = granularity
+        self.clock = clock
+        self._buckets = {}  # bucket number -> {key: value}
+        self._forever = {}
+        self._next_expiry = math.inf
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._forever) + sum(map(len, list(self._buckets.values())))
+
+    def get(self, key, expires_at=None):
+        """Return the value stored under ``key``, or None."""
+        if self._next_expiry <= self.clock():
+            self.prune()
+        if expires_at is not None:
+            entries = self._buckets.get(self._bucket(expires_at))
+            return None if entries is None else entries.get(key)
+        value = self._forever.get(key)
+        if value is None:
+            for entries in list(self._buckets.values()):
+                value = entries.get(key)
+                if value is not None:
+                    break
+        return value
+
+    def set(self, key, value, expires_at=None):
+        with self._lock:
+            self._discard(key)
+            if expires_at is None:
+                self._forever[key] = value
+            else:
+                bucket = self._bucket(expires_at)
+                self._buckets.setdefault(bucket, {})[key] = value
+                self._next_expiry = min(self._next_expiry,
+                                        bucket * self.granularity)
+        self.prune()
+
+    def delete(self, key):
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._buckets = {}
+            self._forever = {}
+            self._next_expiry = math.inf
+
+    def prune(self):
+        """Drop the dicts whose entries have all expired."""
+        now = self.clock()
+        with self._lock:
+            expired = [bucket for bucket in self._buckets
+                       if bucket * self.granularity <= now]
+            for bucket in expired:
+                del self._buckets[bucket]
+            self._next_expiry = min(self._buckets, default=math.inf) * \
+                self.granularity
+
+    def _bucket(self, expires_at):
+        return math.ceil(expires_at / self.granularity)
+
+    def _discard(self, key):
+        self._forever.pop(key, None)
+        for entries in self._buckets.values():
+            entries.pop(key, None)
+
+
+class RedisRevocationBackend:
+    """Shared backend keeping the revocations in Redis."""
+
+    def __init__(self, url, prefix='hbnb:revoked:'):
+        import redis  # optional dependency, only needed for a shared store
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key, expires_at=None):
+        value = self.client.get(self.prefix + key)
+        return None if value is None else float(value)
+
+    def set(self, key, value, expires_at=None):
+        self.client.set(self.prefix + key, value,
+                        exat=None if expires_at is None else
+                        math.ceil(expires_at))
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + '*'):
+            self.client.delete(key)
+
+
+class Revocations:
+    """Blocklist of access tokens, checked on every authenticated request."""
+
+    def __init__(self):
+        self.tokens = ExpiringMap()
+        self.users = ExpiringMap()
+        self.shared = None
+        self.token_lifetime = None
+
+    def init_app(self, app, shared=None):
+        """Configure the store from ``app.config``, empty it and register
+        it with flask-jwt-extended.
+
+        ``shared`` replaces the backend built from ``REVOCATION_REDIS_URL``;
+        any object with ``get``/``set``/``delete``/``clear`` will do, an
+        ``ExpiringMap`` standing in for Redis.
+        """
+        from app import jwt
+        granularity = app.config.get('REVOCATION_GRANULARITY', 60)
+        self.tokens = ExpiringMap(granularity)
+        self.users = ExpiringMap(granularity)
+        if shared is None and app.config.get('REVOCATION_REDIS_URL'):
+            shared = RedisRevocationBackend(app.config['REVOCATION_REDIS_URL'])
+        self.shared = shared
+        lifetime = app.config.get('JWT_ACCESS_TOKEN_EXPIRES')
+        if isinstance(lifetime, timedelta):
+            lifetime = lifetime.total_seconds()
+        self.token_lifetime = lifetime or None  # False: tokens never expire
+        jwt.token_in_blocklist_loader(self.is_revoked)
+
+    def revoke_token(self, payload):
+        """Revoke the token with the decoded claims ``payload``."""
+        self._set(self.tokens, 'jti:', payload['jti'], 1, payload.get('exp'))
+
+    def revoke_user(self, user_id, before=None):
+        """Revoke every token of ``user_id`` issued up to ``before``, a
+        POSIX timestamp defaulting to now. Token ``iat`` claims are whole
+        seconds: a token issued within the same second is revoked too."""
+        before = self.users.clock() if before is None else before
+        expires_at = None
+        if self.token_lifetime is not None:
+            expires_at = before + self.token_lifetime
+        self._set(self.users, 'user:', user_id, before, expires_at)
+
+    def is_revoked(self, jwt_header, jwt_payload):
+        """``token_in_blocklist_loader`` callback."""
+        if self._get(self.tokens, 'jti:', jwt_payload.get('jti'),
+                     jwt_payload.get('exp')) is not None:
+            return True
+        identity = jwt_payload.get('sub')
+        if isinstance(identity, dict):
+            before = self._latest(self.users, 'user:', identity.get('id'))
+            if before is not None and jwt_payload.get('iat', 0) <= before:
+                return True
+        return False
+
+    def clear(self):
+        self.tokens.clear()
+        self.users.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def _get(self, local, prefix, key, expires_at=None):
+        value = local.get(key, expires_at)
+        if value is None and self.shared is not None:
+            value = self.shared.get(prefix + str(key), expires_at)
+        return value
+
+    def _latest(self, local, prefix, key):
+        # Another process may have revoked later than this one saw
+        values = [local.get(key)]
+        if self.shared is not None:
+            values.append(self.shared.get(prefix + str(key)))
+        values = [value for value in values if value is not None]
+        return max(values) if values else None
+
+    def _set(self, local, prefix, key, value, expires_at):
+        local.set(key, value, expires_at)
+        if self.shared is not None:
+            self.shared.set(prefix + str(key), value, expires_at)
+
+
+revocations = Revocations()
@@ -0,0 +1,79 @@
+"""
+Lazy startup mode.
+
+Most of ``create_app`` goes into importing the API namespaces (and
+through them the facade, the models and the repositories), building
+the flask-restx ``Api`` and importing Alembic for Flask-Migrate. A
+process that never answers a request (a ``flask`` command, a script, a
+test that only needs the models) does not need any of it.
+
+With ``LAZY_STARTUP`` on:
+
+* the API is built by the first request that reaches the app (see
+  ``LazyAPI``), or up front by ``load_api`` where the routes are needed
+  before any request, as in the ASGI front end;
+* Flask-Migrate is only set up when the app is created by the flask CLI,
+  the only place the ``db`` commands run.
+
+Preforking servers keep it off (ProductionConfig): the master then
+builds the API once, before forking the workers. The import cost of
+each startup path is measured by benchmarks/bench_import_time.py.
+"""
+import threading
+from importlib import import_module
+import click
+
+# Namespaces of the API: module defining ``api`` and mount point
+API_NAMESPACES = (
+    ('app.api.v1.users', '/api/v1/users'),
+    ('app.api.v1.auth', '/api/v1/auth'),
+    ('app.api.v1.amenities', '/api/v1/amenities'),
+    ('app.api.v1.places', '/api/v1/places'),
+    ('app.api.v1.reviews', '/api/v1/reviews'),
+)
+
+_lock = threading.Lock()
+
+
+def load_api(app):
+    """Build the flask-restx API of ``app``, once, and return it."""
+    with _lock:
+        api = app.extensions.get('hbnb_api')
+        if api is None:
+            from flask_restx import Api
+            api = Api(app, version='1.0', title='HBnB API',
+                      description='API description')
+            for module, path in API_NAMESPACES:
+                api.add_namespace(import_module(module).api, path=path)
+            from app.api.v1.encoders import install_encoder
+            from app.api.v1.spec import install_spec
+            install_encoder(app, api)
+            install_spec(app, api)
+            app.extensions['hbnb_api'] = api
+    return api
+
+
+class LazyAPI:
+    """WSGI middleware building the API before the first request is
+    dispatched, while Flask still accepts new routes."""
+
+    def __init__(self, app):
+        self.app = app
+        self.wsgi_app = app.wsgi_app
+
+    def __call__(self, environ, start_response):
+        if 'hbnb_api' not in self.app.extensions:
+            load_api(self.app)
+        return self.wsgi_app(environ, start_response)
+
+
+def run_by_cli():
+    """Tell whether the app is being created by a click command."""
+    return click.get_current_context(silent=True) is not None
+
+
+def init_migrations(app):
+    """Set up Flask-Migrate for the ``flask db`` commands."""
+    from flask_migrate import Migrate
+    from app import MIGRATIONS_DIR, db
+    Migrate(app, db, directory=MIGRATIONS_DIR, render_as_batch=True)
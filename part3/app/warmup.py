@@ -0,0 +1,56 @@
+"""
+Worker warm-up for preforked servers, see gunicorn.conf.py.
+
+A forked worker must not share the database connections of the master,
+and its first request would otherwise pay for opening new ones, for
+compiling the flask-restx models into the Swagger schema and for the
+first SQLAlchemy compilation of the listing queries. ``reset_after_fork``
+and ``warm_up`` do that work before the worker accepts traffic.
+"""
+import time
+from app import db
+
+# Requests sent through the app by warm_up: the Swagger schema compiles
+# every API model, the listing runs the first query end to end.
+WARMUP_PATHS = ('/swagger.json', '/api/v1/places/?limit=1')
+
+
+def reset_after_fork(app):
+    """Drop the pooled connections inherited from the parent process,
+    without closing them under the parent's feet."""
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def warm_pool(engine, connections):
+    """Open ``connections`` connections at once and return them to the
+    pool, so that they are ready for the first requests."""
+    opened = [engine.connect() for _ in range(connections)]
+    for connection in opened:
+        connection.close()
+
+
+def warm_up(app, connections=1):
+    """Prepare the current process to serve ``app``.
+
+    Returns the duration of each step in milliseconds. Raises
+    RuntimeError when a warm-up request fails, so that a broken worker
+    never accepts traffic.
+    """
+    timings = {}
+    start = time.perf_counter()
+    with app.app_context():
+        for engine in db.engines.values():
+            warm_pool(engine, connections)
+    timings['pool'] = (time.perf_counter() - start) * 1000
+
+    client = app.test_client()
+    for path in WARMUP_PATHS:
+        start = time.perf_counter()
+        response = client.get(path)
+        if response.status_code >= 500:
+            raise RuntimeError(
+                f"Warm-up request {path} failed: {response.status}")
+        timings[path] = (time.perf_counter() - start) * 1000
+    return timings
@@ -5,13 +5,80 @@ class Config:
     """Base class for application configuration."""
     SECRET_KEY = os.getenv('SECRET_KEY')
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY')
+    # Identities are {'id', 'is_admin'} dicts rather than plain strings
+    JWT_VERIFY_SUB = False
+    # RS256 or EdDSA: signed with JWT_PRIVATE_KEY_FILE and verifiable
+    # with the JWKS, see app.services.signing
+    JWT_ALGORITHM = os.getenv('JWT_ALGORITHM', 'HS256')
+    JWT_PRIVATE_KEY_FILE = os.getenv('JWT_PRIVATE_KEY_FILE')
+    # Public keys of the previous signing keys, comma-separated
+    JWT_PUBLIC_KEY_FILES = [
+        path for path in os.getenv('JWT_PUBLIC_KEY_FILES', '').split(',')
+        if path]
+    JWKS_MAX_AGE = 300
+    # Used when SQLALCHEMY_DATABASE_URI is not set, see app.persistence.engine
     DATABASE_URL = os.getenv('DATABASE_URL')
+    # Async engine of the ASGI mode, derived from the database URI when
+    # unset, see app.persistence.async_repository
+    ASYNC_DATABASE_URL = os.getenv('ASYNC_DATABASE_URL')
+    # Threads running the requests the ASGI mode hands to Flask
+    ASGI_WSGI_THREADS = 10
+    # Create the tables of an empty database instead of requiring
+    # `flask db upgrade`, see app.persistence.schema
+    SCHEMA_AUTO_CREATE = False
+    # Read replicas, comma-separated, see app.persistence.replicas
+    DATABASE_REPLICA_URLS = [
+        url for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url]
+    # Seconds a principal reads from the primary after writing
+    REPLICA_STICKY_SECONDS = 5
+    # Connection pool of server databases (PostgreSQL, MySQL)
+    DB_POOL_SIZE = 10
+    DB_MAX_OVERFLOW = 20
+    DB_POOL_TIMEOUT = 30
+    DB_POOL_RECYCLE = 1800
+    # Per-connection SQLite settings
+    SQLITE_JOURNAL_MODE = 'WAL'
+    SQLITE_SYNCHRONOUS = 'NORMAL'
+    SQLITE_BUSY_TIMEOUT_MS = 5000
+    SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+    PAGE_SIZE = 100
+    MAX_PAGE_SIZE = 1000
+    BULK_CHUNK_SIZE = 500
+    MAX_SEARCH_RADIUS_KM = 500
+    # Read-through cache of the facade getters, see app.services.cache
+    CACHE_ENABLED = True
+    CACHE_MAX_SIZE = 1024
+    CACHE_TTL = 60
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL')
+    # Password hashing, see app.services.passwords
+    BCRYPT_LOG_ROUNDS = 12
+    PASSWORD_HASH_WORKERS = None  # one per CPU
+    PASSWORD_HASH_QUEUE_SIZE = None  # four jobs per worker
+    PASSWORD_HASH_TIMEOUT = 30
+    # Login attempts per window, see app.services.ratelimit
+    LOGIN_RATE_WINDOW = 60
+    LOGIN_RATE_LIMIT_PER_IP = 20
+    LOGIN_RATE_LIMIT_PER_EMAIL = 5
+    RATE_LIMIT_REDIS_URL = os.getenv('RATE_LIMIT_REDIS_URL')
+    # Claims of the token holders, by token jti, see app.services.principal
+    PRINCIPAL_CACHE_TTL = 30
+    PRINCIPAL_CACHE_SIZE = 4096
+    # Revoked tokens, see app.services.revocation
+    REVOCATION_GRANULARITY = 60
+    REVOCATION_REDIS_URL = os.getenv('REVOCATION_REDIS_URL')
+    # Build the API on the first request, see app.startup
+    LAZY_STARTUP = False
+    # Prebuilt swagger.json (flask --app run export-spec), see app.api.v1.spec
+    SWAGGER_SPEC_FILE = os.getenv('SWAGGER_SPEC_FILE')
+    # json or orjson, see app.api.v1.encoders
+    JSON_ENCODER = os.getenv('JSON_ENCODER', 'json')
     DEBUG = False
 
 
 class DevelopmentConfig(Config):
     """Development configuration."""
     DEBUG = True
+    LAZY_STARTUP = True
 
 
 class ProductionConfig(Config):
@@ -19,8 +86,21 @@ class ProductionConfig(Config):
     DEBUG = False
 
 
+class TestingConfig(Config):
+    """Configuration for tests, backed by an in-memory database."""
+    TESTING = True
+    JWT_SECRET_KEY = 'test-secret-key'
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    BCRYPT_LOG_ROUNDS = 4
+    PASSWORD_HASH_WORKERS = 0
+    # Throwaway databases get their tables from the models
+    SCHEMA_AUTO_CREATE = True
+    LAZY_STARTUP = True
+
+
 config = {
     'development': DevelopmentConfig,
     'production': ProductionConfig,
+    'testing': TestingConfig,
     'default': DevelopmentConfig
 }
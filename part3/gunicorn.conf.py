@@ -0,0 +1,71 @@
+"""
+Production launcher::
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Apply the migrations first (``flask --app run db upgrade``): the master
+creates the app once (``preload_app``), which only checks the schema
+revision (see app.persistence.schema), then forks the workers. Each worker drops the
+database connections it inherited, warms up (see app.warmup) and only
+then accepts connections. Startup times are logged: the master once
+ready, each worker after its warm-up and on its first request.
+
+``kill -HUP <master>`` replaces the workers gracefully: new workers
+warm up while the old ones finish their in-flight requests, for up to
+``HBNB_GRACEFUL_TIMEOUT`` seconds. The app is preloaded, so deploying
+new code takes ``kill -USR2 <master>`` (a new master) followed by
+``kill -QUIT <old master>``.
+
+Environment: ``HBNB_BIND``, ``HBNB_WORKERS`` (defaults to 2 per CPU
+plus one), ``HBNB_THREADS`` (threads per worker), ``HBNB_CONFIG``
+(see wsgi.py) and ``HBNB_GRACEFUL_TIMEOUT``.
+"""
+import multiprocessing
+import os
+import time
+
+# Reset when HUP reloads this file; the launch time is kept on the
+# server object by when_ready
+LOADED = time.monotonic()
+
+bind = os.getenv('HBNB_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('HBNB_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('HBNB_THREADS', 1))
+preload_app = True
+graceful_timeout = int(os.getenv('HBNB_GRACEFUL_TIMEOUT', 30))
+timeout = 60
+keepalive = 5
+
+
+def since(start):
+    return (time.monotonic() - start) * 1000
+
+
+def when_ready(server):
+    server.started_at = LOADED
+    server.log.info("Master ready in %.0f ms", since(server.started_at))
+
+
+def post_fork(server, worker):
+    worker.started_at = server.started_at
+    worker.forked_at = time.monotonic()
+    worker.served_first_request = False
+
+
+def post_worker_init(worker):
+    from app.warmup import reset_after_fork, warm_up
+
+    reset_after_fork(worker.wsgi)
+    timings = warm_up(worker.wsgi, connections=threads)
+    worker.log.info("Worker %s warmed up in %.0f ms (%s)", worker.pid,
+                    since(worker.forked_at), ', '.join(
+                        f"{step} {ms:.0f} ms" for step, ms in timings.items()))
+
+
+def pre_request(worker, req):
+    if not worker.served_first_request:
+        worker.served_first_request = True
+        worker.log.info("Worker %s got its first request %.0f ms after "
+                        "forking, %.0f ms after the launcher started",
+                        worker.pid, since(worker.forked_at),
+                        since(worker.started_at))
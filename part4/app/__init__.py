@@ -1,52 +1,74 @@
 from flask import Flask, request
-from flask_restx import Api
 from flask_jwt_extended import JWTManager
 from flask_bcrypt import Bcrypt
 from flask_sqlalchemy import SQLAlchemy
+from app.persistence.session import RoutingSession
 from dotenv import load_dotenv
-from flask_cors import CORS
 import os
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 bcrypt = Bcrypt()
 jwt = JWTManager()
 
+# Alembic migrations, applied with `flask --app run db upgrade`
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'migrations')
+
 load_dotenv('.env')
 
 
 def create_app(config_class="config.DevelopmentConfig"):
     """App configuration"""
+    from flask_cors import CORS
     app = Flask(__name__)
-    CORS(app)
+    CORS(app, expose_headers=['X-Next-Cursor', 'ETag', 'Last-Modified'])
 
     app.config.from_object(config_class)
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///hbnb_database.db'
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+    from app.persistence.engine import (
+        apply_pragmas, configure_engine, log_replicas)
+    configure_engine(app)
+
     """initialize extensions with the app"""
     db.init_app(app)
     bcrypt.init_app(app)
     jwt.init_app(app)
+    from app.services.signing import signing_keys
+    signing_keys.init_app(app)
+    from app.startup import (
+        LazyAPI, init_migrations, load_api, run_by_cli)
+    lazy = app.config.get('LAZY_STARTUP')
+    if not lazy or run_by_cli():
+        init_migrations(app)
 
-    """create the API"""
-    api = Api(app, version='1.0', title='HBnB API',
-              description='API description')
+    from app.services.cache import cache
+    cache.init_app(app)
+    from app.services.passwords import password_hasher
+    password_hasher.init_app(app)
+    from app.services.ratelimit import login_limiter
+    login_limiter.init_app(app)
+    from app.services.principal import principals
+    principals.init_app(app)
+    from app.services.revocation import revocations
+    revocations.init_app(app)
 
-    from app.api.v1.users import api as users_ns
-    from app.api.v1.auth import api as auth_ns
-    from app.api.v1.amenities import api as amenities_ns
-    from app.api.v1.places import api as places_ns
-    from app.api.v1.reviews import api as reviews_ns
+    """create the API, on the first request in the lazy startup mode"""
+    if lazy:
+        app.wsgi_app = LazyAPI(app)
+    else:
+        load_api(app)
 
-    api.add_namespace(users_ns, path='/api/v1/users')
-    api.add_namespace(auth_ns, path='/api/v1/auth')
-    api.add_namespace(amenities_ns, path='/api/v1/amenities')
-    api.add_namespace(places_ns, path='/api/v1/places')
-    api.add_namespace(reviews_ns, path='/api/v1/reviews')
+    from app.commands import register_commands
+    register_commands(app)
 
-    """create database tables"""
+    """check the database schema, see app.persistence.schema"""
+    from app.persistence.schema import verify_schema
     with app.app_context():
-        db.create_all()
+        apply_pragmas(app)
+        log_replicas()
+        verify_schema(app)
 
     @app.before_request
     def disable_redirect_on_options():
@@ -1,7 +1,12 @@
+from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import create_access_token
 from app.services.facade import hbnb_facade as facade
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.services.passwords import PasswordHasherBusy
+from app.services.principal import principals
+from app.services.ratelimit import login_limiter
+from app.services.revocation import revocations
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 
 api = Namespace('auth', description='Authentication operations')
 
@@ -19,17 +24,30 @@ login_model = api.model('Login', {
 @api.route('/login')
 class Login(Resource):
     @api.expect(login_model)
+    @api.response(429, 'Too many login attempts')
+    @api.response(503, 'Too many logins in progress')
     def post(self):
         """Authenticate user and return a JWT token"""
         # Get the email and password from the request payload
         credentials = api.payload
 
-        # Step 1: Retrieve the user based on the provided email
-        user = facade.get_user_by_email(credentials['email'])
+        # Turn away clients over their attempt limits before any lookup
+        retry_after = login_limiter.check(request.remote_addr,
+                                          credentials.get('email'))
+        if retry_after is not None:
+            return {'error': 'Too many login attempts'}, 429, \
+                {'Retry-After': str(retry_after)}
 
-        # Step 2: Check if the user exists and the password is correct
-        if not user or not user.verify_password(credentials['password']):
+        # Step 1 & 2: Retrieve the user based on the provided email and
+        # check the password, upgrading its hash if needed
+        try:
+            user = facade.authenticate_user(credentials['email'],
+                                            credentials['password'])
+        except PasswordHasherBusy as e:
+            return {'error': str(e)}, 503, {'Retry-After': '1'}
+        if not user:
             return {'error': 'Invalid credentials'}, 401
+        login_limiter.succeeded(credentials['email'])
 
         # Step 3: Create a JWT token with the user's id and is_admin flag
         access_token = create_access_token(
@@ -44,15 +62,35 @@ class ProtectedResource(Resource):
     @jwt_required()
     def get(self):
         """A protected endpoint that requires a valid JWT token"""
-        # Retrieve the user's id from the token
-        current_user_id = get_jwt_identity(
-        )['id']
-        # Retrieve the user from the database
-        user = facade.get_user(current_user_id)
+        # Retrieve the user behind the token, cached by token
+        user = principals.current()
 
         if not user:
             return {'error': 'User not found'}, 404
 
         return {
-            'message': f'Welcome, {user.first_name} {user.last_name} !'
+            'message': f"Welcome, {user['first_name']} {user['last_name']} !"
         }, 200
+
+
+@api.route('/logout')
+class Logout(Resource):
+    @api.response(200, 'Token revoked')
+    @jwt_required()
+    def post(self):
+        """Revoke the JWT token of the request"""
+        revocations.revoke_token(get_jwt())
+        return {'message': 'Logged out'}, 200
+
+
+@api.route('/revoke/<user_id>')
+class RevokeUserTokens(Resource):
+    @api.response(200, 'Tokens revoked')
+    @api.response(403, 'Action not allowed')
+    @jwt_required()
+    def post(self, user_id):
+        """Revoke every JWT token issued so far to a user (admin only)"""
+        if not get_jwt_identity().get('is_admin'):
+            return {'error': 'Action not allowed'}, 403
+        revocations.revoke_user(user_id)
+        return {'message': 'Tokens revoked'}, 200
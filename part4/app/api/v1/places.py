@@ -1,6 +1,13 @@
-from flask_restx import Namespace, Resource, fields
+from flask import Response, current_app, request, stream_with_context
+from flask_restx import Namespace, Resource, fields, inputs, reqparse
 from app.services.facade import hbnb_facade as facade
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.api.v1 import encoders
+from app.api.v1.pagination import pagination_parser, page_args, page_headers
+from app.api.v1.conditional import (
+    collection_validators, is_not_modified, not_modified,
+    resource_validators, validator_headers)
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -53,6 +60,23 @@ place_update_model = api.model('PlaceUpdate', {
 })
 
 
+# Filters and sort order of the place listing
+place_list_parser = pagination_parser.copy()
+place_list_parser.add_argument('min_price', type=float, location='args',
+                               help='Lowest price per night')
+place_list_parser.add_argument('max_price', type=float, location='args',
+                               help='Highest price per night')
+place_list_parser.add_argument('min_rating', type=float, location='args',
+                               help='Lowest average review rating')
+place_list_parser.add_argument('amenities', type=str, action='split',
+                               location='args',
+                               help='Comma-separated amenity ids, all '
+                                    'of which a place must offer')
+place_list_parser.add_argument('sort', type=str, location='args',
+                               choices=('price', '-price', 'rating'),
+                               help='Sort order, by default creation order')
+
+
 @api.route('/')
 class PlaceList(Resource):
     @api.expect(place_model, validate=True)
@@ -69,7 +93,7 @@ class PlaceList(Resource):
         try:
             place_data['owner_id'] = current_user['id']  # check if owner_id is present
             place = facade.create_place(place_data)
-            return place.to_dict(), 201
+            return place.to_dict(raw_datetimes=True), 201
         except ValueError as e:
             logger.error(f"ValueError: {str(e)}")
             return {'error': str(e)}, 400
@@ -77,17 +101,200 @@ class PlaceList(Resource):
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500 
 
+    @api.expect(place_list_parser)
     @api.response(200, 'List of places retrieved successfully')
+    @api.response(400, 'Invalid cursor or filter')
+    def get(self):
+        """Retrieve a page of places, optionally filtered and sorted"""
+        args = place_list_parser.parse_args()
+        validators = collection_validators('place', 'place_amenity')
+        if is_not_modified(validators):
+            return not_modified(validators)
+        try:
+            places, next_cursor = facade.get_places_page(
+                *page_args(), min_price=args['min_price'],
+                max_price=args['max_price'], min_rating=args['min_rating'],
+                amenity_ids=[amenity_id for amenity_id
+                             in args['amenities'] or () if amenity_id],
+                sort=args['sort'])
+            return [place.to_dict(raw_datetimes=True)
+                    for place in places], 200, \
+                {**page_headers(next_cursor), **validator_headers(validators)}
+        except ValueError as e:
+            logger.error(f"ValueError: {str(e)}")
+            return {'error': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Exception: {str(e)}")
+            return {'message': str(e)}, 500
+
+
+# Query parameters of the geographic searches
+radius_search_parser = reqparse.RequestParser()
+radius_search_parser.add_argument('lat', type=float, required=True,
+                                  location='args', help='Latitude')
+radius_search_parser.add_argument('lon', type=float, required=True,
+                                  location='args', help='Longitude')
+radius_search_parser.add_argument('radius_km', type=float, required=True,
+                                  location='args',
+                                  help='Search radius in kilometres')
+radius_search_parser.add_argument('limit', type=inputs.positive,
+                                  location='args',
+                                  help='Maximum number of places to return')
+
+box_search_parser = reqparse.RequestParser()
+for name, help_text in (('min_lat', 'Southern latitude'),
+                        ('min_lon', 'Western longitude'),
+                        ('max_lat', 'Northern latitude'),
+                        ('max_lon', 'Eastern longitude, may be lower '
+                                    'than min_lon across the antimeridian')):
+    box_search_parser.add_argument(name, type=float, required=True,
+                                   location='args', help=help_text)
+box_search_parser.add_argument('limit', type=inputs.positive,
+                               location='args',
+                               help='Maximum number of places to return')
+
+
+def validate_coordinates(latitude, longitude):
+    if not -90 <= latitude <= 90:
+        raise ValueError("Latitude is outside the range.")
+    if not -180 <= longitude <= 180:
+        raise ValueError("Longitude is outside the range.")
+
+
+def search_limit(args):
+    return min(args['limit'] or current_app.config.get('PAGE_SIZE', 100),
+               current_app.config.get('MAX_PAGE_SIZE', 1000))
+
+
+@api.route('/search')
+class PlaceRadiusSearch(Resource):
+    @api.expect(radius_search_parser)
+    @api.response(200, 'Places within the radius, nearest first')
+    @api.response(400, 'Invalid search parameters')
+    def get(self):
+        """Find the places within a radius of a coordinate"""
+        args = radius_search_parser.parse_args()
+        max_radius = current_app.config.get('MAX_SEARCH_RADIUS_KM', 500)
+        try:
+            validate_coordinates(args['lat'], args['lon'])
+            if not 0 < args['radius_km'] <= max_radius:
+                raise ValueError(
+                    f"radius_km must be between 0 and {max_radius}.")
+            matches = facade.search_places_by_radius(
+                args['lat'], args['lon'], args['radius_km'],
+                search_limit(args))
+            return [dict(place.to_dict(raw_datetimes=True),
+                         distance_km=round(distance, 3))
+                    for place, distance in matches], 200
+        except ValueError as e:
+            logger.error(f"ValueError: {str(e)}")
+            return {'error': str(e)}, 400
+        except Exception as e:
+            logger.error(f"Exception: {str(e)}")
+            return {'message': str(e)}, 500
+
+
+@api.route('/search/bbox')
+class PlaceBoxSearch(Resource):
+    @api.expect(box_search_parser)
+    @api.response(200, 'Places inside the bounding box')
+    @api.response(400, 'Invalid search parameters')
     def get(self):
-        """Retrieve a list of all places"""
+        """Find the places inside a bounding box"""
+        args = box_search_parser.parse_args()
         try:
-            places = facade.get_all_places()
-            return [place.to_dict() for place in places], 200
+            validate_coordinates(args['min_lat'], args['min_lon'])
+            validate_coordinates(args['max_lat'], args['max_lon'])
+            if args['min_lat'] > args['max_lat']:
+                raise ValueError("min_lat must not exceed max_lat.")
+            places = facade.search_places_by_box(
+                args['min_lat'], args['min_lon'], args['max_lat'],
+                args['max_lon'], search_limit(args))
+            return [place.to_dict(raw_datetimes=True) for place in places], 200
+        except ValueError as e:
+            logger.error(f"ValueError: {str(e)}")
+            return {'error': str(e)}, 400
         except Exception as e:
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500
 
 
+def read_ndjson(stream, chunk_size):
+    """Yield lists of ``(line, record)`` from an NDJSON stream.
+
+    Blank lines are skipped; a line that is not valid JSON is passed on
+    as an error message instead of a record.
+    """
+    chunk = []
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            chunk.append((line_number, json.loads(line)))
+        except ValueError:
+            chunk.append((line_number, 'Invalid JSON'))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@api.route('/bulk')
+class PlaceBulkImport(Resource):
+    @api.doc(description='Body: one place JSON object per line (NDJSON). '
+             'Admins may set owner_id; other users import their own places.')
+    @api.response(200, 'Import finished, see errors for rejected lines')
+    @jwt_required()
+    def post(self):
+        """Create places in bulk from a streamed NDJSON body."""
+        current_user = get_jwt_identity()
+        chunk_size = current_app.config.get('BULK_CHUNK_SIZE', 500)
+        created, errors = 0, []
+
+        for chunk in read_ndjson(request.stream, chunk_size):
+            records = []
+            for line, place_data in chunk:
+                if isinstance(place_data, str):
+                    errors.append({'line': line, 'error': place_data})
+                    continue
+                if isinstance(place_data, dict):
+                    place_data.setdefault('owner_id', current_user['id'])
+                    if place_data['owner_id'] != current_user['id'] and \
+                            not current_user.get('is_admin'):
+                        errors.append({'line': line,
+                                       'error': 'Action not allowed'})
+                        continue
+                records.append((line, place_data))
+            try:
+                chunk_created, chunk_errors = facade.import_places(records)
+            except Exception as e:
+                logger.error(f"Exception: {str(e)}")
+                return {'message': str(e), 'created': created,
+                        'errors': errors}, 500
+            created += chunk_created
+            errors.extend(chunk_errors)
+
+        errors.sort(key=lambda error: error['line'])
+        return {'created': created, 'errors': errors}, 200
+
+
+@api.route('/export')
+class PlaceExport(Resource):
+    @api.response(200, 'NDJSON stream of every place')
+    def get(self):
+        """Stream every place as NDJSON, one object per line."""
+        chunk_size = current_app.config.get('BULK_CHUNK_SIZE', 500)
+
+        def generate():
+            for place_dict in facade.export_places(
+                    chunk_size, raw_datetimes=True):
+                yield encoders.dumps(place_dict) + b'\n'
+
+        return Response(stream_with_context(generate()),
+                        mimetype='application/x-ndjson')
+
+
 @api.route('/<place_id>')
 class PlaceResource(Resource):
     @api.response(200, 'Place details retrieved successfully')
@@ -98,8 +305,12 @@ class PlaceResource(Resource):
             # Fetch place by ID
             place = facade.get_place(place_id)
             if place:
+                validators = resource_validators(place)
+                if is_not_modified(validators):
+                    return not_modified(validators)
                 # Return the place details
-                return {'place': place.to_dict()}, 200
+                return {'place': place.to_dict(raw_datetimes=True)}, 200, \
+                    validator_headers(validators)
             else:
                 # Return not found message
                 return {'message': 'Place not found'}, 404
@@ -131,7 +342,7 @@ class PlaceResource(Resource):
 
             updated_place = facade.update_place(place_id, place_data)
             if updated_place:
-                return updated_place.to_dict(), 200
+                return updated_place.to_dict(raw_datetimes=True), 200
             else:
                 return {'error': 'Place not found'}, 404
 
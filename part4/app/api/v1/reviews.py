@@ -1,6 +1,10 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import hbnb_facade as facade
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.api.v1.pagination import pagination_parser, page_args, page_headers
+from app.api.v1.conditional import (
+    collection_validators, is_not_modified, not_modified,
+    resource_validators, validator_headers)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -79,7 +83,7 @@ class ReviewList(Resource):
             new_review = facade.create_review(data)
             return {
                 'message': 'Review created',
-                'review': new_review.to_dict()
+                'review': new_review.to_dict(raw_datetimes=True)
             }, 201
         except KeyError as e:
             logger.error(f"KeyError: {str(e)}")
@@ -93,14 +97,24 @@ class ReviewList(Resource):
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500
 
+    @api.expect(pagination_parser)
     @api.response(200, 'List of reviews retrieved successfully')
+    @api.response(400, 'Invalid cursor')
     def get(self):
-        """Retrieve a list of all reviews"""
+        """Retrieve a page of reviews"""
+        validators = collection_validators('review')
+        if is_not_modified(validators):
+            return not_modified(validators)
         try:
-            reviews = facade.get_all_reviews()
+            reviews, next_cursor = facade.get_reviews_page(*page_args())
             return {
-                'reviews': [review.to_dict() for review in reviews]
-            }, 200
+                'reviews': [review.to_dict(raw_datetimes=True)
+                            for review in reviews]
+            }, 200, {**page_headers(next_cursor),
+                     **validator_headers(validators)}
+        except ValueError as e:
+            logger.error(f"ValueError: {str(e)}")
+            return {'message': str(e)}, 400
         except Exception as e:
             logger.error(f"Exception: {str(e)}")
             return {'message': str(e)}, 500
@@ -114,7 +128,11 @@ class ReviewResource(Resource):
         try:
             review = facade.get_review(review_id)
             if review:
-                return {'review': review.to_dict()}, 200
+                validators = resource_validators(review)
+                if is_not_modified(validators):
+                    return not_modified(validators)
+                return {'review': review.to_dict(raw_datetimes=True)}, 200, \
+                    validator_headers(validators)
             else:
                 return {'message': 'Review not found'}, 404
         except Exception as e:
@@ -145,7 +163,7 @@ class ReviewResource(Resource):
             if updated_review:
                 return {
                     'message': 'Review updated',
-                    'review': updated_review.to_dict()
+                    'review': updated_review.to_dict(raw_datetimes=True)
                 }, 200
             else:
                 return {'message': 'Review not found'}, 404
@@ -191,12 +209,16 @@ class PlaceReviewList(Resource):
     @api.response(404, 'Place not found or no reviews available')
     def get(self, place_id):
         """Get all reviews for a specific place"""
+        validators = collection_validators('review')
+        if is_not_modified(validators):
+            return not_modified(validators)
         try:
             reviews = facade.get_reviews_by_place(place_id)
             if reviews:
                 return {
-                    'reviews': [review.to_dict() for review in reviews]
-                }, 200
+                    'reviews': [review.to_dict(raw_datetimes=True)
+                                for review in reviews]
+                }, 200, validator_headers(validators)
             else:
                 return {'message': 'Place not found or no reviews available'}, 404
         except Exception as e:
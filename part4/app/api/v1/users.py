@@ -1,6 +1,11 @@
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import hbnb_facade as facade
+from app.services.passwords import PasswordHasherBusy
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.api.v1.pagination import pagination_parser, page_args, page_headers
+from app.api.v1.conditional import (
+    collection_validators, is_not_modified, not_modified,
+    resource_validators, validator_headers)
 
 api = Namespace('users', description='User operations')
 
@@ -41,6 +46,7 @@ class UserList(Resource):
     @api.response(201, 'User successfully created')
     @api.response(400, 'Email already registered')
     @api.response(400, 'Invalid input data')
+    @api.response(503, 'Too many password operations in progress')
     def post(self):
         """
         Create a new user with hashed password.
@@ -50,24 +56,37 @@ class UserList(Resource):
         if existing_user:
             return {'error': 'Email already registered'}, 400
 
-        user = facade.create_user(user_data)
+        try:
+            user = facade.create_user(user_data)
+        except PasswordHasherBusy as e:
+            return {'error': str(e)}, 503, {'Retry-After': '1'}
         if not user:
             return {'error': 'Failed to create user'}, 400
         return {
             'message': 'User created successfully',
-            'user': user.to_dict()
+            'user': user.to_dict(raw_datetimes=True)
         }, 201
 
+    @api.expect(pagination_parser)
     @api.response(200, 'List of users retrieved successfully')
+    @api.response(400, 'Invalid cursor')
     def get(self):
         """
-        Retrieve the list of all users.
+        Retrieve a page of users.
 
-        This method retrieves all registered users and returns their
-        details including `id`, `first_name`, `last_name`, and `email`.
+        Users are ordered by creation date. Pass the `X-Next-Cursor`
+        header of a response as `cursor` to fetch the following page.
         """
-        users = facade.get_all_users()
-        return [user.to_dict() for user in users], 200
+        # Users list the ids of their places
+        validators = collection_validators('user', 'place')
+        if is_not_modified(validators):
+            return not_modified(validators)
+        try:
+            users, next_cursor = facade.get_users_page(*page_args())
+        except ValueError as e:
+            return {'error': str(e)}, 400
+        return [user.to_dict(raw_datetimes=True) for user in users], 200, \
+            {**page_headers(next_cursor), **validator_headers(validators)}
 
 @api.route('/<user_id>')
 class UserResource(Resource):
@@ -84,7 +103,11 @@ class UserResource(Resource):
         user = facade.get_user(user_id)
         if not user:
             return {'error': 'User not found'}, 404
-        return user.to_dict(), 200
+        validators = resource_validators(user)
+        if is_not_modified(validators):
+            return not_modified(validators)
+        return user.to_dict(raw_datetimes=True), 200, \
+            validator_headers(validators)
 
     @api.expect(user_model, validate=True)
     @api.response(200, 'User details updated successfully')
@@ -114,7 +137,7 @@ class UserResource(Resource):
             if 'password' in user_data:
                 return {'error': "You cannot update the password."}, 403
 
-            return updated_user.to_dict(), 200
+            return updated_user.to_dict(raw_datetimes=True), 200
         except ValueError as e:
             return {'error': str(e)}, 400
         except Exception as e:
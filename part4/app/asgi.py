@@ -0,0 +1,326 @@
+"""
+ASGI deployment mode.
+
+``create_asgi_app()`` serves the same ``/api/v1`` contract as the Flask
+app, for an ASGI server such as uvicorn (see ``asgi.py``). GET requests
+on the user, place, amenity and review resources run natively on the
+async engine: a request waiting on the database holds a coroutine
+rather than a thread, so one process keeps thousands of keep-alive
+clients. Every other request (writes, login, geographic search, bulk
+import and export, Swagger) is run by the Flask app on a pool of
+``ASGI_WSGI_THREADS`` threads, and so is any native request the API
+would reject (unknown route, invalid query string), so error responses
+are the Flask ones.
+
+Native views run inside a Flask request context built from the ASGI
+scope: they reuse the request parsers, the conditional GET helpers and
+the JSON representation of the API, and their responses go through the
+``after_request`` hooks of the app (CORS).
+"""
+import asyncio
+import io
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from flask import Response, request
+from werkzeug.exceptions import HTTPException
+from app import create_app
+from app.api.v1.conditional import (
+    collection_validators, is_not_modified, not_modified,
+    resource_validators, validator_headers)
+from app.api.v1.encoders import output_json
+from app.api.v1.pagination import page_args, page_headers
+from app.api.v1.places import place_list_parser
+from app.persistence.async_repository import async_db
+from app.services.async_facade import async_facade as facade
+from app.startup import load_api
+
+logger = logging.getLogger(__name__)
+
+# Flask endpoint -> async view serving its GET requests
+NATIVE_VIEWS = {}
+
+
+def native(endpoint):
+    """Register an async view for the GET requests of ``endpoint``."""
+    def register(view):
+        NATIVE_VIEWS[endpoint] = view
+        return view
+    return register
+
+
+async def collection(*table_names):
+    """Async ``collection_validators``."""
+    return collection_validators(
+        *table_names, versions=await facade.get_versions(table_names))
+
+
+@native('users_user_list')
+async def user_list():
+    validators = await collection('user', 'place')
+    if is_not_modified(validators):
+        return not_modified(validators)
+    try:
+        users, next_cursor = await facade.get_users_page(*page_args())
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    return [user.to_dict(raw_datetimes=True) for user in users], 200, \
+        {**page_headers(next_cursor), **validator_headers(validators)}
+
+
+@native('users_user_resource')
+async def user_resource(user_id):
+    user = await facade.get_user(user_id)
+    if not user:
+        return {'error': 'User not found'}, 404
+    validators = resource_validators(user)
+    if is_not_modified(validators):
+        return not_modified(validators)
+    return user.to_dict(raw_datetimes=True), 200, validator_headers(validators)
+
+
+@native('amenities_amenity_list')
+async def amenity_list():
+    validators = await collection('amenity')
+    if is_not_modified(validators):
+        return not_modified(validators)
+    try:
+        amenities, next_cursor = await facade.get_amenities_page(
+            *page_args())
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    return [amenity.to_dict(raw_datetimes=True)
+            for amenity in amenities], 200, \
+        {**page_headers(next_cursor), **validator_headers(validators)}
+
+
+@native('amenities_amenity_resource')
+async def amenity_resource(amenity_id):
+    amenity = await facade.get_amenity(amenity_id)
+    if not amenity:
+        return {'message': 'Amenity not found'}, 404
+    validators = resource_validators(amenity)
+    if is_not_modified(validators):
+        return not_modified(validators)
+    return {'amenity': amenity.to_dict(raw_datetimes=True)}, 200, \
+        validator_headers(validators)
+
+
+@native('places_place_list')
+async def place_list():
+    args = place_list_parser.parse_args()
+    validators = await collection('place', 'place_amenity')
+    if is_not_modified(validators):
+        return not_modified(validators)
+    try:
+        places, next_cursor = await facade.get_places_page(
+            *page_args(), min_price=args['min_price'],
+            max_price=args['max_price'], min_rating=args['min_rating'],
+            amenity_ids=[amenity_id for amenity_id
+                         in args['amenities'] or () if amenity_id],
+            sort=args['sort'])
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    return [place.to_dict(raw_datetimes=True) for place in places], 200, \
+        {**page_headers(next_cursor), **validator_headers(validators)}
+
+
+@native('places_place_resource')
+async def place_resource(place_id):
+    place = await facade.get_place(place_id)
+    if not place:
+        return {'message': 'Place not found'}, 404
+    validators = resource_validators(place)
+    if is_not_modified(validators):
+        return not_modified(validators)
+    return {'place': place.to_dict(raw_datetimes=True)}, 200, \
+        validator_headers(validators)
+
+
+@native('reviews_review_list')
+async def review_list():
+    validators = await collection('review')
+    if is_not_modified(validators):
+        return not_modified(validators)
+    try:
+        reviews, next_cursor = await facade.get_reviews_page(*page_args())
+    except ValueError as e:
+        return {'message': str(e)}, 400
+    return {'reviews': [review.to_dict(raw_datetimes=True)
+                        for review in reviews]}, 200, \
+        {**page_headers(next_cursor), **validator_headers(validators)}
+
+
+@native('reviews_review_resource')
+async def review_resource(review_id):
+    review = await facade.get_review(review_id)
+    if not review:
+        return {'message': 'Review not found'}, 404
+    validators = resource_validators(review)
+    if is_not_modified(validators):
+        return not_modified(validators)
+    return {'review': review.to_dict(raw_datetimes=True)}, 200, \
+        validator_headers(validators)
+
+
+@native('reviews_place_review_list')
+async def place_review_list(place_id):
+    validators = await collection('review')
+    if is_not_modified(validators):
+        return not_modified(validators)
+    reviews = await facade.get_reviews_by_place(place_id)
+    if not reviews:
+        return {'message': 'Place not found or no reviews available'}, 404
+    return {'reviews': [review.to_dict(raw_datetimes=True)
+                        for review in reviews]}, 200, \
+        validator_headers(validators)
+
+
+def wsgi_environ(scope, body=b''):
+    """Build the WSGI environ of an ASGI HTTP request."""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode().decode('latin1'),
+        'PATH_INFO': scope['path'].encode().decode('latin1'),
+        'QUERY_STRING': scope['query_string'].decode('latin1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope['headers']:
+        name = name.decode('latin1').upper().replace('-', '_')
+        if name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            name = 'HTTP_' + name
+        value = value.decode('latin1')
+        environ[name] = f"{environ[name]},{value}" if name in environ \
+            else value
+    # the body is read in full, whatever the transfer encoding was
+    environ['CONTENT_LENGTH'] = str(len(body))
+    return environ
+
+
+def response_start(status, headers):
+    return {'type': 'http.response.start', 'status': status,
+            'headers': [(name.lower().encode('latin1'), value.encode('latin1'))
+                        for name, value in headers]}
+
+
+class HBnBASGI:
+    """ASGI application wrapping the Flask app, see the module docstring."""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.executor = ThreadPoolExecutor(
+            flask_app.config.get('ASGI_WSGI_THREADS', 10),
+            thread_name_prefix='wsgi')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+        elif scope['type'] == 'http':
+            if scope['method'] != 'GET' or not await self.serve_native(
+                    scope, send):
+                await self.serve_wsgi(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await async_db.dispose()
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def serve_native(self, scope, send):
+        """Answer a GET request with its native view, if it has one.
+
+        Returns False when the Flask app must answer it instead.
+        """
+        try:
+            with self.flask_app.request_context(wsgi_environ(scope)):
+                rule = request.url_rule
+                view = NATIVE_VIEWS.get(rule.endpoint) if rule else None
+                if view is None:
+                    return False
+                try:
+                    rv = await view(**request.view_args)
+                except HTTPException:
+                    return False
+                except Exception as e:
+                    logger.error(f"Exception: {str(e)}")
+                    rv = {'message': str(e)}, 500
+                if not isinstance(rv, Response):
+                    rv = output_json(*rv)
+                response = self.flask_app.process_response(rv)
+        finally:
+            await async_db.remove()
+
+        await send(response_start(response.status_code,
+                                  response.headers.items()))
+        await send({'type': 'http.response.body',
+                    'body': response.get_data()})
+        return True
+
+    async def serve_wsgi(self, scope, receive, send):
+        """Run the request through the Flask app on the thread pool,
+        streaming the response back as it is produced."""
+        body = bytearray()
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+        environ = wsgi_environ(scope, bytes(body))
+        loop = asyncio.get_running_loop()
+
+        def send_from_thread(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        def run():
+            started = {}
+
+            def start_response(status, headers, exc_info=None):
+                started['status'] = int(status.split(' ', 1)[0])
+                started['headers'] = headers
+
+            result = self.flask_app(environ, start_response)
+            try:
+                sent_start = False
+                for chunk in result:
+                    if not sent_start:
+                        send_from_thread(response_start(
+                            started['status'], started['headers']))
+                        sent_start = True
+                    if chunk:
+                        send_from_thread({'type': 'http.response.body',
+                                          'body': chunk, 'more_body': True})
+                if not sent_start:
+                    send_from_thread(response_start(
+                        started['status'], started['headers']))
+                send_from_thread({'type': 'http.response.body', 'body': b''})
+            finally:
+                if hasattr(result, 'close'):
+                    result.close()
+
+        await loop.run_in_executor(self.executor, run)
+
+
+def create_asgi_app(config_class="config.DevelopmentConfig"):
+    """Create the Flask app and its ASGI front end."""
+    flask_app = create_app(config_class)
+    # native views are looked up by the endpoint of the Flask route
+    load_api(flask_app)
+    async_db.init_app(flask_app)
+    return HBnBASGI(flask_app)
@@ -2,6 +2,14 @@ from app.models.BaseModel import BaseModel
 from app.models.user import User
 from app import db
 from app.models.place_amenity import place_amenity
+from app.persistence.geo import grid_cell
+
+
+def grid_cell_default(context):
+    """Column default computing the grid cell of an inserted row."""
+    params = context.get_current_parameters()
+    return grid_cell(params['latitude'], params['longitude'])
+
 
 class Place(BaseModel, db.Model):
     """
@@ -25,6 +33,10 @@ class Place(BaseModel, db.Model):
         Must be a valid User instance.
     - reviews (list): A list to store related reviews.
     - amenities (list): A list to store related amenities.
+    - grid_cell (int): Spatial grid cell of the location, maintained
+        automatically and used by radius and bounding-box searches.
+    - avg_rating (float): Average rating of the reviews, 0 when unrated.
+    - review_count (int): Number of reviews of the place.
     """
     __tablename__ = 'place'
 
@@ -34,6 +46,12 @@ class Place(BaseModel, db.Model):
     latitude = db.Column(db.Float, nullable=False)
     longitude = db.Column(db.Float, nullable=False)
     owner_id = db.Column(db.String(36), db.ForeignKey('user.id'), nullable=False)
+    # Spatial index, see app.persistence.geo
+    grid_cell = db.Column(db.Integer, nullable=False, index=True,
+                          default=grid_cell_default)
+    # Review aggregates, kept up to date through refresh_rating()
+    avg_rating = db.Column(db.Float, nullable=False, default=0.0)
+    review_count = db.Column(db.Integer, nullable=False, default=0)
 
     reviews = db.relationship('Review', backref='place', lazy=True)
     amenities = db.relationship('Amenity', secondary=place_amenity, backref='places', lazy=True)
@@ -68,7 +86,7 @@ class Place(BaseModel, db.Model):
         self.reviews = []
         self.amenities = []
 
-    def to_dict(self):
+    def to_dict(self, raw_datetimes=False):
         """complete method to serialize obj"""
         place_dict = {
             "id": self.id,
@@ -77,18 +95,51 @@ class Place(BaseModel, db.Model):
             "price": self.price,
             "latitude": self.latitude,
             "longitude": self.longitude,
-            "owner_id": self.owner.id,
+            "owner_id": self.owner_id,
             "amenities": [amenity.id for amenity in self.amenities],
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "avg_rating": self.avg_rating,
+            "review_count": self.review_count,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
             "__class__": self.__class__.__name__
         }
+        if not raw_datetimes:
+            place_dict["created_at"] = self.created_at.isoformat()
+            place_dict["updated_at"] = self.updated_at.isoformat()
         return place_dict
 
     def add_review(self, review):
         """Add a review to the place."""
         self.reviews.append(review)
 
+    @staticmethod
+    def rating_aggregates():
+        """Return the ``avg_rating`` and ``review_count`` of the place
+        rows as SQL expressions over the review table."""
+        from app.models.review import Review  # review.py imports Place
+        of_place = Review.place_id == Place.id
+        return {
+            'avg_rating': db.select(
+                db.func.coalesce(db.func.avg(Review.rating), 0.0))
+            .where(of_place).scalar_subquery(),
+            'review_count': db.select(db.func.count(Review.id))
+            .where(of_place).scalar_subquery(),
+        }
+
+    def refresh_rating(self):
+        """Recompute the stored review aggregates from the review table.
+
+        The pending review changes are flushed first. The aggregates are
+        written by one UPDATE over the current rows, so concurrent
+        reviews are not lost, then read back as plain numbers.
+        """
+        db.session.flush()
+        db.session.execute(
+            db.update(Place).where(Place.id == self.id)
+            .values(**Place.rating_aggregates())
+            .execution_options(synchronize_session=False))
+        db.session.refresh(self, ['avg_rating', 'review_count'])
+
     def add_amenity(self, amenity):
         """Add an amenity to the place."""
         self.amenities.append(amenity)
@@ -138,3 +189,16 @@ class Place(BaseModel, db.Model):
             return "Longitude is outside the range."
 
         self.longitude = longitude
+
+
+# Serve range filters and keyset pages sorted by price or rating
+db.Index('ix_place_price_created_at_id',
+         Place.price, Place.created_at, Place.id)
+db.Index('ix_place_avg_rating_created_at_id',
+         Place.avg_rating.desc(), Place.created_at, Place.id)
+
+
+@db.event.listens_for(Place, 'before_update')
+def update_grid_cell(mapper, connection, place):
+    """Keep the grid cell in line with the coordinates."""
+    place.grid_cell = grid_cell(place.latitude, place.longitude)
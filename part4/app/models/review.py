@@ -24,9 +24,11 @@ class Review(BaseModel, db.Model):
     text = db.Column(db.String(1024), nullable=False)
     rating = db.Column(db.Integer, nullable=False)
     user_id = db.Column(db.String(36), db.ForeignKey(
-        'user.id'), nullable=False)
+        'user.id'), nullable=False, index=True)
     place_id = db.Column(db.String(36), db.ForeignKey(
-        'place.id'), nullable=False)
+        'place.id'), nullable=False, index=True)
+
+    user = db.relationship('User', backref='reviews', lazy=True)
 
     def __init__(self, text, rating, place, user):
         """Initialize a Review instance.
@@ -53,18 +55,21 @@ class Review(BaseModel, db.Model):
         self.place = place
         self.user = user
 
-    def to_dict(self):
+    def to_dict(self, raw_datetimes=False):
         """Convert the Review instance to a dictionary."""
         review_dict = {
             'id': self.id,
             'text': self.text,
             'rating': self.rating,
-            'user_id': self.user.id,
-            'place_id': self.place.id,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'user_id': self.user_id,
+            'place_id': self.place_id,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
             '__class__': self.__class__.__name__
         }
+        if not raw_datetimes:
+            review_dict['created_at'] = self.created_at.isoformat()
+            review_dict['updated_at'] = self.updated_at.isoformat()
         return review_dict
 
     def set_text(self, text):
@@ -79,7 +84,6 @@ class Review(BaseModel, db.Model):
         if not isinstance(text, str):
             raise ValueError("The text must be a string.")
         self.text = text
-        self.save()
 
     def set_rating(self, rating):
         """Set the rating of the review.
@@ -95,7 +99,6 @@ class Review(BaseModel, db.Model):
         if rating < 1 or rating > 5:
             raise ValueError("Rating must be between 1 and 5.")
         self.rating = rating
-        self.save()
 
     def update_review(self, review_data):
         """Update the review with the provided data.
@@ -116,7 +119,6 @@ class Review(BaseModel, db.Model):
                 setattr(self, key, value)
             else:
                 raise ValueError(f"Invalid attribute '{key}' for Review")
-        self.save()  # Save the changes after updating
 
     def delete(self):
         """Delete the review instance from the repository."""
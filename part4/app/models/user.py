@@ -1,7 +1,7 @@
 from app import db
 from app.models.BaseModel import BaseModel
 from datetime import datetime
-from flask_bcrypt import generate_password_hash, check_password_hash
+from app.services.passwords import password_hasher
 import re
 
 
@@ -68,9 +68,13 @@ class User(BaseModel, db.Model):
         """
         self.rented_places.append(place)
 
-    def to_dict(self):
+    def to_dict(self, raw_datetimes=False):
         """Convert the User instance to a dictionary.
 
+        Args:
+            raw_datetimes (bool): Keep the timestamps as datetimes, for
+                the API encoders, instead of ISO 8601 strings.
+
         Returns:
             dict: A dictionary representation of the user,
             excluding the password.
@@ -84,9 +88,12 @@ class User(BaseModel, db.Model):
             "is_owner": self.is_owner,
             "owned_places": [place.id for place in self.owned_places],
             "rented_places": [place.id for place in self.rented_places],
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
+        if not raw_datetimes:
+            user_dict["created_at"] = self.created_at.isoformat()
+            user_dict["updated_at"] = self.updated_at.isoformat()
         return user_dict
 
     @staticmethod
@@ -128,10 +135,14 @@ class User(BaseModel, db.Model):
     def set_password(self, password):
         """Set the user's password after hashing it."""
         if password:
-            self.password = generate_password_hash(password).decode('utf-8')
+            self.password = password_hasher.hash(password)
         else:
             raise ValueError("Password is required")
 
     def verify_password(self, password):
         """Check if the provided password matches the user's hashed password"""
-        return check_password_hash(self.password, password)
+        return password_hasher.verify(self.password, password)
+
+    def password_needs_rehash(self):
+        """Tell whether the stored hash uses an outdated work factor."""
+        return password_hasher.needs_rehash(self.password)
@@ -0,0 +1,121 @@
+"""
+Engine configuration.
+
+``configure_engine(app)`` runs before ``db.init_app``: it picks the
+database URI (``SQLALCHEMY_DATABASE_URI``, then ``DATABASE_URL``, then
+the local SQLite file) and derives the engine options from the ``DB_*``
+settings, plus one ``replica_<n>`` bind per ``DATABASE_REPLICA_URLS``
+entry. ``apply_pragmas(app)`` runs after it and makes every SQLite
+connection use WAL, so readers no longer wait for writers, with a busy
+timeout instead of immediate "database is locked" errors.
+"""
+import logging
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from app import db
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATABASE_URI = 'sqlite:///hbnb_database.db'
+# Bind keys of the read replicas, see app.persistence.replicas
+REPLICA_BIND_PREFIX = 'replica_'
+
+
+def database_uri(config):
+    """Return the database URI selected by the configuration."""
+    uri = config.get('SQLALCHEMY_DATABASE_URI') or \
+        config.get('DATABASE_URL') or DEFAULT_DATABASE_URI
+    # Heroku-style URLs use a scheme SQLAlchemy no longer accepts
+    if uri.startswith('postgres://'):
+        uri = 'postgresql://' + uri[len('postgres://'):]
+    return uri
+
+
+def is_sqlite(uri):
+    return make_url(uri).get_backend_name() == 'sqlite'
+
+
+def engine_options(config, uri):
+    """Build ``SQLALCHEMY_ENGINE_OPTIONS`` for ``uri``."""
+    options = dict(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    if is_sqlite(uri):
+        # sqlite3's own lock timeout, in seconds; PRAGMA busy_timeout
+        # below sets the same limit at the SQLite level
+        connect_args = options.setdefault('connect_args', {})
+        connect_args.setdefault(
+            'timeout', config.get('SQLITE_BUSY_TIMEOUT_MS', 5000) / 1000)
+        return options
+    options.setdefault('pool_size', config.get('DB_POOL_SIZE', 10))
+    options.setdefault('max_overflow', config.get('DB_MAX_OVERFLOW', 20))
+    options.setdefault('pool_timeout', config.get('DB_POOL_TIMEOUT', 30))
+    options.setdefault('pool_recycle', config.get('DB_POOL_RECYCLE', 1800))
+    options.setdefault('pool_pre_ping', True)
+    return options
+
+
+def configure_engine(app):
+    """Set the database URI, replica binds and engine options of ``app``."""
+    uri = database_uri(app.config)
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config, uri)
+    binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+    for index, replica_uri in enumerate(
+            app.config.get('DATABASE_REPLICA_URLS') or ()):
+        binds[f'{REPLICA_BIND_PREFIX}{index}'] = database_uri(
+            {'DATABASE_URL': replica_uri})
+    app.config['SQLALCHEMY_BINDS'] = binds
+
+
+def sqlite_pragmas(config):
+    """Return the PRAGMA statements run on each new SQLite connection."""
+    return [
+        f"PRAGMA journal_mode={config.get('SQLITE_JOURNAL_MODE', 'WAL')}",
+        f"PRAGMA synchronous={config.get('SQLITE_SYNCHRONOUS', 'NORMAL')}",
+        f"PRAGMA busy_timeout={int(config.get('SQLITE_BUSY_TIMEOUT_MS', 5000))}",
+        f"PRAGMA mmap_size={int(config.get('SQLITE_MMAP_SIZE', 0))}",
+    ]
+
+
+def install_pragmas(engine, config):
+    """Run the SQLite pragmas on every new connection of ``engine``."""
+    pragmas = sqlite_pragmas(config)
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def apply_pragmas(app):
+    """Install the SQLite pragmas and log the effective settings.
+
+    Must run inside an application context, after ``db.init_app``.
+    """
+    engine = db.engine
+    url = engine.url.render_as_string(hide_password=True)
+    if engine.dialect.name != 'sqlite':
+        pool = engine.pool
+        logger.info("Database %s: pool_size=%s max_overflow=%s "
+                    "pool_timeout=%s", url, pool.size(),
+                    getattr(pool, '_max_overflow', None),
+                    getattr(pool, '_timeout', None))
+        return
+
+    install_pragmas(engine, app.config)
+    with engine.connect() as connection:
+        settings = {name: connection.exec_driver_sql(
+                        f"PRAGMA {name}").scalar()
+                    for name in ('journal_mode', 'synchronous',
+                                 'busy_timeout', 'mmap_size')}
+    logger.info("Database %s: %s", url, ' '.join(
+        f"{name}={value}" for name, value in settings.items()))
+
+
+def log_replicas():
+    """Log the replicas reads are routed to, if any."""
+    for key, engine in db.engines.items():
+        if key and key.startswith(REPLICA_BIND_PREFIX):
+            logger.info("Read replica %s",
+                        engine.url.render_as_string(hide_password=True))
@@ -0,0 +1,52 @@
+"""
+Transaction scoping for the persistence layer.
+
+Repositories and models never call ``db.session.commit()`` directly but
+go through ``commit()``. Inside a ``unit_of_work()`` block those commits
+are deferred, so a whole batch of facade operations is written in a
+single transaction when the outermost block exits.
+"""
+from contextlib import contextmanager
+from sqlalchemy.exc import SQLAlchemyError
+from app import db
+
+_DEPTH_KEY = 'unit_of_work_depth'
+
+
+def in_unit_of_work():
+    """Return True while a unit of work is open on the current session."""
+    return db.session.info.get(_DEPTH_KEY, 0) > 0
+
+
+def commit():
+    """Commit the session, unless a unit of work will commit it later."""
+    if not in_unit_of_work():
+        db.session.commit()
+
+
+@contextmanager
+def unit_of_work():
+    """Group every write made inside the block into one transaction.
+
+    Blocks can be nested; only the outermost one commits. Any exception
+    rolls the whole transaction back and is re-raised.
+    """
+    from app.persistence.repository import RepositoryException
+
+    session = db.session
+    session.info[_DEPTH_KEY] = session.info.get(_DEPTH_KEY, 0) + 1
+    try:
+        yield session
+    except Exception:
+        session.info[_DEPTH_KEY] -= 1
+        if not session.info[_DEPTH_KEY]:
+            session.rollback()
+        raise
+    session.info[_DEPTH_KEY] -= 1
+    if not session.info[_DEPTH_KEY]:
+        try:
+            session.commit()
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise RepositoryException(
+                f"Error committing unit of work: {str(e)}")
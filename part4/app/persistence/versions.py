@@ -0,0 +1,69 @@
+"""
+Per-table version counters.
+
+Every flush bumps the counters of the tables it wrote to, in the same
+transaction; bulk statements sent through ``Session.execute`` (bulk
+imports, aggregate rebuilds) bump the table they target. Collection
+endpoints turn the counters into validators for conditional GETs.
+"""
+from datetime import datetime
+from sqlalchemy import inspect, insert, select, update
+from app import db
+from app.models.table_version import TableVersion
+
+versions = TableVersion.__table__
+
+
+def bump_versions(session, table_names):
+    """Increment the counters of ``table_names`` on the session's
+    connection, inside the current transaction."""
+    table_names = set(table_names) - {versions.name}
+    if table_names:
+        session.connection().execute(
+            update(versions)
+            .where(versions.c.name.in_(table_names))
+            .values(version=versions.c.version + 1,
+                    updated_at=datetime.utcnow()))
+
+
+def versions_query(table_names):
+    return select(versions.c.name, versions.c.version,
+                  versions.c.updated_at).where(versions.c.name.in_(table_names))
+
+
+def versions_by_name(rows, table_names):
+    """Map the rows of ``versions_query`` to ``{table_name: (version,
+    updated_at)}``. Tables without a counter row are at version 0."""
+    found = {name: (version, updated_at) for name, version, updated_at in rows}
+    return {name: found.get(name, (0, None)) for name in table_names}
+
+
+def get_versions(table_names):
+    """Return ``{table_name: (version, updated_at)}``."""
+    rows = db.session.execute(versions_query(table_names))
+    return versions_by_name(rows, table_names)
+
+
+def ensure_versions():
+    """Create the missing counter rows, one per table of the schema."""
+    existing = set(db.session.scalars(select(versions.c.name)))
+    missing = [{'name': name, 'version': 0, 'updated_at': datetime.utcnow()}
+               for name in db.metadata.tables if name not in existing]
+    if missing:
+        db.session.execute(insert(versions), missing)
+        db.session.commit()
+
+
+@db.event.listens_for(db.session, 'after_flush')
+def bump_flushed_tables(session, flush_context):
+    tables = {inspect(obj).mapper.local_table.name
+              for obj in (*session.new, *session.dirty, *session.deleted)}
+    bump_versions(session, tables)
+
+
+@db.event.listens_for(db.session, 'do_orm_execute')
+def bump_bulk_statement_table(execute_state):
+    if execute_state.is_insert or execute_state.is_update \
+            or execute_state.is_delete:
+        bump_versions(execute_state.session,
+                      [execute_state.statement.table.name])
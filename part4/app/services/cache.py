@@ -0,0 +1,197 @@
+"""
+Read-through cache in front of the facade getters.
+
+Entries are snapshots of an object's column values rather than ORM
+instances, so they outlive the session that loaded them and can be
+stored in a shared backend. A hit rebuilds the instance and attaches it
+to the current session without querying the database; relationships
+still load lazily when accessed.
+
+Lookups go through an in-process LRU, or through the shared backend
+(Redis when ``CACHE_REDIS_URL`` is set) when there is one: an
+invalidation cannot reach the LRUs of the other processes, so with
+several workers only the shared backend is consistent. The facade
+invalidates entries from its own create/update/delete methods, and
+loads the objects it writes from the database, never from the cache.
+"""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from app import db
+
+
+class LRUCache:
+    """Thread-safe LRU mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, max_size=1024, ttl=60, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the value stored under ``key``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store ``value``, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (value, self.clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Shared backend keeping pickled snapshots in Redis."""
+
+    def __init__(self, url, ttl, prefix='hbnb:cache:'):
+        import redis  # optional dependency, only needed for a shared cache
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        data = self.client.get(self.prefix + key)
+        return None if data is None else pickle.loads(data)
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=self.ttl)
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        for key in self.client.scan_iter(self.prefix + '*'):
+            self.client.delete(key)
+
+
+def snapshot(obj):
+    """Return the column values of ``obj`` as a plain dict."""
+    return {attr.key: getattr(obj, attr.key)
+            for attr in inspect(obj).mapper.column_attrs}
+
+
+def restore(model, values):
+    """Attach the ``model`` instance described by ``values`` to the
+    current session, without querying the database."""
+    mapper = inspect(model)
+    identity = mapper.identity_key_from_primary_key(
+        [values[mapper.get_property_by_column(column).key]
+         for column in mapper.primary_key])
+    obj = db.session.identity_map.get(identity)
+    if obj is not None:
+        return obj
+    obj = mapper.class_manager.new_instance()
+    for key, value in values.items():
+        set_committed_value(obj, key, value)
+    make_transient_to_detached(obj)
+    db.session.add(obj)
+    return obj
+
+
+class FacadeCache:
+    """Two-level read-through cache of model instances keyed by id."""
+
+    def __init__(self):
+        self.enabled = True
+        self.local = LRUCache()
+        self.shared = None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app, shared=None):
+        """Configure the cache from ``app.config`` and empty it.
+
+        ``shared`` replaces the backend built from ``CACHE_REDIS_URL``;
+        any object with ``get``/``set``/``delete``/``clear`` will do.
+        """
+        ttl = app.config.get('CACHE_TTL', 60)
+        self.enabled = app.config.get('CACHE_ENABLED', True)
+        self.local = LRUCache(app.config.get('CACHE_MAX_SIZE', 1024), ttl)
+        if shared is None and app.config.get('CACHE_REDIS_URL'):
+            shared = RedisBackend(app.config['CACHE_REDIS_URL'], ttl)
+        self.shared = shared
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(model, obj_id):
+        return f"{model.__name__}:{obj_id}"
+
+    def get(self, model, obj_id, loader):
+        """Return the ``model`` instance with ``obj_id``, calling
+        ``loader(obj_id)`` on a miss. Missing objects are not cached."""
+        if not self.enabled or obj_id is None:
+            return loader(obj_id)
+        key = self.key(model, obj_id)
+        store = self.local if self.shared is None else self.shared
+        values = store.get(key)
+        if values is not None:
+            self._count('hits')
+            return restore(model, values)
+
+        self._count('misses')
+        obj = loader(obj_id)
+        if obj is not None:
+            store.set(key, snapshot(obj))
+        return obj
+
+    def invalidate(self, model, *obj_ids):
+        """Drop the cached ``model`` instances with the given ids."""
+        for obj_id in obj_ids:
+            key = self.key(model, obj_id)
+            self.local.delete(key)
+            if self.shared is not None:
+                self.shared.delete(key)
+
+    def clear(self):
+        self.local.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def stats(self):
+        """Return the hit, miss and eviction counters."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.local.evictions,
+            'expirations': self.local.expirations,
+            'size': len(self.local),
+        }
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+cache = FacadeCache()
@@ -1,10 +1,36 @@
+import uuid
+from app.persistence import geo
 from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.place_repository import PLACE_SORTS, PlaceRepository
+from app.persistence.loading import load_profile
+from app.persistence.unit_of_work import unit_of_work
+from app.services.cache import cache
 from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
 from app.models.review import Review
 
 
+# Fields accepted by import_places; exported fields are ignored so that
+# the output of export_places can be imported again.
+PLACE_IMPORT_FIELDS = ('title', 'description', 'price', 'latitude',
+                       'longitude', 'owner_id', 'amenities')
+PLACE_EXPORT_ONLY_FIELDS = ('id', 'created_at', 'updated_at', '__class__',
+                            'avg_rating', 'review_count')
+
+# Places read per requested result, per query of search_places_by_radius
+RADIUS_CANDIDATES = 4
+
+
+def check_place_filters(min_price, max_price, sort):
+    """Reject inconsistent place listing filters with a ValueError."""
+    if sort is not None and sort not in PLACE_SORTS:
+        raise ValueError(f"Invalid sort '{sort}'")
+    if min_price is not None and max_price is not None \
+            and min_price > max_price:
+        raise ValueError("min_price cannot exceed max_price")
+
+
 class HBnBFacade:
     """Facade for managing users and places in the HBnB application.
 
@@ -18,9 +44,21 @@ class HBnBFacade:
         Initialize the HBnBFacade with SQLAlchemy repositories.
         """
         self.user_repository = SQLAlchemyRepository(User)
-        self.place_repository = SQLAlchemyRepository(Place)
+        self.place_repository = PlaceRepository()
         self.review_repository = SQLAlchemyRepository(Review)
         self.amenity_repository = SQLAlchemyRepository(Amenity)
+        self.cache = cache
+
+    def unit_of_work(self):
+        """Defer every commit made inside the block to a single one.
+
+        Usage::
+
+            with facade.unit_of_work():
+                facade.create_amenity(...)
+                facade.create_place(...)
+        """
+        return unit_of_work()
 
     def create_user(self, user_data):
         """Create a new user with the provided data."""
@@ -30,11 +68,16 @@ class HBnBFacade:
 
     def get_user(self, user_id):
         """Retrieve a user by their unique ID."""
-        return self.user_repository.get(user_id)
+        return self.cache.get(User, user_id, self.user_repository.get)
 
     def get_all_users(self):
         """Retrieve all users in the repository."""
-        return self.user_repository.get_all()
+        return self.user_repository.get_all(load_profile('user_list'))
+
+    def get_users_page(self, limit, cursor=None):
+        """Retrieve one page of users and the cursor of the next one."""
+        return self.user_repository.get_page(
+            limit, cursor, load_profile('user_list'))
 
     def get_user_by_email(self, email):
         """Retrieve a user by their email address."""
@@ -42,20 +85,29 @@ class HBnBFacade:
 
     def update_user(self, user_id, user_data):
         """Update an existing user with new data."""
-        user = self.get_user(user_id)
+        user = self.user_repository.get_for_update(user_id)
         if user:
             for key, value in user_data.items():
                 setattr(user, key, value)
             self.user_repository.update(user_id, user_data)
+            self.cache.invalidate(User, user_id)
             return user
         return None
 
     def authenticate_user(self, email, password):
-        """Authenticate a user by checking their email and password."""
+        """Authenticate a user by checking their email and password.
+
+        A hash made with an outdated work factor is replaced by one
+        using the current factor while the plain password is at hand.
+        """
         user = self.user_repository.get_by_attribute('email', email)
-        if user and user.check_password(password):
-            return user
-        return None
+        if not user or not user.verify_password(password):
+            return None
+        if user.password_needs_rehash():
+            user.set_password(password)
+            self.user_repository.update(user.id, {})
+            self.cache.invalidate(User, user.id)
+        return user
 
     def create_place(self, place_data):
         """Create a new place associated with an owner and amenities."""
@@ -82,15 +134,180 @@ class HBnBFacade:
 
     def get_place(self, place_id):
         """Retrieve a place by its unique ID."""
-        return self.place_repository.get(place_id)
+        return self.cache.get(Place, place_id, self.place_repository.get)
 
     def get_all_places(self):
         """Retrieve all places."""
-        return self.place_repository.get_all()
+        return self.place_repository.get_all(load_profile('place_list'))
+
+    def get_places_page(self, limit, cursor=None, min_price=None,
+                        max_price=None, min_rating=None, amenity_ids=(),
+                        sort=None):
+        """Retrieve one page of places and the cursor of the next one.
+
+        Places can be filtered on a price range, a minimum average
+        rating and a set of amenities they must all offer, and sorted
+        with one of ``price``, ``-price`` or ``rating``.
+        """
+        check_place_filters(min_price, max_price, sort)
+        return self.place_repository.search_page(
+            limit, cursor, min_price=min_price, max_price=max_price,
+            min_rating=min_rating, amenity_ids=amenity_ids, sort=sort,
+            options=load_profile('place_list'))
+
+    def search_places_by_radius(self, latitude, longitude, radius_km,
+                                limit):
+        """Find the places within ``radius_km`` of a coordinate.
+
+        Returns:
+            list: Up to ``limit`` ``(place, distance_km)`` tuples, nearest
+                first.
+        """
+        boxes = geo.radius_boxes(latitude, longitude, radius_km)
+        order = geo.NearestOrder(latitude, longitude, boxes)
+        batch = limit * RADIUS_CANDIDATES
+        matches, offset = [], 0
+        while True:
+            candidates = self.place_repository.find_in_boxes(
+                boxes, limit=batch, near=order, offset=offset)
+            for place in candidates:
+                distance = geo.haversine_km(latitude, longitude,
+                                            place.latitude, place.longitude)
+                if distance <= radius_km:
+                    matches.append((place, distance))
+            matches.sort(key=lambda match: match[1])
+            del matches[limit:]
+            if len(candidates) < batch:
+                break
+            # The places not read yet are at least this far away
+            last = candidates[-1]
+            nearest = order.lower_bound_km(order.key(last.latitude,
+                                                     last.longitude))
+            if nearest > radius_km or \
+                    len(matches) == limit and nearest >= matches[-1][1]:
+                break
+            offset += batch
+        self.place_repository.preload([place for place, _ in matches],
+                                      load_profile('place_list'))
+        return matches
+
+    def search_places_by_box(self, min_lat, min_lon, max_lat, max_lon,
+                             limit):
+        """Find the places inside a bounding box.
+
+        A box whose ``min_lon`` is greater than its ``max_lon`` crosses
+        the antimeridian.
+        """
+        boxes = geo.split_box(min_lat, max_lat, min_lon, max_lon)
+        return self.place_repository.find_in_boxes(
+            boxes, load_profile('place_list'), limit)
+
+    def import_places(self, records):
+        """Create places in bulk from ``(line, place_data)`` records.
+
+        Owners and amenities are resolved with one IN query each and
+        valid places are inserted in a single transaction. Invalid
+        records are skipped and reported.
+
+        Returns:
+            tuple: The number of places created and a list of
+                ``{'line': ..., 'error': ...}`` dicts.
+        """
+        rows, errors = [], []
+        for line, place_data in records:
+            try:
+                rows.append((line, self._place_row(place_data)))
+            except ValueError as e:
+                errors.append({'line': line, 'error': str(e)})
+
+        owner_ids = self.user_repository.get_existing_ids(
+            {row['owner_id'] for _, row in rows})
+        amenity_ids = self.amenity_repository.get_existing_ids(
+            {amenity_id for _, row in rows for amenity_id in row['amenities']})
+
+        places, links = [], []
+        for line, row in rows:
+            missing = [a for a in row['amenities'] if a not in amenity_ids]
+            if row['owner_id'] not in owner_ids:
+                errors.append({'line': line, 'error': "Owner not found"})
+            elif missing:
+                errors.append({'line': line, 'error':
+                               f"Amenity with ID '{missing[0]}' not found"})
+            else:
+                links.extend({'place_id': row['id'], 'amenity_id': amenity_id}
+                             for amenity_id in row.pop('amenities'))
+                places.append(row)
+
+        with unit_of_work():
+            self.place_repository.add_mappings(places)
+            self.place_repository.add_amenity_links(links)
+        errors.sort(key=lambda error: error['line'])
+        return len(places), errors
+
+    def export_places(self, chunk_size, raw_datetimes=False):
+        """Yield every place as a dict shaped like ``Place.to_dict()``.
+
+        Places are read from a streaming cursor ``chunk_size`` rows at a
+        time, with one query per chunk for their amenity ids.
+        """
+        for chunk in self.place_repository.iter_rows(chunk_size):
+            amenity_ids = self.place_repository.get_amenity_ids(
+                [row['id'] for row in chunk])
+            for row in chunk:
+                place_dict = dict(row)
+                place_dict.pop('grid_cell')
+                place_dict['amenities'] = amenity_ids[row['id']]
+                if not raw_datetimes:
+                    place_dict['created_at'] = row['created_at'].isoformat()
+                    place_dict['updated_at'] = row['updated_at'].isoformat()
+                place_dict['__class__'] = Place.__name__
+                yield place_dict
+
+    @staticmethod
+    def _place_row(place_data):
+        """Validate imported place data and build its table row."""
+        if not isinstance(place_data, dict):
+            raise ValueError("place_data must be a dictionary")
+
+        for key in place_data:
+            if key not in PLACE_IMPORT_FIELDS + PLACE_EXPORT_ONLY_FIELDS:
+                raise ValueError(f"Invalid attribute '{key}' for Place")
+        for key in ('title', 'price', 'latitude', 'longitude', 'owner_id'):
+            if key not in place_data:
+                raise ValueError(f"Missing required field: '{key}'")
+
+        title = place_data['title']
+        if not isinstance(title, str) or len(title) > 100:
+            raise ValueError("The title must be a string of at most "
+                             "100 characters.")
+        description = place_data.get('description')
+        if description is not None and not isinstance(description, str):
+            raise ValueError("The description must be a string.")
+        for key in ('price', 'latitude', 'longitude'):
+            value = place_data[key]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"The {key} must be a number.")
+        if place_data['price'] <= 0:
+            raise ValueError("The price must be positive and not zero.")
+        if not -90 <= place_data['latitude'] <= 90:
+            raise ValueError("Latitude is outside the range.")
+        if not -180 <= place_data['longitude'] <= 180:
+            raise ValueError("Longitude is outside the range.")
+        if not isinstance(place_data['owner_id'], str):
+            raise ValueError("The owner_id must be a string.")
+        amenities = place_data.get('amenities', [])
+        if not isinstance(amenities, list) or \
+                not all(isinstance(a, str) for a in amenities):
+            raise ValueError("amenities must be a list of amenity IDs")
+
+        row = {key: place_data.get(key) for key in PLACE_IMPORT_FIELDS}
+        row['id'] = str(uuid.uuid4())
+        row['amenities'] = list(dict.fromkeys(amenities))
+        return row
 
     def update_place(self, place_id, place_data):
         """Update an existing place's information."""
-        place = self.get_place(place_id)
+        place = self.place_repository.get_for_update(place_id)
         if place:
             if not isinstance(place_data, dict):
                 raise ValueError("place_data must be a dictionary")
@@ -107,6 +324,7 @@ class HBnBFacade:
                 else:
                     raise ValueError(f"Invalid attribute '{key}' for Place")
             self.place_repository.update(place_id, place_data)
+            self.cache.invalidate(Place, place_id)
             return place
         return None
 
@@ -131,14 +349,20 @@ class HBnBFacade:
         Returns:
             Amenity: The Amenity instance if found, otherwise None.
         """
-        return self.amenity_repository.get(amenity_id)
+        return self.cache.get(Amenity, amenity_id,
+                              self.amenity_repository.get)
 
     def get_all_amenities(self):
         """Retrieve all amenities in the repository.
         Returns:
             list: A list of Amenity instances.
         """
-        return self.amenity_repository.get_all()
+        return self.amenity_repository.get_all(load_profile('amenity_list'))
+
+    def get_amenities_page(self, limit, cursor=None):
+        """Retrieve one page of amenities and the cursor of the next one."""
+        return self.amenity_repository.get_page(
+            limit, cursor, load_profile('amenity_list'))
 
     def update_amenity(self, amenity_id, amenity_data):
         """
@@ -155,7 +379,7 @@ class HBnBFacade:
                 not a dictionary or if it
                         contains invalid fields.
         """
-        amenity = self.amenity_repository.get(amenity_id)
+        amenity = self.amenity_repository.get_for_update(amenity_id)
 
         if not amenity:
             return None
@@ -164,11 +388,13 @@ class HBnBFacade:
             raise ValueError("amenity_data must be a dictionary")
 
         for key, value in amenity_data.items():
-            if hasattr(amenity, key):
-                # Update the attribute with the new value
-                setattr(amenity, key, value)
-            else:
+            if key == 'name':
+                Amenity.validate_name(value)
+            elif not hasattr(amenity, key):
                 raise ValueError(f"Invalid attribute '{key}' for Amenity")
+        # The repository applies the changes and commits them once
+        self.amenity_repository.update(amenity_id, amenity_data)
+        self.cache.invalidate(Amenity, amenity_id)
         return amenity
 
     def delete_amenity(self, amenity_id):
@@ -179,6 +405,7 @@ class HBnBFacade:
             bool: True if the amenity was successfully deleted,
                 otherwise False.
         """
+        self.cache.invalidate(Amenity, amenity_id)
         return self.amenity_repository.delete(amenity_id)
 
     def create_review(self, review_data):
@@ -194,7 +421,10 @@ class HBnBFacade:
                 place=place,
                 user=user
             )
-            self.review_repository.add(review)
+            with unit_of_work():
+                self.review_repository.add(review)
+                place.refresh_rating()
+            self.cache.invalidate(Place, place.id)
             return review
         except KeyError as e:
             raise ValueError(f"Missing required field: {str(e)}")
@@ -203,18 +433,24 @@ class HBnBFacade:
 
     def get_review(self, review_id):
         """Retrieve a review by its unique ID."""
-        return self.review_repository.get(review_id)
+        return self.cache.get(Review, review_id, self.review_repository.get)
 
     def get_all_reviews(self):
         """Retrieve all reviews in the repository."""
-        return self.review_repository.get_all()
+        return self.review_repository.get_all(load_profile('review_list'))
+
+    def get_reviews_page(self, limit, cursor=None):
+        """Retrieve one page of reviews and the cursor of the next one."""
+        return self.review_repository.get_page(
+            limit, cursor, load_profile('review_list'))
 
     def update_review(self, review_id, review_data):
         """Update an existing review with new data."""
-        review = self.get_review(review_id)
+        review = self.review_repository.get_for_update(review_id)
         if review:
             if not isinstance(review_data, dict):
                 raise ValueError("review_data must be a dictionary")
+            old_place, old_rating = review.place, review.rating
 
             for key, value in review_data.items():
                 if key in ['text', 'rating']:
@@ -233,20 +469,51 @@ class HBnBFacade:
                         raise ValueError(f"Place with ID '{value}' not found")
                 else:
                     raise ValueError(f"Invalid attribute '{key}' for Review")
-            self.review_repository.update(review_id, review_data)
+            with unit_of_work():
+                self.review_repository.update(review_id, review_data)
+                if review.place is not old_place:
+                    old_place.refresh_rating()
+                    review.place.refresh_rating()
+                elif review.rating != old_rating:
+                    old_place.refresh_rating()
+            self.cache.invalidate(Review, review_id)
+            self.cache.invalidate(Place, old_place.id, review.place_id)
             return review
         return None
 
     def delete_review(self, review_id):
         """Delete a review by its unique ID."""
-        return self.review_repository.delete(review_id)
+        review = self.review_repository.get_for_update(review_id)
+        if not review:
+            return False
+        place = review.place
+        place_id = place.id
+        with unit_of_work():
+            deleted = self.review_repository.delete(review_id)
+            place.refresh_rating()
+        self.cache.invalidate(Review, review_id)
+        self.cache.invalidate(Place, place_id)
+        return deleted
+
+    def rebuild_rating_aggregates(self):
+        """Recompute the rating aggregates of every place from scratch.
+
+        Returns:
+            int: The number of places updated.
+        """
+        updated = self.place_repository.rebuild_rating_aggregates()
+        self.cache.clear()
+        return updated
 
     def get_reviews_by_place(self, place_id):
         """Get all reviews associated with a specific place."""
-        return [
-            review for review in self.review_repository.get_all()
-            if review.place.id == place_id
-        ]
+        return self.review_repository.get_all_by_attribute(
+            'place_id', place_id, load_profile('review_list'))
+
+    def get_review_by_user_and_place(self, user_id, place_id):
+        """Retrieve the review a user wrote for a place, if any."""
+        return self.review_repository.get_by_attributes(
+            {'user_id': user_id, 'place_id': place_id})
 
 
 hbnb_facade = HBnBFacade()
@@ -0,0 +1,93 @@
+"""
+Authenticated principal of the current request.
+
+flask-jwt-extended decodes and validates the token again on every
+``verify_jwt_in_request``: once for ``jwt_required`` and once more for
+each repository read routed by app.persistence.replicas. Handlers that
+need the user behind the token then load it from the database.
+
+``request_claims`` decodes the token at most once per request, reusing
+the claims ``jwt_required`` already stored. ``principals.current()``
+returns the claims of the user (``PRINCIPAL_FIELDS``), memoized on
+``flask.g`` for the request and kept process-wide for
+``PRINCIPAL_CACHE_TTL`` seconds keyed by the token ``jti``: a client
+reusing its token costs no user query after its first request. Changes
+to the user show up once the entry expires.
+"""
+from flask import current_app, g, has_request_context
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+from app.services.cache import LRUCache
+
+PRINCIPAL_FIELDS = ('id', 'email', 'first_name', 'last_name', 'is_admin')
+
+
+def request_claims():
+    """Return the claims of the request token, or None when there is no
+    valid one. The token is decoded at most once per request."""
+    if not has_request_context():
+        return None
+    if 'hbnb_claims' not in g:
+        try:
+            claims = get_jwt()
+        except RuntimeError:  # not verified by jwt_required
+            try:
+                verify_jwt_in_request(optional=True)
+                claims = get_jwt()
+            except Exception:
+                claims = None
+        g.hbnb_claims = claims or None
+    return g.hbnb_claims
+
+
+def request_identity():
+    """Return the identity of the request token, or None."""
+    claims = request_claims()
+    if claims is None:
+        return None
+    return claims.get(current_app.config.get('JWT_IDENTITY_CLAIM', 'sub'))
+
+
+class Principals:
+    """Process-wide cache of user claims keyed by token ``jti``."""
+
+    def __init__(self):
+        self.cache = LRUCache(4096, 30)
+
+    def init_app(self, app):
+        self.cache = LRUCache(app.config.get('PRINCIPAL_CACHE_SIZE', 4096),
+                              app.config.get('PRINCIPAL_CACHE_TTL', 30))
+
+        @app.before_request
+        def forget_previous_token():
+            # g outlives the request when the app context was pushed
+            # beforehand (tests, CLI): drop what an earlier one decoded
+            for key in ('_jwt_extended_jwt', 'hbnb_claims', 'hbnb_principal'):
+                g.pop(key, None)
+
+    def current(self):
+        """Return the claims of the user making the request, or None for
+        an anonymous request or a user that no longer exists."""
+        if 'hbnb_principal' not in g:
+            g.hbnb_principal = self._load()
+        return g.hbnb_principal
+
+    def _load(self):
+        claims = request_claims()
+        identity = request_identity()
+        if not isinstance(identity, dict) or 'id' not in identity:
+            return None
+        jti = claims.get('jti')
+        principal = self.cache.get(jti) if jti else None
+        if principal is None:
+            from app.services.facade import hbnb_facade
+            user = hbnb_facade.get_user(identity['id'])
+            if user is None:
+                return None
+            principal = {field: getattr(user, field)
+                         for field in PRINCIPAL_FIELDS}
+            if jti:
+                self.cache.set(jti, principal)
+        return principal
+
+
+principals = Principals()
@@ -0,0 +1,206 @@
+"""
+Rate limiting of the login attempts.
+
+Every login runs a user lookup and a bcrypt verification, so a client
+replaying leaked credentials costs a hash per attempt. ``login_limiter``
+counts the attempts by client IP and by email and turns away those over
+the limit before either runs; the API answers 429 with ``Retry-After``.
+
+Counts are sliding-window estimates: the count of the current fixed
+window plus the count of the previous one weighted by how much of it is
+still inside the window. Two integers per key, no timestamps per hit.
+
+Settings:
+
+* ``LOGIN_RATE_WINDOW``          window length, in seconds.
+* ``LOGIN_RATE_LIMIT_PER_IP``    attempts per window from a client IP.
+* ``LOGIN_RATE_LIMIT_PER_EMAIL`` attempts per window on an account; a
+  successful login starts its count again. None disables a limit.
+* ``RATE_LIMIT_REDIS_URL``       counts shared by all the processes,
+  instead of a count per process.
+
+Behind a reverse proxy, ``request.remote_addr`` is the proxy unless the
+app is wrapped in werkzeug's ``ProxyFix``.
+"""
+import threading
+import time
+
+
+class SlidingWindowCounter:
+    """In-process sliding-window counters keyed by string."""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._entries = {}  # key -> [window, number, previous, current]
+        self._pruned_at = clock()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def hit(self, key, limit, window):
+        """Count an attempt on ``key`` unless ``limit`` attempts were
+        counted in the last ``window`` seconds. Return ``(allowed,
+        count)``, the count including the attempt when allowed."""
+        now = self.clock()
+        with self._lock:
+            entry = self._roll(key, window, now)
+            count = self._estimate(entry, now)
+            if count >= limit:
+                return False, count
+            entry[3] += 1
+            self._entries[key] = entry
+        if now - self._pruned_at > window:
+            self.prune()
+        return True, count + 1
+
+    def count(self, key):
+        """Return the estimated attempts on ``key`` in its window."""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return 0
+            return self._estimate(self._roll(key, entry[0], now), now)
+
+    def counters(self):
+        """Return the estimated count of every key."""
+        return {key: self.count(key) for key in list(self._entries)}
+
+    def reset(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def prune(self):
+        """Drop the keys without attempts in their last two windows."""
+        now = self.clock()
+        with self._lock:
+            self._pruned_at = now
+            stale = [key for key, (window, number, _, _)
+                     in self._entries.items() if now // window > number + 1]
+            for key in stale:
+                del self._entries[key]
+
+    def _roll(self, key, window, now):
+        """Return the entry of ``key`` moved to the window of ``now``."""
+        number = int(now // window)
+        entry = self._entries.get(key)
+        if entry is None or number > entry[1] + 1:
+            return [window, number, 0, 0]
+        if number == entry[1] + 1:
+            entry[1:] = [number, entry[3], 0]
+        return entry
+
+    @staticmethod
+    def _estimate(entry, now):
+        window, number, previous, current = entry
+        elapsed = now / window - number
+        return previous * (1 - elapsed) + current
+
+
+class RedisRateLimitBackend:
+    """Sliding-window counters shared through Redis, one key per fixed
+    window expiring after two windows."""
+
+    def __init__(self, url, prefix='hbnb:ratelimit:', clock=time.time):
+        import redis  # optional dependency, only needed for shared limits
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.clock = clock
+
+    def hit(self, key, limit, window):
+        now = self.clock()
+        number = int(now // window)
+        names = [f"{self.prefix}{key}:{number - 1}",
+                 f"{self.prefix}{key}:{number}"]
+        previous, current = (int(value or 0)
+                             for value in self.client.mget(names))
+        count = previous * (1 - (now / window - number)) + current
+        if count >= limit:
+            return False, count
+        pipe = self.client.pipeline()
+        pipe.incr(names[1])
+        pipe.expire(names[1], int(window * 2))
+        pipe.execute()
+        return True, count + 1
+
+    def reset(self, key):
+        for name in self.client.scan_iter(f"{self.prefix}{key}:*"):
+            self.client.delete(name)
+
+    def clear(self):
+        for name in self.client.scan_iter(self.prefix + '*'):
+            self.client.delete(name)
+
+
+class LoginRateLimiter:
+    """Per-IP and per-email limits of the login attempts."""
+
+    def __init__(self):
+        self.backend = SlidingWindowCounter()
+        self.window = 60
+        self.limits = {}
+        self.allowed = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app, backend=None):
+        """Configure the limits from ``app.config`` and reset the counts.
+
+        ``backend`` replaces the one built from ``RATE_LIMIT_REDIS_URL``;
+        any object with ``hit``/``reset``/``clear`` will do.
+        """
+        if backend is None:
+            url = app.config.get('RATE_LIMIT_REDIS_URL')
+            backend = RedisRateLimitBackend(url) if url \
+                else SlidingWindowCounter()
+        self.backend = backend
+        self.window = app.config.get('LOGIN_RATE_WINDOW', 60)
+        self.limits = {
+            'ip': app.config.get('LOGIN_RATE_LIMIT_PER_IP'),
+            'email': app.config.get('LOGIN_RATE_LIMIT_PER_EMAIL'),
+        }
+        self.allowed = self.rejected = 0
+
+    @staticmethod
+    def key(kind, value):
+        if kind == 'email':
+            value = str(value).strip().lower()
+        return f"{kind}:{value}"
+
+    def check(self, ip, email):
+        """Count a login attempt; return None when it may proceed, or
+        the seconds to wait before the next one."""
+        for kind, value in (('ip', ip), ('email', email)):
+            limit = self.limits.get(kind)
+            if not limit:
+                continue
+            allowed, _ = self.backend.hit(self.key(kind, value), limit,
+                                          self.window)
+            if not allowed:
+                self._count('rejected')
+                return self.window
+        self._count('allowed')
+        return None
+
+    def succeeded(self, email):
+        """Forget the attempts on an account once one succeeded."""
+        self.backend.reset(self.key('email', email))
+
+    def stats(self):
+        """Return the allowed and rejected counters."""
+        stats = {'allowed': self.allowed, 'rejected': self.rejected}
+        if hasattr(self.backend, 'counters'):
+            stats['keys'] = self.backend.counters()
+        return stats
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+login_limiter = LoginRateLimiter()
@@ -0,0 +1,129 @@
+"""
+Asymmetric signing of the access tokens.
+
+With the default ``JWT_ALGORITHM`` (HS256) tokens are signed with
+``JWT_SECRET_KEY``, and only this app can verify them. With RS256 or
+EdDSA they are signed with the private key in ``JWT_PRIVATE_KEY_FILE``
+and any service can verify them locally against the public keys
+published at ``/.well-known/jwks.json``, see app.api.v1.jwks.
+
+Each token names its key in the ``kid`` header, the RFC 7638 thumbprint
+of the public key. To rotate, point ``JWT_PRIVATE_KEY_FILE`` at the new
+key and add the public key of the previous one to
+``JWT_PUBLIC_KEY_FILES``: the tokens it signed stay valid, and listed in
+the JWKS, until the file is removed.
+
+PEM files are parsed once, by ``init_app``; flask-jwt-extended gets the
+key objects, so neither signing nor verification parses PEM again.
+Needs the ``cryptography`` package.
+"""
+import base64
+import json
+from hashlib import sha256
+from flask_jwt_extended.config import config
+from jwt.exceptions import InvalidSignatureError
+
+# JWK members hashed into a thumbprint, by key type (RFC 7638)
+THUMBPRINT_MEMBERS = {
+    'RSA': ('e', 'kty', 'n'),
+    'OKP': ('crv', 'kty', 'x'),
+}
+
+
+def load_private_key(path):
+    # optional dependency, only needed for asymmetric signing
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_private_key)
+    with open(path, 'rb') as key_file:
+        return load_pem_private_key(key_file.read(), password=None)
+
+
+def load_public_key(path):
+    # optional dependency, only needed for asymmetric signing
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_public_key)
+    with open(path, 'rb') as key_file:
+        return load_pem_public_key(key_file.read())
+
+
+def public_jwk(public_key):
+    """Return the JWK of ``public_key``, with its ``kid`` and ``alg``."""
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+    from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+    if isinstance(public_key, RSAPublicKey):
+        jwk, alg = RSAAlgorithm.to_jwk(public_key, as_dict=True), 'RS256'
+    else:
+        jwk, alg = OKPAlgorithm.to_jwk(public_key, as_dict=True), 'EdDSA'
+    members = {name: jwk[name] for name in THUMBPRINT_MEMBERS[jwk['kty']]}
+    digest = sha256(json.dumps(members, separators=(',', ':')).encode())
+    kid = base64.urlsafe_b64encode(digest.digest()).rstrip(b'=').decode()
+    return dict(jwk, kid=kid, alg=alg, use='sig')
+
+
+class SigningKeys:
+    """Key material of the tokens, registered with flask-jwt-extended."""
+
+    def __init__(self):
+        self.private_key = None
+        self.kid = None
+        self.public_keys = {}
+        self.jwks = {'keys': []}
+
+    @property
+    def asymmetric(self):
+        return self.private_key is not None
+
+    def init_app(self, app):
+        """Load the keys named by ``app.config`` and register the key
+        loaders with flask-jwt-extended."""
+        from app import jwt
+        self.private_key, self.kid = None, None
+        self.public_keys, self.jwks = {}, {'keys': []}
+        if not app.config.get('JWT_ALGORITHM', 'HS256').startswith('HS'):
+            self.load(app.config.get('JWT_PRIVATE_KEY_FILE'),
+                      app.config.get('JWT_PUBLIC_KEY_FILES') or ())
+            if not app.config.get('JWT_DECODE_ALGORITHMS'):
+                app.config['JWT_DECODE_ALGORITHMS'] = sorted(
+                    {jwk['alg'] for jwk in self.jwks['keys']})
+            from app.api.v1.jwks import install_jwks
+            install_jwks(app)
+        jwt.encode_key_loader(self.encode_key)
+        jwt.decode_key_loader(self.decode_key)
+        jwt.additional_headers_loader(self.headers)
+
+    def load(self, private_key_file, public_key_files=()):
+        """Sign with the key in ``private_key_file``; also accept tokens
+        signed by the keys of ``public_key_files``."""
+        if not private_key_file:
+            raise RuntimeError(
+                "JWT_PRIVATE_KEY_FILE must be set to sign tokens with "
+                "an asymmetric algorithm")
+        self.private_key = load_private_key(private_key_file)
+        public_keys = [self.private_key.public_key()]
+        public_keys += [load_public_key(path) for path in public_key_files]
+        for public_key in public_keys:
+            jwk = public_jwk(public_key)
+            if jwk['kid'] not in self.public_keys:
+                self.public_keys[jwk['kid']] = public_key
+                self.jwks['keys'].append(jwk)
+        self.kid = self.jwks['keys'][0]['kid']
+
+    def encode_key(self, identity):
+        """``encode_key_loader`` callback."""
+        return self.private_key if self.asymmetric else config.encode_key
+
+    def decode_key(self, jwt_header, jwt_payload):
+        """``decode_key_loader`` callback."""
+        if not self.asymmetric:
+            return config.decode_key
+        key = self.public_keys.get(jwt_header.get('kid'))
+        if key is None:
+            raise InvalidSignatureError("Unknown signing key")
+        return key
+
+    def headers(self, identity):
+        """``additional_headers_loader`` callback."""
+        return {'kid': self.kid} if self.asymmetric else {}
+
+
+signing_keys = SigningKeys()
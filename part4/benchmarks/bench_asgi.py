@@ -0,0 +1,150 @@
+"""Read throughput of the WSGI app vs the ASGI mode.
+
+One seeded SQLite database is served, in a separate process, by
+
+* ``wsgi`` -- the Flask app on werkzeug's threaded server, like ``run.py``
+* ``asgi`` -- ``create_asgi_app()`` on uvicorn
+
+and keep-alive clients fetch place details and place listing pages
+for a fixed duration. Clients run on asyncio in this process, so they
+hold one connection each without a thread per client. On a machine
+with few cores they compete with the server for CPU; compare the
+modes with each other rather than with the absolute numbers.
+
+Usage::
+
+    python -m benchmarks.bench_asgi [clients ...]
+"""
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import seed_places, seed_users, temporary_app
+
+DURATION = 5.0
+PLACES = 10_000
+CLIENTS = [10, 100, 1000]
+HOST = '127.0.0.1'
+
+
+def serve(mode, port, uri):
+    """Run one server until killed (``serve`` sub-command)."""
+    from config import TestingConfig
+    config = type('BenchmarkConfig', (TestingConfig,), {
+        'SQLALCHEMY_DATABASE_URI': uri, 'CACHE_ENABLED': False})
+    if mode == 'wsgi':
+        from werkzeug.serving import make_server
+        from app import create_app
+        make_server(HOST, port, create_app(config), threaded=True) \
+            .serve_forever()
+    else:
+        import uvicorn
+        from app.asgi import create_asgi_app
+        uvicorn.run(create_asgi_app(config), host=HOST, port=port,
+                    log_level='warning', backlog=4096)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((HOST, port), 0.5).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+async def fetch(reader, writer, path):
+    """Send one keep-alive GET and return its status code."""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin1').split('\r\n')
+    headers = dict(line.lower().split(': ', 1) for line in lines[1:] if line)
+    await reader.readexactly(int(headers.get('content-length', 0)))
+    return int(lines[0].split(' ')[1]), headers.get('connection') == 'close'
+
+
+async def client(port, paths, deadline, results):
+    connection = None
+    while time.perf_counter() < deadline:
+        try:
+            if connection is None:
+                connection = await asyncio.open_connection(HOST, port)
+            start = time.perf_counter()
+            status, closed = await fetch(*connection, random.choice(paths))
+            results.append((status, time.perf_counter() - start))
+            if closed:
+                connection[1].close()
+                connection = None
+        except (OSError, asyncio.IncompleteReadError):
+            results.append((None, 0))
+            connection = None
+            await asyncio.sleep(0.05)
+    if connection is not None:
+        connection[1].close()
+
+
+async def load(port, paths, clients):
+    results = []
+    deadline = time.perf_counter() + DURATION
+    await asyncio.gather(*(client(port, paths, deadline, results)
+                           for _ in range(clients)))
+    return results
+
+
+def run(mode, uri, paths, clients):
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, '-W', 'ignore', '-m', 'benchmarks.bench_asgi',
+         'serve', mode, str(port), uri],
+        stderr=subprocess.DEVNULL)
+    try:
+        wait_for(port)
+        results = asyncio.run(load(port, paths, clients))
+    finally:
+        server.terminate()
+        server.wait()
+    ok = [elapsed for status, elapsed in results if status == 200]
+    failed = len(results) - len(ok)
+    p95 = statistics.quantiles(ok, n=20)[-1] * 1000 if len(ok) > 1 else 0
+    return len(ok) / DURATION, failed, p95
+
+
+def main(argv):
+    with temporary_app() as app:
+        owner_ids = seed_users(100)
+        place_ids = seed_places(PLACES, owner_ids)
+        uri = app.config['SQLALCHEMY_DATABASE_URI']
+        paths = [f'/api/v1/places/{place_id}'
+                 for place_id in random.sample(place_ids, 1000)]
+        paths.append('/api/v1/places/?limit=20')
+
+        print(f"{PLACES} places, {os.cpu_count()} core(s), "
+              f"{DURATION:.0f}s per run")
+        print(f"{'mode':>6} {'clients':>8} {'req/s':>10} {'errors':>8} "
+              f"{'p95 ms':>8}")
+        for clients in [int(arg) for arg in argv] or CLIENTS:
+            for mode in ('wsgi', 'asgi'):
+                rate, failed, p95 = run(mode, uri, paths, clients)
+                print(f"{mode:>6} {clients:>8} {rate:>10.1f} {failed:>8} "
+                      f"{p95:>8.1f}")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['serve']:
+        serve(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+    else:
+        main(sys.argv[1:])
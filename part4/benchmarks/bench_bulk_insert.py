@@ -0,0 +1,68 @@
+"""Throughput of seeding places: per-row commits vs batched writes.
+
+* ``per_row``   -- ``SQLAlchemyRepository.add`` per place, one commit each
+  (only the first PER_ROW_LIMIT rows are timed, it is that slow)
+* ``add_many``  -- ORM objects added in one ``add_many`` commit
+* ``mappings``  -- plain dicts through ``add_mappings`` (one executemany)
+
+Usage::
+
+    python -m benchmarks.bench_bulk_insert [size ...]
+"""
+import sys
+import time
+
+from app import db
+from app.models.place import Place
+from app.models.user import User
+from app.persistence.repository import SQLAlchemyRepository
+from benchmarks.common import parse_sizes, seed_users, temporary_app
+
+SIZES = [1_000, 10_000, 50_000]
+PER_ROW_LIMIT = 2_000
+
+
+def place_fields(i):
+    return dict(title=f'Place {i}', description='Imported', price=80.0,
+                latitude=0.0, longitude=0.0)
+
+
+def per_row(repository, owner, size):
+    rows = min(size, PER_ROW_LIMIT)
+    for i in range(rows):
+        repository.add(Place(owner=owner, **place_fields(i)))
+    return rows
+
+
+def add_many(repository, owner, size):
+    repository.add_many([Place(owner=owner, **place_fields(i))
+                         for i in range(size)])
+    return size
+
+
+def mappings(repository, owner, size):
+    return repository.add_mappings(
+        [dict(place_fields(i), owner_id=owner.id) for i in range(size)])
+
+
+def run(strategy, size):
+    with temporary_app():
+        owner = db.session.get(User, seed_users(1)[0])
+        repository = SQLAlchemyRepository(Place)
+        start = time.perf_counter()
+        rows = strategy(repository, owner, size)
+        elapsed = time.perf_counter() - start
+        assert Place.query.count() == rows
+        return rows / elapsed
+
+
+def main(argv):
+    print(f"{'places':>8} {'strategy':>10} {'rows/s':>10}")
+    for size in parse_sizes(argv, SIZES):
+        for strategy in (per_row, add_many, mappings):
+            rate = run(strategy, size)
+            print(f"{size:>8} {strategy.__name__:>10} {rate:>10.0f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
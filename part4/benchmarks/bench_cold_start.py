@@ -0,0 +1,82 @@
+"""Boot time of ``create_app`` on a populated database.
+
+* ``create_all`` -- the previous boot: ``db.create_all()`` and the table
+  version rows checked on every ``create_app``
+* ``verify``     -- the current boot: one query on ``alembic_version``
+
+Each boot runs in a fresh interpreter, as a worker or a test process
+would, and reports ``create_app`` alone (imports excluded), the whole
+process start to ready, and the SQL statements sent at boot -- each one
+a round trip on a networked database.
+
+Usage::
+
+    python -m benchmarks.bench_cold_start [places ...]
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import parse_sizes, seed_places, seed_users, \
+    temporary_app
+
+REPEAT = 7
+SIZES = [10_000, 100_000]
+
+
+def boot(mode, uri):
+    """Create the app once and print timings (``boot`` sub-command)."""
+    from config import TestingConfig
+    config = type('BenchmarkConfig', (TestingConfig,), {
+        'SQLALCHEMY_DATABASE_URI': uri, 'SCHEMA_AUTO_CREATE': False})
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    from app import create_app, db
+    statements = []
+    event.listen(Engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args:
+                 statements.append(statement))
+    start = time.perf_counter()
+    app = create_app(config)
+    if mode == 'create_all':
+        from app.persistence.versions import ensure_versions
+        with app.app_context():
+            db.create_all(bind_key=None)
+            ensure_versions()
+    print((time.perf_counter() - start) * 1000, len(statements))
+
+
+def run(mode, uri):
+    create_app_ms, process_ms, statements = [], [], 0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, '-W', 'ignore', '-m',
+             'benchmarks.bench_cold_start', 'boot', mode, uri],
+            capture_output=True, text=True, check=True).stdout
+        process_ms.append((time.perf_counter() - start) * 1000)
+        ms, statements = output.split()[-2:]
+        create_app_ms.append(float(ms))
+    return (statistics.median(create_app_ms), statistics.median(process_ms),
+            int(statements))
+
+
+def main(argv):
+    print(f"{'places':>8} {'mode':>11} {'create_app ms':>14} "
+          f"{'process ms':>11} {'statements':>11}")
+    for size in parse_sizes(argv, SIZES):
+        with temporary_app() as app:
+            seed_places(size, seed_users(100))
+            uri = app.config['SQLALCHEMY_DATABASE_URI']
+            for mode in ('create_all', 'verify'):
+                create_app_ms, process_ms, statements = run(mode, uri)
+                print(f"{size:>8} {mode:>11} {create_app_ms:>14.1f} "
+                      f"{process_ms:>11.1f} {statements:>11}")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['boot']:
+        boot(sys.argv[2], sys.argv[3])
+    else:
+        main(sys.argv[1:])
@@ -0,0 +1,86 @@
+"""Import-time profile of the startup paths, with ``-X importtime``.
+
+* ``import app``          -- what a script, a test module or the flask
+  CLI pays before creating the app
+* ``create_app lazy``     -- ``LAZY_STARTUP`` (development, tests): the
+  API is built by the first request
+* ``create_app eager``    -- ``LAZY_STARTUP`` off (production): the API
+  is built up front
+* ``first request lazy``  -- lazy ``create_app`` and one API request
+
+Each path runs in a fresh interpreter. The report gives the median wall
+time and the heaviest top-level imports of each path (those of the
+``app`` package itself listed one by one), with their cumulative import
+time.
+
+Usage::
+
+    python -m benchmarks.bench_import_time [top]
+"""
+import statistics
+import subprocess
+import sys
+
+REPEAT = 5
+TOP = 8
+
+EAGER = ("import config; create_app(type('EagerConfig', "
+         "(config.TestingConfig,), {'LAZY_STARTUP': False}))")
+PATHS = {
+    'import app': "import app",
+    'create_app lazy': "from app import create_app; "
+                       "create_app('config.TestingConfig')",
+    'create_app eager': "from app import create_app; " + EAGER,
+    'first request lazy': "from app import create_app; "
+                          "create_app('config.TestingConfig')"
+                          ".test_client().get('/api/v1/amenities/')",
+}
+
+TIMED = ("import time; start = time.perf_counter()\n{}\n"
+         "print((time.perf_counter() - start) * 1000)")
+
+
+def profile(code):
+    """Run ``code`` in a fresh interpreter and return its wall time in
+    milliseconds and its ``-X importtime`` report."""
+    result = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-X', 'importtime', '-c',
+         TIMED.format(code)],
+        capture_output=True, text=True, check=True)
+    return float(result.stdout.split()[-1]), result.stderr
+
+
+def top_level(report):
+    """Return ``(cumulative ms, module)`` of the top-level imports, the
+    ``app`` package being broken down into its own imports."""
+    imports, children = [], []
+    for line in report.splitlines():
+        fields = line.split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2][1:]
+        entry = (int(fields[1]) / 1000, name.strip())
+        # children are reported before their parent, indented by two
+        if name.startswith('  ') and not name.startswith('   '):
+            children.append(entry)
+        elif not name.startswith(' '):
+            if name == 'app':
+                imports.extend(children)
+            else:
+                imports.append(entry)
+            children = []
+    return sorted(imports, reverse=True)
+
+
+def main(argv):
+    top = int(argv[0]) if argv else TOP
+    for path, code in PATHS.items():
+        runs = [profile(code) for _ in range(REPEAT)]
+        wall = statistics.median(ms for ms, _ in runs)
+        print(f"{path}: {wall:.0f} ms")
+        for ms, module in top_level(runs[-1][1])[:top]:
+            print(f"    {ms:>8.1f} ms  {module}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
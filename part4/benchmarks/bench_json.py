@@ -0,0 +1,89 @@
+"""Serialization throughput of a place listing, by JSON encoder.
+
+Places are loaded once with their amenities, then turned into the
+response body as the listing view does; ``to_dict`` and the encoding
+are timed apart (medians):
+
+* ``json isoformat`` -- the previous path: ``to_dict()`` formats the
+  timestamps, the standard library encodes
+* ``json``           -- ``to_dict(raw_datetimes=True)``, the standard
+  library encodes the datetimes through its ``default`` hook
+* ``orjson``         -- ``to_dict(raw_datetimes=True)``, orjson encodes
+  the datetimes natively
+
+Usage::
+
+    python -m benchmarks.bench_json [places ...]
+"""
+import json
+import sys
+
+from sqlalchemy.orm import selectinload
+
+from app import db
+from app.api.v1.encoders import ENCODERS
+from app.models.amenity import Amenity
+from app.models.place import Place
+from benchmarks.common import (insert_rows, new_id, parse_sizes,
+                               seed_places, seed_users, temporary_app,
+                               timeit, timestamps)
+
+REPEAT = 5
+SIZES = [10_000]
+AMENITIES = 10
+
+
+def link_amenities(place_ids):
+    from app.models.place_amenity import place_amenity
+
+    amenity_ids = [new_id() for _ in range(AMENITIES)]
+    insert_rows(Amenity.__table__,
+                [dict(id=amenity_id, name=f'Amenity {i}', description='',
+                      **timestamps())
+                 for i, amenity_id in enumerate(amenity_ids)])
+    insert_rows(place_amenity,
+                [dict(place_id=place_id, amenity_id=amenity_ids[i % AMENITIES])
+                 for i, place_id in enumerate(place_ids)])
+
+
+def encoders():
+    """Yield ``(name, raw_datetimes, dumps)`` of each path."""
+    yield 'json isoformat', False, json.dumps
+    for name, dumps in ENCODERS.items():
+        if name == 'orjson':
+            try:
+                import orjson  # noqa: F401
+            except ImportError:
+                print("orjson is not installed, skipped")
+                continue
+        yield name, True, dumps
+
+
+def run(size):
+    with temporary_app():
+        place_ids = seed_places(size, seed_users(100))
+        link_amenities(place_ids)
+        places = db.session.scalars(
+            db.select(Place).options(selectinload(Place.amenities))).all()
+
+        for name, raw_datetimes, dumps in encoders():
+            def to_dicts():
+                return [place.to_dict(raw_datetimes=raw_datetimes)
+                        for place in places]
+            dicts = to_dicts()
+            to_dict_ms = timeit(to_dicts, REPEAT)
+            encode_ms = timeit(lambda: dumps(dicts), REPEAT)
+            total = to_dict_ms + encode_ms
+            print(f"{size:>8} {name:>15} {to_dict_ms:>10.1f} "
+                  f"{encode_ms:>10.1f} {size / total * 1000:>12,.0f}")
+
+
+def main(argv):
+    print(f"{'places':>8} {'encoder':>15} {'to_dict ms':>10} "
+          f"{'encode ms':>10} {'places/s':>12}")
+    for size in parse_sizes(argv, SIZES):
+        run(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,102 @@
+"""Token signing and verification throughput, by algorithm.
+
+Each algorithm signs and verifies access tokens the way the app does,
+through flask-jwt-extended (medians, tokens per second):
+
+* ``HS256``        -- ``JWT_SECRET_KEY``
+* ``RS256``/``EdDSA`` -- ``JWT_PRIVATE_KEY_FILE``, key objects parsed once
+  by app.services.signing
+* ``... pem``      -- the same keys handed over as PEM strings, parsed
+  by PyJWT for every token, as with flask-jwt-extended's
+  ``JWT_PRIVATE_KEY``/``JWT_PUBLIC_KEY`` settings
+
+Needs the ``cryptography`` package.
+
+Usage::
+
+    python -m benchmarks.bench_jwt [tokens ...]
+"""
+import os
+import sys
+import tempfile
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from flask_jwt_extended import create_access_token, decode_token
+
+from app.services.signing import signing_keys
+from benchmarks.common import parse_sizes, temporary_app, timeit
+
+REPEAT = 5
+SIZES = [200]
+IDENTITY = {'id': '0b6e5a56-6a3c-4a52-9d4b-8f8bd1f5c2a1', 'is_admin': False}
+
+
+def write_private_key(directory, algorithm):
+    if algorithm == 'RS256':
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        key = ed25519.Ed25519PrivateKey.generate()
+    path = os.path.join(directory, f'{algorithm}.pem')
+    with open(path, 'wb') as key_file:
+        key_file.write(key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()))
+    return path
+
+
+def as_pem(key):
+    """Hand ``key`` to PyJWT as PEM, to be parsed on every use."""
+    if hasattr(key, 'private_bytes'):
+        return key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption())
+    return key.public_bytes(serialization.Encoding.PEM,
+                            serialization.PublicFormat.SubjectPublicKeyInfo)
+
+
+def settings(directory):
+    """Yield ``(name, config overrides, pem)`` of each case."""
+    yield 'HS256', {}, False
+    for algorithm in ('RS256', 'EdDSA'):
+        overrides = {'JWT_ALGORITHM': algorithm,
+                     'JWT_PRIVATE_KEY_FILE': write_private_key(directory,
+                                                               algorithm)}
+        yield algorithm, overrides, False
+        yield f'{algorithm} pem', overrides, True
+
+
+def run(size, name, overrides, pem):
+    with temporary_app(**overrides):
+        if pem:
+            signing_keys.private_key = as_pem(signing_keys.private_key)
+            signing_keys.public_keys = {
+                kid: as_pem(key)
+                for kid, key in signing_keys.public_keys.items()}
+
+        def sign():
+            return [create_access_token(identity=IDENTITY)
+                    for _ in range(size)]
+        tokens = sign()
+
+        def verify():
+            for token in tokens:
+                decode_token(token)
+        sign_ms = timeit(sign, REPEAT)
+        verify_ms = timeit(verify, REPEAT)
+        print(f"{size:>8} {name:>10} {size / sign_ms * 1000:>10,.0f} "
+              f"{size / verify_ms * 1000:>12,.0f}")
+
+
+def main(argv):
+    print(f"{'tokens':>8} {'algorithm':>10} {'signed/s':>10} "
+          f"{'verified/s':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        cases = list(settings(directory))
+        for size in parse_sizes(argv, SIZES):
+            for name, overrides, pem in cases:
+                run(size, name, overrides, pem)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,84 @@
+"""Login throughput with bcrypt inline vs in the hashing process pool.
+
+Concurrent clients post to ``/api/v1/auth/login`` for a fixed duration.
+
+* ``inline`` -- ``PASSWORD_HASH_WORKERS = 0``, bcrypt on the request thread
+* ``pool``   -- one hashing process per CPU, bounded queue
+
+Rejected (503) logins are counted separately; they are the early
+rejections that keep latency bounded once the queue is saturated.
+Clients honour ``Retry-After`` before their next attempt.
+
+Usage::
+
+    python -m benchmarks.bench_login [threads ...]
+"""
+import os
+import statistics
+import sys
+import threading
+import time
+
+import bcrypt
+from benchmarks.common import seed_users, temporary_app
+
+ROUNDS = 10
+DURATION = 5.0
+USERS = 50
+THREADS = [1, 4, 16]
+
+
+def client_loop(app, deadline, results):
+    client = app.test_client()
+    i = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = client.post('/api/v1/auth/login', json={
+            'email': f'user{i % USERS}@example.com', 'password': 'secret'})
+        results.append((response.status_code, time.perf_counter() - start))
+        if response.status_code == 503:
+            time.sleep(float(response.headers['Retry-After']))
+        i += 1
+
+
+def run(workers, threads):
+    password_hash = bcrypt.hashpw(
+        b'secret', bcrypt.gensalt(ROUNDS)).decode('utf-8')
+    with temporary_app(BCRYPT_LOG_ROUNDS=ROUNDS,
+                       PASSWORD_HASH_WORKERS=workers,
+                       LOGIN_RATE_LIMIT_PER_IP=None,
+                       LOGIN_RATE_LIMIT_PER_EMAIL=None,
+                       JWT_SECRET_KEY='benchmark-secret-key-' + 'x' * 16) as app:
+        seed_users(USERS, password_hash)
+        results = []
+        deadline = time.perf_counter() + DURATION
+        clients = [threading.Thread(target=client_loop,
+                                    args=(app, deadline, results))
+                   for _ in range(threads)]
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        from app.services.passwords import password_hasher
+        password_hasher.shutdown()
+
+    ok = [elapsed for status, elapsed in results if status == 200]
+    rejected = sum(status == 503 for status, _ in results)
+    p95 = statistics.quantiles(ok, n=20)[-1] * 1000 if len(ok) > 1 else 0
+    return len(ok) / DURATION, rejected, p95
+
+
+def main(argv):
+    cores = os.cpu_count()
+    print(f"bcrypt cost {ROUNDS}, {cores} core(s), {DURATION:.0f}s per run")
+    print(f"{'mode':>8} {'threads':>8} {'logins/s':>10} {'/core':>8} "
+          f"{'503s':>6} {'p95 ms':>8}")
+    for threads in [int(arg) for arg in argv] or THREADS:
+        for mode, workers in (('inline', 0), ('pool', cores)):
+            rate, rejected, p95 = run(workers, threads)
+            print(f"{mode:>8} {threads:>8} {rate:>10.1f} "
+                  f"{rate / cores:>8.1f} {rejected:>6} {p95:>8.1f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,57 @@
+"""Latency of radius searches over a large place table.
+
+Places are spread uniformly over western Europe (about 40 places per
+10 km radius at 1M rows). Each sample is a ``search_places_by_radius``
+call around a random point, with the SQLite grid index doing the
+filtering; the median must stay under 10 ms at 1M places.
+
+Usage::
+
+    python -m benchmarks.bench_place_search [size ...]
+"""
+import random
+import sys
+
+from app import db
+from app.services.facade import hbnb_facade as facade
+from benchmarks.common import (parse_sizes, seed_places, seed_users,
+                               temporary_app, timeit)
+
+SIZES = [10_000, 100_000, 1_000_000]
+LAT_RANGE = (36.0, 60.0)
+LON_RANGE = (-10.0, 30.0)
+RADII_KM = [1, 10, 50]
+
+
+def random_point(rng):
+    return rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE)
+
+
+def run(size):
+    rng = random.Random(size)
+    with temporary_app():
+        user_ids = seed_users(100)
+        points = [random_point(rng) for _ in range(size)]
+        seed_places(size, user_ids, latitude=lambda i: points[i][0],
+                    longitude=lambda i: points[i][1])
+        results = {}
+        for radius in RADII_KM:
+            found = []
+
+            def search():
+                db.session.expunge_all()
+                found.append(len(facade.search_places_by_radius(
+                    *random_point(rng), radius, limit=1_000)))
+            results[radius] = (timeit(search), sum(found) / len(found))
+        return results
+
+
+def main(argv):
+    print(f"{'places':>10} {'radius km':>10} {'median ms':>10} {'hits':>8}")
+    for size in parse_sizes(argv, SIZES):
+        for radius, (median_ms, hits) in run(size).items():
+            print(f"{size:>10} {radius:>10} {median_ms:>10.2f} {hits:>8.1f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,52 @@
+"""Latency of GET /api/v1/reviews/places/<place_id>/reviews by table size.
+
+The target place always has the same ten reviews; only the rest of the
+review table grows. With the ``review.place_id`` index the endpoint cost
+should stay flat from 1k to 1M rows.
+
+Usage::
+
+    python -m benchmarks.bench_reviews_by_place [size ...]
+"""
+import sys
+
+from app import db
+from app.models.review import Review
+from benchmarks.common import (insert_rows, new_id, parse_sizes, seed_places,
+                               seed_users, temporary_app, timeit, timestamps)
+
+TARGET_REVIEWS = 10
+PLACES = 1_000
+
+
+def seed_reviews(count, user_ids, place_ids):
+    rows = [dict(id=new_id(), text='Benchmark review', rating=1 + i % 5,
+                 user_id=user_ids[i % len(user_ids)],
+                 place_id=place_ids[i % len(place_ids)], **timestamps())
+            for i in range(count)]
+    insert_rows(Review.__table__, rows)
+
+
+def run(size):
+    with temporary_app() as app:
+        user_ids = seed_users(100)
+        place_ids = seed_places(PLACES, user_ids)
+        target, others = place_ids[0], place_ids[1:]
+        seed_reviews(TARGET_REVIEWS, user_ids, [target])
+        seed_reviews(size - TARGET_REVIEWS, user_ids, others)
+        db.session.remove()
+
+        client = app.test_client()
+        url = f'/api/v1/reviews/places/{target}/reviews'
+        assert len(client.get(url).get_json()['reviews']) == TARGET_REVIEWS
+        return timeit(lambda: client.get(url))
+
+
+def main(argv):
+    print(f"{'reviews':>10} {'median ms':>10}")
+    for size in parse_sizes(argv):
+        print(f"{size:>10} {run(size):>10.2f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
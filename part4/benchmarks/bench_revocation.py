@@ -0,0 +1,84 @@
+"""Cost of the revocation check with a large blocklist.
+
+The blocklist is filled with revoked tokens whose expiries spread over
+the token lifetime, as a steady stream of logouts leaves it. Then
+(medians):
+
+* ``lookup`` -- ``revocations.is_revoked`` of a live and of a revoked
+  token, in microseconds per call
+* ``request`` -- ``GET /api/v1/auth/protected``, in microseconds per
+  request; compare the 0 row for the overhead of the blocklist size
+
+plus the memory the entries take, measured with tracemalloc.
+
+Usage::
+
+    python -m benchmarks.bench_revocation [revoked tokens ...]
+"""
+import sys
+import time
+import tracemalloc
+import uuid
+
+from flask_jwt_extended import create_access_token
+
+from app.services.revocation import revocations
+from benchmarks.common import parse_sizes, seed_users, temporary_app, timeit
+
+REPEAT = 5
+CALLS = 100_000
+REQUESTS = 500
+SIZES = [0, 1_000_000]
+
+
+def fill(count, lifetime):
+    """Revoke ``count`` tokens; return the bytes the entries take."""
+    now = time.time()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        revocations.revoke_token({'jti': str(uuid.uuid4()),
+                                  'exp': now + lifetime * i / count})
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used
+
+
+def run(size):
+    with temporary_app() as app:
+        user_id = seed_users(1)[0]
+        used = fill(size, revocations.token_lifetime)
+        token = create_access_token(
+            identity={'id': user_id, 'is_admin': False})
+        live = {'jti': str(uuid.uuid4()), 'exp': time.time() + 60,
+                'iat': time.time(), 'sub': {'id': user_id}}
+        revoked = dict(live, jti=str(uuid.uuid4()))
+        revocations.revoke_token(revoked)
+
+        def lookups(payload):
+            def loop():
+                for _ in range(CALLS):
+                    revocations.is_revoked(None, payload)
+            return timeit(loop, REPEAT) * 1000 / CALLS
+
+        client = app.test_client()
+        headers = {'Authorization': f'Bearer {token}'}
+
+        def requests():
+            for _ in range(REQUESTS):
+                client.get('/api/v1/auth/protected', headers=headers)
+        requests()
+        request_us = timeit(requests, REPEAT) * 1000 / REQUESTS
+        print(f"{size:>10,} {used / 2 ** 20:>8.1f} {lookups(live):>9.2f} "
+              f"{lookups(revoked):>11.2f} {request_us:>10.1f}")
+
+
+def main(argv):
+    print(f"{'revoked':>10} {'MiB':>8} {'live us':>9} {'revoked us':>11} "
+          f"{'request us':>10}")
+    for size in parse_sizes(argv, SIZES):
+        run(size)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,51 @@
+"""Latency of GET /swagger.json.
+
+* ``flask-restx`` -- the stock view: the cached spec dict serialized
+  again on every request
+* ``cached``      -- the bytes serialized once per process
+* ``304``         -- a client revalidating with ``If-None-Match``
+
+plus the one-off cost of building the spec, which a process serving
+``SWAGGER_SPEC_FILE`` never pays.
+
+Usage::
+
+    python -m benchmarks.bench_spec [repeat]
+"""
+import sys
+
+from flask_restx.api import SwaggerView
+from flask_restx.swagger import Swagger
+
+from benchmarks.common import temporary_app, timeit
+
+REPEAT = 200
+
+
+def main(argv):
+    repeat = int(argv[0]) if argv else REPEAT
+    with temporary_app() as app:
+        client = app.test_client()
+        response = client.get('/swagger.json')
+        etag = response.headers['ETag']
+        print(f"spec: {len(response.data) / 1024:.0f} KiB")
+
+        cached = timeit(lambda: client.get('/swagger.json'), repeat)
+        revalidated = timeit(lambda: client.get(
+            '/swagger.json', headers={'If-None-Match': etag}), repeat)
+
+        api = app.extensions['hbnb_api']
+        with app.test_request_context():
+            build = timeit(lambda: Swagger(api).as_dict(), 20)
+        app.view_functions['specs'] = SwaggerView.as_view('specs', api, api)
+        stock = timeit(lambda: client.get('/swagger.json'), repeat)
+
+    print(f"build: {build:.2f} ms")
+    print(f"{'view':>12} {'median ms':>10}")
+    for name, ms in (('flask-restx', stock), ('cached', cached),
+                     ('304', revalidated)):
+        print(f"{name:>12} {ms:>10.2f}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,98 @@
+"""Shared helpers for the HBnB benchmarks.
+
+Benchmarks are plain scripts run from the project root, e.g.::
+
+    python -m benchmarks.bench_reviews_by_place
+"""
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+from app import create_app, db
+from config import TestingConfig
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+BATCH_SIZE = 50_000
+
+
+@contextmanager
+def temporary_app(**settings):
+    """Yield an app bound to a throwaway on-disk SQLite database."""
+    handle, path = tempfile.mkstemp(suffix='.db')
+    os.close(handle)
+    settings.setdefault('SQLALCHEMY_DATABASE_URI', f'sqlite:///{path}')
+    config_class = type('BenchmarkConfig', (TestingConfig,), settings)
+    app = create_app(config_class)
+    try:
+        with app.app_context():
+            yield app
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+def new_id():
+    return str(uuid.uuid4())
+
+
+def insert_rows(table, rows):
+    """Bulk insert plain dict rows through SQLAlchemy Core in batches."""
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(table.insert(), rows[start:start + BATCH_SIZE])
+    db.session.commit()
+
+
+def timestamps():
+    now = datetime.utcnow()
+    return {'created_at': now, 'updated_at': now}
+
+
+def seed_users(count, password_hash='$2b$04$' + 'x' * 53):
+    """Insert ``count`` users sharing one pre-computed password hash."""
+    from app.models.user import User
+
+    rows = [dict(id=new_id(), email=f'user{i}@example.com',
+                 password=password_hash, first_name='User',
+                 last_name=str(i), is_admin=False, is_owner=True,
+                 **timestamps())
+            for i in range(count)]
+    insert_rows(User.__table__, rows)
+    return [row['id'] for row in rows]
+
+
+def seed_places(count, owner_ids, **overrides):
+    """Insert ``count`` places spread round-robin across ``owner_ids``."""
+    from app.models.place import Place
+
+    rows = []
+    for i in range(count):
+        row = dict(id=new_id(), title=f'Place {i}', description='Benchmark',
+                   price=50.0 + i % 500, latitude=0.0, longitude=0.0,
+                   owner_id=owner_ids[i % len(owner_ids)], **timestamps())
+        row.update({key: value(i) if callable(value) else value
+                    for key, value in overrides.items()})
+        rows.append(row)
+    insert_rows(Place.__table__, rows)
+    return [row['id'] for row in rows]
+
+
+def timeit(func, repeat=50):
+    """Run ``func`` ``repeat`` times and return the median in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def parse_sizes(argv, default=SIZES):
+    """Read row counts from the command line, e.g. ``1000 10000``."""
+    return [int(arg) for arg in argv] or default
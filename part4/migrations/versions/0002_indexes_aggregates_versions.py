@@ -0,0 +1,136 @@
+"""indexes, place grid cell and rating aggregates, table versions
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 19:02:11.530214
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+# Frozen copy of app.persistence.geo at this revision
+GRID_CELL_DEGREES = 0.1
+GRID_ROWS = int(180 / GRID_CELL_DEGREES) + 1
+GRID_COLUMNS = int(360 / GRID_CELL_DEGREES) + 1
+
+
+def grid_cell(latitude, longitude):
+    row = min(int((latitude + 90) / GRID_CELL_DEGREES), GRID_ROWS - 1)
+    column = min(int((longitude + 180) / GRID_CELL_DEGREES),
+                 GRID_COLUMNS - 1)
+    return row * GRID_COLUMNS + column
+
+
+def upgrade():
+    # Existing places get their columns filled below; the defaults only
+    # cover the rows already there and are dropped afterwards.
+    with op.batch_alter_table('place', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('grid_cell', sa.Integer(),
+                                      nullable=True))
+        batch_op.add_column(sa.Column('avg_rating', sa.Float(),
+                                      nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('review_count', sa.Integer(),
+                                      nullable=False, server_default='0'))
+
+    connection = op.get_bind()
+    place = sa.table('place', sa.column('id', sa.String),
+                     sa.column('latitude', sa.Float),
+                     sa.column('longitude', sa.Float),
+                     sa.column('grid_cell', sa.Integer),
+                     sa.column('avg_rating', sa.Float),
+                     sa.column('review_count', sa.Integer))
+    review = sa.table('review', sa.column('id', sa.String),
+                      sa.column('place_id', sa.String),
+                      sa.column('rating', sa.Integer))
+    rows = connection.execute(
+        sa.select(place.c.id, place.c.latitude, place.c.longitude)).all()
+    if rows:
+        connection.execute(
+            place.update().where(place.c.id == sa.bindparam('place_id'))
+            .values(grid_cell=sa.bindparam('cell')),
+            [{'place_id': row.id, 'cell': grid_cell(row.latitude,
+                                                    row.longitude)}
+             for row in rows])
+    reviews = review.c.place_id == place.c.id
+    connection.execute(place.update().values(
+        review_count=sa.select(sa.func.count(review.c.id))
+        .where(reviews).scalar_subquery(),
+        avg_rating=sa.select(sa.func.coalesce(sa.func.avg(review.c.rating),
+                                              0))
+        .where(reviews).scalar_subquery()))
+
+    with op.batch_alter_table('place', schema=None) as batch_op:
+        batch_op.alter_column('grid_cell', existing_type=sa.Integer(),
+                              nullable=False)
+        batch_op.alter_column('avg_rating', existing_type=sa.Float(),
+                              server_default=None)
+        batch_op.alter_column('review_count', existing_type=sa.Integer(),
+                              server_default=None)
+
+    # Outside the batch: a table copy cannot carry the expression index
+    op.create_index('ix_place_avg_rating_created_at_id', 'place', [sa.literal_column('avg_rating DESC'), 'created_at', 'id'], unique=False)
+    op.create_index('ix_place_created_at_id', 'place', ['created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_place_grid_cell'), 'place', ['grid_cell'], unique=False)
+    op.create_index('ix_place_price_created_at_id', 'place', ['price', 'created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('amenity', schema=None) as batch_op:
+        batch_op.create_index('ix_amenity_created_at_id', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.create_index('ix_user_created_at_id', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('place_amenity', schema=None) as batch_op:
+        batch_op.create_index('ix_place_amenity_amenity_id', ['amenity_id'], unique=False)
+
+    with op.batch_alter_table('review', schema=None) as batch_op:
+        batch_op.create_index('ix_review_created_at_id', ['created_at', 'id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_review_place_id'), ['place_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_review_user_id'), ['user_id'], unique=False)
+
+    # One change counter per table, see app.persistence.versions
+    table_version = op.create_table('table_version',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    now = datetime.utcnow()
+    op.bulk_insert(table_version, [
+        {'name': name, 'version': 0, 'updated_at': now}
+        for name in ('amenity', 'table_version', 'user', 'place',
+                     'place_amenity', 'review')])
+
+
+def downgrade():
+    op.drop_table('table_version')
+
+    with op.batch_alter_table('review', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_review_user_id'))
+        batch_op.drop_index(batch_op.f('ix_review_place_id'))
+        batch_op.drop_index('ix_review_created_at_id')
+
+    with op.batch_alter_table('place_amenity', schema=None) as batch_op:
+        batch_op.drop_index('ix_place_amenity_amenity_id')
+
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_created_at_id')
+
+    with op.batch_alter_table('amenity', schema=None) as batch_op:
+        batch_op.drop_index('ix_amenity_created_at_id')
+
+    op.drop_index('ix_place_price_created_at_id', table_name='place')
+    op.drop_index(op.f('ix_place_grid_cell'), table_name='place')
+    op.drop_index('ix_place_created_at_id', table_name='place')
+    op.drop_index('ix_place_avg_rating_created_at_id', table_name='place')
+    with op.batch_alter_table('place', schema=None) as batch_op:
+        batch_op.drop_column('review_count')
+        batch_op.drop_column('avg_rating')
+        batch_op.drop_column('grid_cell')
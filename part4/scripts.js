@@ -66,19 +66,13 @@ document.addEventListener('DOMContentLoaded', function () {
             <option value="100">$100</option>
         `;
 
-        // Implement client-side filtering
+        // Let the API filter places so only the matching ones are downloaded
         priceFilter.addEventListener('change', (event) => {
+            const token = getCookie('token');
+            if (!token) return;
             const selectedPrice = event.target.value;
-            const placeCards = document.querySelectorAll('.place-card');
-            placeCards.forEach(card => {
-                const priceText = card.querySelector('p').textContent;
-                const price = parseInt(priceText.replace('Price per night: $', ''));
-                if (selectedPrice === 'All' || price <= parseInt(selectedPrice)) {
-                    card.style.display = 'block';
-                } else {
-                    card.style.display = 'none';
-                }
-            });
+            const filters = selectedPrice === 'All' ? {} : { max_price: selectedPrice };
+            fetchPlaces(token, filters);
         });
     }
 });
@@ -105,22 +99,32 @@ function getCookie(name) {
     return null;
 }
 
-// Fetch places data dynamically if the user is authenticated
-async function fetchPlaces(token) {
+// Fetch places data dynamically if the user is authenticated.
+// `filters` are passed as query parameters (min_price, max_price,
+// min_rating, amenities, sort) and applied by the server. The list is
+// paginated: pages are requested until no X-Next-Cursor comes back.
+async function fetchPlaces(token, filters = {}) {
+    const places = [];
+    let cursor = null;
     try {
-        const response = await fetch('http://127.0.0.1:5000/api/v1/places', {
-            method: 'GET',
-            headers: {
-                'Authorization': `Bearer ${token}`,
-                'Accept': 'application/json'
+        do {
+            const params = new URLSearchParams(filters);
+            if (cursor) params.set('cursor', cursor);
+            const response = await fetch(`http://127.0.0.1:5000/api/v1/places/?${params.toString()}`, {
+                method: 'GET',
+                headers: {
+                    'Authorization': `Bearer ${token}`,
+                    'Accept': 'application/json'
+                }
+            });
+            if (!response.ok) {
+                console.error('Failed to fetch places:', response.statusText);
+                return;
             }
-        });
-        if (response.ok) {
-            const places = await response.json();
-            displayPlaces(places);
-        } else {
-            console.error('Failed to fetch places:', response.statusText);
-        }
+            places.push(...await response.json());
+            cursor = response.headers.get('X-Next-Cursor');
+        } while (cursor);
+        displayPlaces(places);
     } catch (error) {
         console.error('Error fetching places:', error);
     }
@@ -0,0 +1,111 @@
+import pytest
+from app import create_app, db
+from app.services.facade import hbnb_facade
+
+
+@pytest.fixture
+def app():
+    """Create an application bound to a fresh in-memory database."""
+    app = create_app("config.TestingConfig")
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.drop_all(bind_key=None)
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def facade(app):
+    return hbnb_facade
+
+
+@pytest.fixture
+def owner(facade):
+    return facade.create_user({
+        'first_name': 'Alice',
+        'last_name': 'Smith',
+        'email': 'alice.smith@example.com',
+        'password': 'password123'
+    })
+
+
+@pytest.fixture
+def guest(facade):
+    return facade.create_user({
+        'first_name': 'Bob',
+        'last_name': 'Jones',
+        'email': 'bob.jones@example.com',
+        'password': 'password123'
+    })
+
+
+def make_place(facade, owner, **overrides):
+    """Create a place owned by ``owner`` with sensible defaults."""
+    place_data = {
+        'title': 'Cozy Apartment',
+        'description': 'A nice place to stay',
+        'price': 100.0,
+        'latitude': 37.7749,
+        'longitude': -122.4194,
+        'owner_id': owner.id
+    }
+    place_data.update(overrides)
+    return facade.create_place(place_data)
+
+
+@pytest.fixture
+def count_queries(app):
+    """Return a context manager collecting the SQL statements it sees."""
+    from contextlib import contextmanager
+    from sqlalchemy import event
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+    return counter
+
+
+@pytest.fixture
+def count_commits(app):
+    """Return a context manager counting the session commits it sees."""
+    from contextlib import contextmanager
+    from sqlalchemy import event
+
+    @contextmanager
+    def counter():
+        commits = []
+
+        def record(session):
+            commits.append(session)
+
+        event.listen(db.session, 'after_commit', record)
+        try:
+            yield commits
+        finally:
+            event.remove(db.session, 'after_commit', record)
+    return counter
+
+
+@pytest.fixture
+def auth_headers(app):
+    """Return a function building Authorization headers for a user."""
+    from flask_jwt_extended import create_access_token
+
+    def headers(user):
+        token = create_access_token(
+            identity={'id': user.id, 'is_admin': user.is_admin})
+        return {'Authorization': f'Bearer {token}'}
+    return headers
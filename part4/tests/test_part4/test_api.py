@@ -0,0 +1,38 @@
+def create_amenities(facade, count):
+    return [facade.create_amenity({'name': f'Amenity {i}'})
+            for i in range(count)]
+
+
+def test_amenity_list_is_paginated_with_a_cursor(client, facade):
+    amenities = create_amenities(facade, 5)
+
+    first = client.get('/api/v1/amenities/?limit=2')
+    assert first.status_code == 200
+    assert [a['id'] for a in first.get_json()] == \
+        [a.id for a in amenities[:2]]
+
+    cursor = first.headers['X-Next-Cursor']
+    second = client.get(f'/api/v1/amenities/?limit=2&cursor={cursor}')
+    assert [a['id'] for a in second.get_json()] == \
+        [a.id for a in amenities[2:4]]
+
+    cursor = second.headers['X-Next-Cursor']
+    last = client.get(f'/api/v1/amenities/?limit=2&cursor={cursor}')
+    assert [a['id'] for a in last.get_json()] == [amenities[4].id]
+    assert 'X-Next-Cursor' not in last.headers
+
+
+def test_page_size_is_capped(app, client, facade):
+    app.config['MAX_PAGE_SIZE'] = 3
+    create_amenities(facade, 5)
+
+    response = client.get('/api/v1/amenities/?limit=500')
+    assert len(response.get_json()) == 3
+    assert 'X-Next-Cursor' in response.headers
+
+
+def test_invalid_cursor_is_rejected(client):
+    for url in ['/api/v1/amenities/', '/api/v1/places/',
+                '/api/v1/reviews/', '/api/v1/users/']:
+        response = client.get(f'{url}?cursor=not-a-cursor')
+        assert response.status_code == 400
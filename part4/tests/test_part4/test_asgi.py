@@ -0,0 +1,147 @@
+import asyncio
+import json
+import pytest
+from app import db
+from app.services.facade import hbnb_facade
+from config import TestingConfig
+from tests.test_part4.conftest import make_place
+
+pytest.importorskip('aiosqlite')
+pytest.importorskip('greenlet')
+
+from app.asgi import NATIVE_VIEWS, create_asgi_app  # noqa: E402
+from app.persistence.async_repository import async_db  # noqa: E402
+
+
+@pytest.fixture
+def asgi_app(tmp_path):
+    config = type('AsgiConfig', (TestingConfig,), {
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'hbnb.db'}"})
+    app = create_asgi_app(config)
+    yield app
+    asyncio.run(async_db.dispose())
+    with app.flask_app.app_context():
+        db.engine.dispose()
+
+
+async def call(app, method, path, query=b'', headers=(), body=b''):
+    """Send one request through the ASGI app, return (status, headers,
+    body)."""
+    scope = {'type': 'http', 'method': method, 'path': path,
+             'query_string': query, 'root_path': '', 'scheme': 'http',
+             'http_version': '1.1', 'server': ('testserver', 80),
+             'client': ('127.0.0.1', 1234),
+             'headers': [(name.lower().encode(), value.encode())
+                         for name, value in headers]}
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = messages[0]
+    return (start['status'],
+            {name.decode(): value.decode()
+             for name, value in start['headers']},
+            b''.join(message.get('body', b'') for message in messages[1:]))
+
+
+def get(app, path, **kwargs):
+    return asyncio.run(call(app, 'GET', path, **kwargs))
+
+
+@pytest.fixture
+def seeded(asgi_app):
+    with asgi_app.flask_app.app_context():
+        owner = hbnb_facade.create_user({
+            'first_name': 'Alice', 'last_name': 'Smith',
+            'email': 'alice.smith@example.com', 'password': 'password123'})
+        wifi = hbnb_facade.create_amenity({'name': 'Wifi'})
+        place = make_place(hbnb_facade, owner, amenities=[wifi.id])
+        return {'owner': owner.id, 'amenity': wifi.id, 'place': place.id}
+
+
+@pytest.mark.parametrize('path', [
+    '/api/v1/users/', '/api/v1/users/{owner}',
+    '/api/v1/amenities/', '/api/v1/amenities/{amenity}',
+    '/api/v1/places/', '/api/v1/places/{place}',
+    '/api/v1/reviews/', '/api/v1/places/missing',
+])
+def test_native_views_match_the_flask_app(asgi_app, seeded, path):
+    path = path.format(**seeded)
+    status, headers, body = get(asgi_app, path)
+    expected = asgi_app.flask_app.test_client().get(path)
+    assert status == expected.status_code
+    assert json.loads(body) == expected.json
+    assert headers.get('etag') == expected.headers.get('ETag')
+    assert headers.get('content-type') == expected.headers['Content-Type']
+
+
+def test_every_native_view_is_a_flask_endpoint(asgi_app):
+    endpoints = {rule.endpoint for rule in asgi_app.flask_app.url_map
+                 .iter_rules() if 'GET' in rule.methods}
+    assert set(NATIVE_VIEWS) <= endpoints
+
+
+def test_native_conditional_get(asgi_app, seeded):
+    status, headers, _ = get(asgi_app, '/api/v1/places/')
+    status, _, body = get(asgi_app, '/api/v1/places/',
+                          headers=[('If-None-Match', headers['etag'])])
+    assert status == 304
+    assert body == b''
+
+
+def test_filters_and_cursors(asgi_app, seeded):
+    status, headers, body = get(asgi_app, '/api/v1/places/',
+                                query=b'sort=-price&limit=1')
+    assert status == 200
+    assert [place['id'] for place in json.loads(body)] == [seeded['place']]
+
+    status, _, body = get(asgi_app, '/api/v1/amenities/',
+                          query=b'cursor=not-a-cursor')
+    assert status == 400
+    assert json.loads(body) == {'error': 'Invalid cursor'}
+
+
+def test_writes_go_through_flask(asgi_app, seeded):
+    with asgi_app.flask_app.app_context():
+        from flask_jwt_extended import create_access_token
+        token = create_access_token(identity={'id': seeded['owner'],
+                                              'is_admin': False})
+    status, _, body = asyncio.run(call(
+        asgi_app, 'POST', '/api/v1/amenities/',
+        headers=[('Authorization', f'Bearer {token}'),
+                 ('Content-Type', 'application/json')],
+        body=json.dumps({'name': 'Pool', 'description': 'Heated'}).encode()))
+    assert status == 201
+    created = json.loads(body)
+
+    status, _, body = get(asgi_app, f"/api/v1/amenities/{created['id']}")
+    assert status == 200
+    assert json.loads(body)['amenity']['name'] == 'Pool'
+
+
+def test_invalid_query_strings_get_the_flask_error(asgi_app, seeded):
+    status, _, body = get(asgi_app, '/api/v1/places/', query=b'sort=name')
+    expected = asgi_app.flask_app.test_client().get(
+        '/api/v1/places/?sort=name')
+    assert status == expected.status_code == 400
+    assert json.loads(body) == expected.json
+
+
+def test_cors_headers(asgi_app, seeded):
+    _, headers, _ = get(asgi_app, '/api/v1/amenities/',
+                        headers=[('Origin', 'http://localhost:8000')])
+    assert headers['access-control-allow-origin'] == 'http://localhost:8000'
+
+
+def test_concurrent_requests(asgi_app, seeded):
+    async def burst():
+        return await asyncio.gather(*(
+            call(asgi_app, 'GET', f"/api/v1/places/{seeded['place']}")
+            for _ in range(50)))
+
+    assert {status for status, _, _ in asyncio.run(burst())} == {200}
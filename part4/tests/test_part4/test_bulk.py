@@ -0,0 +1,88 @@
+import json
+from conftest import make_place
+
+
+def ndjson(*records):
+    return '\n'.join(record if isinstance(record, str) else json.dumps(record)
+                     for record in records)
+
+
+def place_data(**overrides):
+    data = {'title': 'Loft', 'description': 'Imported', 'price': 80.0,
+            'latitude': 48.85, 'longitude': 2.35}
+    data.update(overrides)
+    return data
+
+
+def test_bulk_import_creates_places_and_reports_errors(
+        client, facade, owner, guest, auth_headers):
+    wifi = facade.create_amenity({'name': 'Wi-Fi'})
+    body = ndjson(place_data(amenities=[wifi.id]),
+                  '{not json',
+                  '',
+                  place_data(price=-1),
+                  place_data(amenities=['unknown']),
+                  place_data(owner_id=guest.id),
+                  place_data(title='Studio'))
+
+    response = client.post('/api/v1/places/bulk', data=body,
+                           headers=auth_headers(owner))
+    assert response.status_code == 200
+    assert response.get_json() == {'created': 2, 'errors': [
+        {'line': 2, 'error': 'Invalid JSON'},
+        {'line': 4, 'error': 'The price must be positive and not zero.'},
+        {'line': 5, 'error': "Amenity with ID 'unknown' not found"},
+        {'line': 6, 'error': 'Action not allowed'},
+    ]}
+
+    places = {place.title: place for place in facade.get_all_places()}
+    assert set(places) == {'Loft', 'Studio'}
+    assert places['Loft'].owner_id == owner.id
+    assert [a.id for a in places['Loft'].amenities] == [wifi.id]
+
+
+def test_bulk_import_reports_malformed_owner_ids(
+        client, facade, owner, auth_headers):
+    owner.is_admin = True
+    body = ndjson(place_data(owner_id=[owner.id]),
+                  place_data(owner_id={'id': owner.id}),
+                  place_data(owner_id=owner.id))
+
+    response = client.post('/api/v1/places/bulk', data=body,
+                           headers=auth_headers(owner))
+    assert response.status_code == 200
+    assert response.get_json() == {'created': 1, 'errors': [
+        {'line': 1, 'error': 'The owner_id must be a string.'},
+        {'line': 2, 'error': 'The owner_id must be a string.'},
+    ]}
+
+
+def test_bulk_import_requires_authentication(client):
+    response = client.post('/api/v1/places/bulk', data=ndjson(place_data()))
+    assert response.status_code == 401
+
+
+def test_export_streams_every_place(client, facade, owner):
+    wifi = facade.create_amenity({'name': 'Wi-Fi'})
+    places = [make_place(facade, owner, title=f'Place {i}',
+                         amenities=[wifi.id] if i % 2 else [])
+              for i in range(5)]
+
+    response = client.get('/api/v1/places/export')
+    assert response.is_streamed
+    assert response.mimetype == 'application/x-ndjson'
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert exported == [place.to_dict() for place in places]
+
+
+def test_export_round_trips_through_import(
+        app, client, facade, owner, auth_headers):
+    app.config['BULK_CHUNK_SIZE'] = 2
+    for i in range(5):
+        make_place(facade, owner, title=f'Place {i}')
+
+    export = client.get('/api/v1/places/export').text
+    response = client.post('/api/v1/places/bulk', data=export,
+                           headers=auth_headers(owner))
+    assert response.get_json() == {'created': 5, 'errors': []}
+    assert len(facade.get_all_places()) == 10
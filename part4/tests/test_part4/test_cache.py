@@ -0,0 +1,160 @@
+import pickle
+import pytest
+from conftest import make_place
+from sqlalchemy import update
+from app import db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services.cache import FacadeCache, LRUCache, cache
+
+
+class SharedStandIn:
+    """Local replacement for the Redis backend, pickling like it does."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return pickle.loads(self.data[key]) if key in self.data else None
+
+    def set(self, key, value):
+        self.data[key] = pickle.dumps(value)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def clear(self):
+        self.data.clear()
+
+
+def new_request():
+    """Drop the session, as the end of a request does."""
+    db.session.remove()
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUCache(max_size=2, ttl=60)
+    lru.set('a', 1)
+    lru.set('b', 2)
+    lru.get('a')
+    lru.set('c', 3)
+    assert lru.get('b') is None
+    assert (lru.get('a'), lru.get('c')) == (1, 3)
+    assert lru.evictions == 1
+
+
+def test_lru_entries_expire():
+    now = [0]
+    lru = LRUCache(ttl=10, clock=lambda: now[0])
+    lru.set('a', 1)
+    now[0] = 9
+    assert lru.get('a') == 1
+    now[0] = 10
+    assert lru.get('a') is None
+    assert lru.expirations == 1
+
+
+def test_getters_read_through(facade, owner, count_queries):
+    place_id, owner_id = make_place(facade, owner).id, owner.id
+    new_request()
+    assert facade.get_place(place_id).title == 'Cozy Apartment'
+    new_request()
+
+    with count_queries() as statements:
+        cached = facade.get_place(place_id)
+        assert cached.title == 'Cozy Apartment'
+        assert cached.owner_id == owner_id
+    assert statements == []
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+    # Lazy relationships still work on cached instances
+    assert cached.amenities == []
+
+
+def test_missing_objects_are_not_cached(facade):
+    assert facade.get_user('missing') is None
+    assert facade.get_user('missing') is None
+    assert cache.stats()['misses'] == 2
+
+
+def test_updates_invalidate(facade, owner, guest):
+    place_id, guest_id = make_place(facade, owner).id, guest.id
+    facade.get_place(place_id)
+    facade.update_place(place_id, {'title': 'Renamed'})
+    new_request()
+    assert facade.get_place(place_id).title == 'Renamed'
+
+    facade.create_review({'text': 'Great', 'rating': 4,
+                          'place_id': place_id, 'user_id': guest_id})
+    new_request()
+    assert facade.get_place(place_id).review_count == 1
+
+
+def test_cached_instances_can_be_updated(facade, owner):
+    user_id = owner.id
+    facade.get_user(user_id)
+    new_request()
+    facade.update_user(user_id, {'first_name': 'Alicia'})
+    new_request()
+    assert db.session.get(User, user_id).first_name == 'Alicia'
+    assert facade.get_user(user_id).first_name == 'Alicia'
+
+
+def test_shared_backend(app, facade, owner):
+    shared = SharedStandIn()
+    cache.init_app(app, shared=shared)
+    amenity = facade.create_amenity({'name': 'Wi-Fi'})
+    facade.get_amenity(amenity.id)
+    assert f'Amenity:{amenity.id}' in shared.data
+
+    # Another process: empty local cache, same shared backend
+    cache.local.clear()
+    new_request()
+    assert facade.get_amenity(amenity.id).name == 'Wi-Fi'
+    assert cache.stats()['hits'] == 1
+
+    facade.delete_amenity(amenity.id)
+    assert shared.data == {}
+
+
+def test_invalidations_reach_the_other_processes(app, facade):
+    shared = SharedStandIn()
+    cache.init_app(app, shared=shared)
+    other = FacadeCache()
+    other.init_app(app, shared=shared)
+    amenity_id = facade.create_amenity({'name': 'Wi-Fi'}).id
+    assert facade.get_amenity(amenity_id).name == 'Wi-Fi'
+
+    # Written by another worker, which invalidates its own cache
+    db.session.execute(update(Amenity).values(name='Fiber'))
+    db.session.commit()
+    other.invalidate(Amenity, amenity_id)
+    new_request()
+    assert facade.get_amenity(amenity_id).name == 'Fiber'
+
+
+def test_writes_read_the_database_not_the_cache(facade, owner, guest):
+    place_id = make_place(facade, owner).id
+    review_id = facade.create_review({'text': 'Nice', 'rating': 4,
+                                      'place_id': place_id,
+                                      'user_id': guest.id}).id
+    facade.get_review(review_id)
+    # Changed by another worker: the cached snapshot still says 4
+    db.session.execute(update(Review).values(rating=2))
+    db.session.commit()
+    facade.place_repository.rebuild_rating_aggregates()
+    new_request()
+
+    facade.update_review(review_id, {'rating': 5})
+    new_request()
+    assert db.session.get(Place, place_id).avg_rating == 5
+
+
+def test_cache_can_be_disabled(app, facade, owner):
+    app.config['CACHE_ENABLED'] = False
+    cache.init_app(app)
+    facade.get_user(owner.id)
+    facade.get_user(owner.id)
+    assert cache.stats()['size'] == 0
@@ -0,0 +1,114 @@
+import pytest
+from app.models.amenity import Amenity
+from app.services.passwords import password_hasher
+from conftest import make_place
+
+# Facade writes commit once, reads never
+WRITES = {
+    'create_user': lambda f, w: f.create_user({
+        'first_name': 'Carol', 'last_name': 'White',
+        'email': 'carol.white@example.com', 'password': 'password123'}),
+    'update_user': lambda f, w: f.update_user(
+        w['guest'].id, {'first_name': 'Robert', 'last_name': 'Brown'}),
+    'create_place': lambda f, w: make_place(
+        f, w['owner'], amenities=[w['amenity'].id]),
+    'update_place': lambda f, w: f.update_place(
+        w['place'].id, {'title': 'Loft', 'price': 120.0}),
+    'import_places': lambda f, w: f.import_places([
+        (1, {'title': 'Cabin', 'price': 60.0, 'latitude': 1.0,
+             'longitude': 2.0, 'owner_id': w['owner'].id}),
+        (2, {'title': 'Chalet', 'price': 90.0, 'latitude': 3.0,
+             'longitude': 4.0, 'owner_id': w['owner'].id})]),
+    'create_amenity': lambda f, w: f.create_amenity({'name': 'Pool'}),
+    'update_amenity': lambda f, w: f.update_amenity(
+        w['amenity'].id, {'name': 'Fast Wi-Fi', 'description': 'Fiber'}),
+    'delete_amenity': lambda f, w: f.delete_amenity(w['amenity'].id),
+    'create_review': lambda f, w: f.create_review({
+        'text': 'Lovely', 'rating': 5, 'place_id': w['place'].id,
+        'user_id': w['owner'].id}),
+    'update_review': lambda f, w: f.update_review(
+        w['review'].id, {'text': 'Fine', 'rating': 3}),
+    'delete_review': lambda f, w: f.delete_review(w['review'].id),
+    'rebuild_rating_aggregates': lambda f, w: f.rebuild_rating_aggregates(),
+}
+
+READS = {
+    'get_user': lambda f, w: f.get_user(w['owner'].id),
+    'get_all_users': lambda f, w: f.get_all_users(),
+    'get_users_page': lambda f, w: f.get_users_page(10),
+    'get_user_by_email': lambda f, w: f.get_user_by_email(w['owner'].email),
+    'authenticate_user': lambda f, w: f.authenticate_user(
+        w['owner'].email, 'password123'),
+    'get_place': lambda f, w: f.get_place(w['place'].id),
+    'get_all_places': lambda f, w: f.get_all_places(),
+    'get_places_page': lambda f, w: f.get_places_page(10),
+    'search_places_by_radius': lambda f, w: f.search_places_by_radius(
+        37.7749, -122.4194, 10, 10),
+    'search_places_by_box': lambda f, w: f.search_places_by_box(
+        37, -123, 38, -122, 10),
+    'export_places': lambda f, w: list(f.export_places(10)),
+    'get_amenity': lambda f, w: f.get_amenity(w['amenity'].id),
+    'get_all_amenities': lambda f, w: f.get_all_amenities(),
+    'get_amenities_page': lambda f, w: f.get_amenities_page(10),
+    'get_review': lambda f, w: f.get_review(w['review'].id),
+    'get_all_reviews': lambda f, w: f.get_all_reviews(),
+    'get_reviews_page': lambda f, w: f.get_reviews_page(10),
+    'get_reviews_by_place': lambda f, w: f.get_reviews_by_place(
+        w['place'].id),
+    'get_review_by_user_and_place': lambda f, w:
+        f.get_review_by_user_and_place(w['guest'].id, w['place'].id),
+}
+
+
+@pytest.fixture
+def world(facade, owner, guest):
+    amenity = facade.create_amenity({'name': 'Wi-Fi'})
+    place = make_place(facade, owner)
+    review = facade.create_review({'text': 'Nice', 'rating': 4,
+                                   'place_id': place.id,
+                                   'user_id': guest.id})
+    return {'owner': owner, 'guest': guest, 'place': place,
+            'amenity': amenity, 'review': review}
+
+
+@pytest.mark.parametrize('operation', WRITES)
+def test_writes_commit_once(facade, world, count_commits, operation):
+    with count_commits() as commits:
+        WRITES[operation](facade, world)
+    assert len(commits) == 1
+
+
+@pytest.mark.parametrize('operation', READS)
+def test_reads_do_not_commit(facade, world, count_commits, operation):
+    with count_commits() as commits:
+        READS[operation](facade, world)
+    assert commits == []
+
+
+def test_rehash_on_login_commits_once(facade, owner, count_commits,
+                                      monkeypatch):
+    monkeypatch.setattr(password_hasher, 'rounds', password_hasher.rounds + 1)
+    with count_commits() as commits:
+        assert facade.authenticate_user(owner.email, 'password123')
+    assert len(commits) == 1
+
+
+def test_amenity_setters_do_not_commit(app, count_commits):
+    with count_commits() as commits:
+        amenity = Amenity('Sauna')
+        amenity.set_name('Steam room')
+        amenity.update({'description': 'Hot'})
+    assert commits == []
+    with pytest.raises(ValueError):
+        amenity.set_name('')
+
+
+def test_rejected_amenity_update_changes_nothing(facade, world,
+                                                 count_commits):
+    amenity = world['amenity']
+    with count_commits() as commits:
+        with pytest.raises(ValueError):
+            facade.update_amenity(amenity.id, {'description': 'Fiber',
+                                               'name': ''})
+    assert commits == []
+    assert (amenity.name, amenity.description) == ('Wi-Fi', None)
@@ -0,0 +1,103 @@
+import pytest
+from conftest import make_place
+from app import db
+
+
+@pytest.fixture
+def place(facade, owner):
+    return make_place(facade, owner)
+
+
+def test_resource_etag_round_trip(client, place, count_queries):
+    url = f'/api/v1/places/{place.id}'
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert 'Last-Modified' in first.headers
+
+    with count_queries() as statements:
+        second = client.get(url, headers={'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.data == b''
+    assert second.headers['ETag'] == etag
+    # The place comes from the facade cache and is not serialized
+    assert statements == []
+
+
+def test_resource_etag_changes_with_the_object(client, facade, place):
+    url = f'/api/v1/places/{place.id}'
+    etag = client.get(url).headers['ETag']
+    facade.update_place(place.id, {'title': 'Renamed'})
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_if_modified_since(client, owner):
+    url = f'/api/v1/users/{owner.id}'
+    last_modified = client.get(url).headers['Last-Modified']
+    response = client.get(url, headers={'If-Modified-Since': last_modified})
+    assert response.status_code == 304
+    response = client.get(url, headers={
+        'If-Modified-Since': 'Thu, 01 Jan 1970 00:00:00 GMT'})
+    assert response.status_code == 200
+
+
+def test_new_place_changes_the_owner_etag(client, facade, owner):
+    url = f'/api/v1/users/{owner.id}'
+    etag = client.get(url).headers['ETag']
+    make_place(facade, owner)
+    response = client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert len(response.get_json()['owned_places']) == 1
+
+
+def test_collection_etag_follows_table_version(client, facade, owner,
+                                                count_queries):
+    make_place(facade, owner)
+    first = client.get('/api/v1/places/?limit=10')
+    etag = first.headers['ETag']
+
+    with count_queries() as statements:
+        response = client.get('/api/v1/places/?limit=10',
+                              headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert len(statements) == 1   # the version lookup only
+
+    # Other query strings are other representations
+    response = client.get('/api/v1/places/?limit=5',
+                          headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+    make_place(facade, owner, title='Second')
+    response = client.get('/api/v1/places/?limit=10',
+                          headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert len(response.get_json()) == 2
+
+
+def test_bulk_statements_bump_versions(client, facade, owner):
+    etag = client.get('/api/v1/places/').headers['ETag']
+    facade.import_places([(1, {'title': 'Imported', 'description': '',
+                               'price': 10, 'latitude': 1, 'longitude': 1,
+                               'owner_id': owner.id})])
+    response = client.get('/api/v1/places/',
+                          headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+    etag = response.headers['ETag']
+    facade.rebuild_rating_aggregates()
+    response = client.get('/api/v1/places/',
+                          headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+
+def test_failed_writes_do_not_bump_versions(client, facade, owner):
+    etag = client.get('/api/v1/amenities/').headers['ETag']
+    with pytest.raises(RuntimeError):
+        with facade.unit_of_work():
+            facade.create_amenity({'name': 'Pool'})
+            raise RuntimeError
+    response = client.get('/api/v1/amenities/',
+                          headers={'If-None-Match': etag})
+    assert response.status_code == 304
@@ -0,0 +1,78 @@
+import json
+from datetime import datetime
+import pytest
+from app import create_app, db
+from app.api.v1.encoders import ENCODERS, get_encoder
+from conftest import make_place
+from config import TestingConfig
+
+DOCUMENT = {
+    'id': 'a', 'price': 80.5, 'amenities': ['x', 'y'], 'avg_rating': None,
+    'created_at': datetime(2024, 5, 1, 12, 30),
+    'updated_at': datetime(2024, 5, 1, 12, 30, 15, 123),
+}
+
+
+def encoder_app(encoder, **settings):
+    return create_app(type('EncoderConfig', (TestingConfig,), {
+        'JSON_ENCODER': encoder, **settings}))
+
+
+@pytest.mark.parametrize('name', sorted(ENCODERS))
+def test_encoders_write_datetimes_like_isoformat(name):
+    if name == 'orjson':
+        pytest.importorskip('orjson')
+    decoded = json.loads(ENCODERS[name](DOCUMENT))
+    assert decoded == dict(
+        DOCUMENT, created_at='2024-05-01T12:30:00',
+        updated_at='2024-05-01T12:30:15.000123')
+    assert json.loads(ENCODERS[name](DOCUMENT, pretty=True)) == decoded
+
+
+def test_unknown_encoder_is_rejected():
+    with pytest.raises(ValueError):
+        get_encoder({'JSON_ENCODER': 'yaml'})
+
+
+def test_orjson_responses_match_the_json_ones(tmp_path, facade):
+    pytest.importorskip('orjson')
+    uri = f"sqlite:///{tmp_path / 'hbnb.db'}"
+    apps = [encoder_app(name, SQLALCHEMY_DATABASE_URI=uri)
+            for name in ('json', 'orjson')]
+    with apps[0].app_context():
+        owner = facade.create_user({
+            'first_name': 'Alice', 'last_name': 'Smith',
+            'email': 'alice.smith@example.com', 'password': 'password123'})
+        place = make_place(facade, owner)
+        paths = ['/api/v1/places/', f'/api/v1/places/{place.id}',
+                 '/api/v1/users/']
+
+    def responses(app):
+        client = app.test_client()
+        export = client.get('/api/v1/places/export').data.splitlines()
+        return [client.get(path) for path in paths], \
+            [json.loads(line) for line in export]
+
+    expected, expected_export = responses(apps[0])
+    actual, export = responses(apps[1])
+    assert [response.json for response in actual] == \
+        [response.json for response in expected]
+    assert {response.content_type for response in actual} == \
+        {'application/json'}
+    assert export == expected_export
+    for app in apps:
+        with app.app_context():
+            db.engine.dispose()
+
+
+def test_custom_encoder():
+    calls = []
+
+    def dumps(data, pretty=False):
+        calls.append(data)
+        return ENCODERS['json'](data, pretty)
+
+    client = encoder_app(dumps).test_client()
+    response = client.get('/api/v1/amenities/')
+    assert response.status_code == 200
+    assert calls[-1] == []
@@ -0,0 +1,83 @@
+import logging
+import threading
+import pytest
+from sqlalchemy import text
+from app import create_app, db
+from app.persistence.engine import database_uri, engine_options
+from app.services.facade import hbnb_facade
+from config import TestingConfig
+
+
+def test_database_uri_precedence():
+    assert database_uri({'DATABASE_URL': 'postgres://u:p@db/hbnb'}) == \
+        'postgresql://u:p@db/hbnb'
+    assert database_uri({'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+                         'DATABASE_URL': 'postgresql://db/hbnb'}) == \
+        'sqlite://'
+    assert database_uri({}) == 'sqlite:///hbnb_database.db'
+
+
+def test_server_databases_get_a_sized_pool():
+    options = engine_options({'DB_POOL_SIZE': 5, 'DB_MAX_OVERFLOW': 2},
+                             'postgresql://db/hbnb')
+    assert options['pool_size'] == 5
+    assert options['max_overflow'] == 2
+    assert options['pool_pre_ping']
+    assert 'pool_size' not in engine_options({}, 'sqlite:///x.db')
+
+
+@pytest.fixture
+def file_app(tmp_path, caplog):
+    config = type('FileConfig', (TestingConfig,), {
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'hbnb.db'}"})
+    with caplog.at_level(logging.INFO, logger='app.persistence.engine'):
+        app = create_app(config)
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+def test_sqlite_pragmas(file_app, caplog):
+    with file_app.app_context():
+        pragma = lambda name: db.session.execute(
+            text(f'PRAGMA {name}')).scalar()
+        assert pragma('journal_mode') == 'wal'
+        assert pragma('synchronous') == 1   # NORMAL
+        assert pragma('busy_timeout') == 5000
+        assert pragma('mmap_size') == 256 * 1024 * 1024
+    startup_log = ' '.join(record.getMessage()
+                           for record in caplog.get_records('setup'))
+    assert 'journal_mode=wal' in startup_log
+    assert 'busy_timeout=5000' in startup_log
+
+
+def test_concurrent_writers_and_readers(file_app):
+    errors = []
+
+    def writer(n):
+        with file_app.app_context():
+            try:
+                for i in range(20):
+                    hbnb_facade.create_amenity({'name': f'Amenity {n}-{i}'})
+            except Exception as e:
+                errors.append(e)
+
+    def reader():
+        with file_app.app_context():
+            try:
+                for _ in range(20):
+                    hbnb_facade.get_amenities_page(50)
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+    threads += [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with file_app.app_context():
+        assert db.session.execute(
+            text('SELECT count(*) FROM amenity')).scalar() == 160
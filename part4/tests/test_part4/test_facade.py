@@ -0,0 +1,34 @@
+from conftest import make_place
+
+
+def test_get_reviews_by_place_filters_on_place_id(facade, owner, guest):
+    place = make_place(facade, owner)
+    other_place = make_place(facade, owner, title='Other Place')
+
+    review = facade.create_review({'text': 'Great stay!', 'rating': 5,
+                                   'place_id': place.id,
+                                   'user_id': guest.id})
+    facade.create_review({'text': 'Not bad', 'rating': 3,
+                          'place_id': other_place.id,
+                          'user_id': guest.id})
+
+    assert facade.get_reviews_by_place(place.id) == [review]
+    assert facade.get_reviews_by_place('unknown') == []
+
+
+def test_get_review_by_user_and_place(facade, owner, guest):
+    place = make_place(facade, owner)
+    review = facade.create_review({'text': 'Great stay!', 'rating': 5,
+                                   'place_id': place.id,
+                                   'user_id': guest.id})
+
+    assert facade.get_review_by_user_and_place(guest.id, place.id) == review
+    assert facade.get_review_by_user_and_place(owner.id, place.id) is None
+
+
+def test_review_foreign_keys_are_indexed(app):
+    from app.models.review import Review
+
+    indexed = {column.name for index in Review.__table__.indexes
+               for column in index.columns}
+    assert {'place_id', 'user_id'} <= indexed
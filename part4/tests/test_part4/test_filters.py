@@ -0,0 +1,85 @@
+import pytest
+from conftest import make_place
+
+
+@pytest.fixture
+def places(facade, owner, guest):
+    wifi = facade.create_amenity({'name': 'Wi-Fi'})
+    pool = facade.create_amenity({'name': 'Pool'})
+    places = {}
+    for title, price, amenities, ratings in (
+            ('Hostel', 20.0, [wifi], [3]),
+            ('Cabin', 80.0, [], []),
+            ('Loft', 150.0, [wifi, pool], [5, 4]),
+            ('Villa', 400.0, [pool], [2])):
+        place = make_place(facade, owner, title=title, price=price)
+        for amenity in amenities:
+            place.add_amenity(amenity)
+        for rating in ratings:
+            facade.create_review({'text': 'Stayed here', 'rating': rating,
+                                  'place_id': place.id,
+                                  'user_id': guest.id})
+        places[title] = place
+    facade.place_repository.db.session.commit()
+    return places, wifi, pool
+
+
+def titles(response):
+    assert response.status_code == 200
+    return [place['title'] for place in response.get_json()]
+
+
+def test_price_range(client, places):
+    response = client.get('/api/v1/places/?min_price=50&max_price=200')
+    assert titles(response) == ['Cabin', 'Loft']
+
+
+def test_places_must_offer_every_amenity(client, places):
+    _, wifi, pool = places
+    response = client.get(f'/api/v1/places/?amenities={wifi.id}')
+    assert titles(response) == ['Hostel', 'Loft']
+    response = client.get(f'/api/v1/places/?amenities={wifi.id},{pool.id}')
+    assert titles(response) == ['Loft']
+
+
+def test_sort_by_price(client, places):
+    assert titles(client.get('/api/v1/places/?sort=-price')) == \
+        ['Villa', 'Loft', 'Cabin', 'Hostel']
+    assert titles(client.get('/api/v1/places/?sort=price&max_price=100')) \
+        == ['Hostel', 'Cabin']
+
+
+def test_sort_and_filter_by_rating(client, places):
+    assert titles(client.get('/api/v1/places/?sort=rating')) == \
+        ['Loft', 'Hostel', 'Villa', 'Cabin']
+    assert titles(client.get('/api/v1/places/?min_rating=3')) == \
+        ['Hostel', 'Loft']
+
+
+@pytest.mark.parametrize('sort', ['price', '-price', 'rating'])
+def test_sorted_pages_follow_the_cursor(client, facade, owner, places, sort):
+    # Ties on the sort value are broken by creation order
+    for i in range(3):
+        make_place(facade, owner, title=f'Twin {i}', price=80.0)
+    expected = titles(client.get(f'/api/v1/places/?sort={sort}'))
+
+    seen, cursor = [], ''
+    while True:
+        response = client.get(
+            f'/api/v1/places/?sort={sort}&limit=2&cursor={cursor}')
+        seen += titles(response)
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+    assert seen == expected
+    assert len(seen) == 7
+
+
+def test_invalid_filters_are_rejected(client, places):
+    assert client.get('/api/v1/places/?sort=title').status_code == 400
+    assert client.get(
+        '/api/v1/places/?min_price=300&max_price=100').status_code == 400
+    sorted_page = client.get('/api/v1/places/?sort=price&limit=1')
+    cursor = sorted_page.headers['X-Next-Cursor']
+    assert client.get(
+        f'/api/v1/places/?cursor={cursor}').status_code == 400
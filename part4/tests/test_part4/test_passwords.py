@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import Future
+import pytest
+from app.services.passwords import (
+    PasswordHasher, PasswordHasherBusy, hash_cost, password_hasher)
+
+LOGIN = {'email': 'alice.smith@example.com', 'password': 'password123'}
+
+
+def test_hashes_use_the_configured_cost(owner):
+    assert hash_cost(owner.password) == 4
+    assert owner.verify_password('password123')
+    assert not owner.verify_password('wrong')
+
+
+def test_login_rehashes_when_the_cost_changes(client, facade, owner):
+    password_hasher.rounds = 5
+    response = client.post('/api/v1/auth/login', json=LOGIN)
+    assert response.status_code == 200
+    user = facade.get_user_by_email(LOGIN['email'])
+    assert hash_cost(user.password) == 5
+    assert user.verify_password('password123')
+
+
+def test_failed_login_keeps_the_hash(client, facade, owner):
+    old_hash = owner.password
+    password_hasher.rounds = 5
+    response = client.post('/api/v1/auth/login',
+                           json=dict(LOGIN, password='wrong'))
+    assert response.status_code == 401
+    assert facade.get_user_by_email(LOGIN['email']).password == old_hash
+
+
+def test_process_pool():
+    hasher = PasswordHasher(rounds=4, workers=2)
+    try:
+        hashed = hasher.hash('secret')
+        assert hasher.verify(hashed, 'secret')
+        assert not hasher.verify(hashed, 'other')
+    finally:
+        hasher.shutdown()
+
+
+def test_saturated_queue_rejects_early():
+    hasher = PasswordHasher(rounds=4, workers=1, queue_size=1)
+    entered, release = threading.Event(), threading.Event()
+    hasher._executor = lambda: BlockingExecutor(entered, release)
+    worker = threading.Thread(target=hasher.hash, args=('secret',))
+    worker.start()
+    entered.wait(5)
+    try:
+        with pytest.raises(PasswordHasherBusy):
+            hasher.hash('secret')
+    finally:
+        release.set()
+        worker.join()
+    assert hasher.hash('secret')
+
+
+def test_timed_out_job_keeps_its_slot_until_it_ends():
+    hasher = PasswordHasher(rounds=4, workers=1, queue_size=1, timeout=0.01)
+    executor = PendingExecutor()
+    hasher._executor = lambda: executor
+    with pytest.raises(PasswordHasherBusy, match='timed out'):
+        hasher.hash('secret')
+    with pytest.raises(PasswordHasherBusy, match='queued'):
+        hasher.hash('secret')
+
+    executor.futures[0].set_result('done')
+    with pytest.raises(PasswordHasherBusy, match='timed out'):
+        hasher.hash('secret')
+
+
+def test_login_answers_503_when_saturated(client, owner, monkeypatch):
+    def busy(*args):
+        raise PasswordHasherBusy("Too many password operations queued")
+    monkeypatch.setattr(password_hasher, '_run', busy)
+    response = client.post('/api/v1/auth/login', json=LOGIN)
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+
+
+class BlockingExecutor:
+    """Executor stand-in whose jobs block until ``release`` is set."""
+
+    def __init__(self, entered, release):
+        self.entered = entered
+        self.release = release
+
+    def submit(self, func, *args):
+        future = Future()
+        self.entered.set()
+        self.release.wait(5)
+        future.set_result(func(*args))
+        return future
+
+
+class PendingExecutor:
+    """Executor stand-in whose jobs never run on their own."""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, func, *args):
+        self.futures.append(Future())
+        return self.futures[-1]
@@ -0,0 +1,69 @@
+import pytest
+from flask_jwt_extended import view_decorators
+from app import db
+from app.services.principal import principals, request_identity
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Count the tokens flask-jwt-extended decodes."""
+    calls = []
+    decode_token = view_decorators.decode_token
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return decode_token(*args, **kwargs)
+    monkeypatch.setattr(view_decorators, 'decode_token', counting)
+    return calls
+
+
+def user_queries(statements):
+    return [s for s in statements if 'FROM user' in s]
+
+
+def test_protected_endpoint_loads_the_user_once_per_token(
+        client, facade, owner, auth_headers, count_queries):
+    headers = auth_headers(owner)
+    facade.cache.clear()
+    db.session.expunge_all()
+    with count_queries() as first:
+        response = client.get('/api/v1/auth/protected', headers=headers)
+    assert response.json == {'message': 'Welcome, Alice Smith !'}
+    assert len(user_queries(first)) == 1
+
+    with count_queries() as second:
+        response = client.get('/api/v1/auth/protected', headers=headers)
+    assert response.status_code == 200
+    assert user_queries(second) == []
+
+
+def test_token_is_decoded_once_per_request(app, owner, auth_headers,
+                                           decodes):
+    with app.test_request_context(headers=auth_headers(owner)):
+        for _ in range(3):
+            assert request_identity()['id'] == owner.id
+    assert len(decodes) == 1
+
+
+def test_principal_is_scoped_to_the_request(app, owner, guest,
+                                            auth_headers):
+    app.add_url_rule('/whoami', 'whoami',
+                     lambda: {'principal': principals.current()})
+    client = app.test_client()
+
+    def whoami(headers=None):
+        principal = client.get('/whoami', headers=headers).json['principal']
+        return principal and principal['id']
+
+    assert whoami(auth_headers(owner)) == owner.id
+    assert whoami() is None
+    assert whoami(auth_headers(guest)) == guest.id
+    assert whoami({'Authorization': 'Bearer not-a-token'}) is None
+
+
+def test_unknown_user_has_no_principal(client):
+    from flask_jwt_extended import create_access_token
+    token = create_access_token(identity={'id': 'gone', 'is_admin': False})
+    response = client.get('/api/v1/auth/protected',
+                          headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 404
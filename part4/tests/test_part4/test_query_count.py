@@ -0,0 +1,59 @@
+import pytest
+from conftest import make_place
+
+# Statements allowed per list request: one for the page itself plus one
+# per eager-loaded collection.
+# Main query, eager loads, and the table version lookup of the ETag
+MAX_STATEMENTS = 4
+
+
+def populate(facade, owner, guest, count):
+    amenities = [facade.create_amenity({'name': f'Amenity {i}'})
+                 for i in range(2)]
+    for i in range(count):
+        place = make_place(facade, owner, title=f'Place {i}',
+                           amenities=[a.id for a in amenities])
+        facade.create_review({'text': 'Nice', 'rating': 4,
+                              'place_id': place.id, 'user_id': guest.id})
+    return place
+
+
+@pytest.mark.parametrize('url', [
+    '/api/v1/places/',
+    '/api/v1/users/',
+    '/api/v1/amenities/',
+    '/api/v1/reviews/',
+])
+def test_list_endpoints_issue_a_constant_number_of_queries(
+        client, facade, owner, guest, count_queries, url):
+    counts = []
+    for batch in (2, 6):
+        populate(facade, owner, guest, batch)
+        with count_queries() as statements:
+            assert client.get(url).status_code == 200
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+    assert counts[1] <= MAX_STATEMENTS
+
+
+def test_reviews_by_place_issue_a_single_query(
+        client, facade, owner, guest, count_queries):
+    place = populate(facade, owner, guest, 3)
+    url = f'/api/v1/reviews/places/{place.id}/reviews'
+
+    with count_queries() as statements:
+        response = client.get(url)
+    assert response.status_code == 200
+    review_queries = [s for s in statements if 'table_version' not in s]
+    assert len(review_queries) == 1
+
+
+def test_serialized_place_reads_foreign_keys(facade, owner):
+    place = make_place(facade, owner)
+    amenity = facade.create_amenity({'name': 'Wi-Fi'})
+    place.add_amenity(amenity)
+
+    place_dict = place.to_dict()
+    assert place_dict['owner_id'] == owner.id
+    assert place_dict['amenities'] == [amenity.id]
@@ -0,0 +1,99 @@
+import pytest
+from app.services.passwords import password_hasher
+from app.services.ratelimit import SlidingWindowCounter, login_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def login(client, email, password='wrong', ip='10.0.0.1'):
+    return client.post('/api/v1/auth/login',
+                       json={'email': email, 'password': password},
+                       environ_base={'REMOTE_ADDR': ip})
+
+
+@pytest.fixture
+def lookups(monkeypatch, facade):
+    """Count the user lookups and password checks of the logins."""
+    calls = []
+    repository = facade.user_repository
+    get_by_attribute = repository.get_by_attribute
+    verify = password_hasher.verify
+
+    def counting_lookup(*args):
+        calls.append('lookup')
+        return get_by_attribute(*args)
+
+    def counting_verify(*args):
+        calls.append('verify')
+        return verify(*args)
+    monkeypatch.setattr(repository, 'get_by_attribute', counting_lookup)
+    monkeypatch.setattr(password_hasher, 'verify', counting_verify)
+    return calls
+
+
+def test_window_slides():
+    clock = FakeClock()
+    counter = SlidingWindowCounter(clock)
+    assert [counter.hit('k', 3, 10)[0] for _ in range(4)] == \
+        [True, True, True, False]
+
+    clock.now = 1010  # the previous window still counts in full
+    assert counter.hit('k', 3, 10) == (False, 3)
+    clock.now = 1015  # half of it does
+    assert counter.hit('k', 3, 10) == (True, 2.5)
+    assert counter.count('k') == 2.5
+    clock.now = 1030
+    assert counter.count('k') == 0
+
+    counter.hit('other', 3, 10)
+    counter.prune()
+    assert counter.counters() == {'other': 1}
+
+
+def test_attempts_over_the_limit_skip_the_lookup(client, owner, lookups):
+    for _ in range(5):
+        assert login(client, owner.email).status_code == 401
+    assert lookups.count('lookup') == 5
+
+    response = login(client, owner.email.upper())
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '60'
+    response = login(client, owner.email, 'password123', ip='10.0.0.2')
+    assert response.status_code == 429
+    assert lookups.count('lookup') == 5
+    assert lookups.count('verify') == 5
+
+
+def test_client_ip_is_limited_across_accounts(client, owner):
+    for i in range(20):
+        login(client, f'user{i}@example.com')
+    assert login(client, owner.email, 'password123').status_code == 429
+    assert login(client, owner.email, 'password123',
+                 ip='10.0.0.2').status_code == 200
+    assert login_limiter.stats()['rejected'] == 1
+
+
+def test_successful_login_resets_the_account_count(client, owner):
+    for _ in range(4):
+        login(client, owner.email)
+    assert login(client, owner.email, 'password123').status_code == 200
+    keys = login_limiter.stats()['keys']
+    assert 'email:alice.smith@example.com' not in keys
+    for _ in range(4):
+        assert login(client, owner.email).status_code == 401
+
+
+def test_counts_outlive_the_limiter_in_a_shared_backend(app, client, owner):
+    shared = SlidingWindowCounter()
+    login_limiter.init_app(app, backend=shared)
+    for _ in range(5):
+        login(client, owner.email)
+    assert shared.count('email:alice.smith@example.com') == 5
+    login_limiter.init_app(app, backend=shared)
+    assert login(client, owner.email, ip='10.0.0.9').status_code == 429
@@ -0,0 +1,100 @@
+import pytest
+from conftest import make_place
+from app import db
+
+
+@pytest.fixture
+def place(facade, owner):
+    return make_place(facade, owner)
+
+
+def review(facade, place, user, rating):
+    return facade.create_review({'text': 'Stayed here', 'rating': rating,
+                                 'place_id': place.id, 'user_id': user.id})
+
+
+def aggregates(place):
+    db.session.refresh(place)
+    return place.avg_rating, place.review_count
+
+
+def test_new_places_are_unrated(place):
+    assert aggregates(place) == (0.0, 0)
+    assert place.to_dict()['review_count'] == 0
+
+
+def test_aggregates_follow_review_changes(facade, place, owner, guest):
+    first = review(facade, place, guest, 4)
+    review(facade, place, owner, 1)
+    assert aggregates(place) == (2.5, 2)
+
+    facade.update_review(first.id, {'rating': 5})
+    assert aggregates(place) == (3.0, 2)
+
+    facade.delete_review(first.id)
+    assert aggregates(place) == (1.0, 1)
+
+
+def test_moving_a_review_updates_both_places(facade, place, owner, guest):
+    other = make_place(facade, owner, title='Other')
+    moved = review(facade, place, guest, 4)
+    facade.update_review(moved.id, {'place_id': other.id})
+    assert aggregates(place) == (0.0, 0)
+    assert aggregates(other) == (4.0, 1)
+
+
+def test_review_and_aggregates_commit_together(facade, place, guest,
+                                               count_queries):
+    with count_queries() as statements:
+        review(facade, place, guest, 3)
+    inserts = [i for i, s in enumerate(statements)
+               if s.startswith('INSERT INTO review')]
+    updates = [i for i, s in enumerate(statements)
+               if s.startswith('UPDATE place SET avg_rating')]
+    assert len(inserts) == len(updates) == 1
+    # computed from the review table, once the review is in it
+    assert inserts[0] < updates[0]
+
+
+def test_aggregates_are_numbers_inside_a_unit_of_work(facade, place, owner,
+                                                       guest):
+    with facade.unit_of_work():
+        review(facade, place, guest, 4)
+        review(facade, place, owner, 1)
+        assert (place.avg_rating, place.review_count) == (2.5, 2)
+        assert place.to_dict()['avg_rating'] == 2.5
+
+
+def test_aggregates_match_a_rebuild(facade, place, owner, guest):
+    third = facade.create_user({
+        'first_name': 'Carol', 'last_name': 'White',
+        'email': 'carol.white@example.com', 'password': 'password123'})
+    reviews = [review(facade, place, user, rating)
+               for user, rating in ((guest, 1), (owner, 2), (third, 2))]
+    for rating in (5, 3, 4, 2, 5, 1, 4):
+        facade.update_review(reviews[0].id, {'rating': rating})
+    expected = aggregates(place)
+    facade.rebuild_rating_aggregates()
+    assert aggregates(place) == expected
+
+
+def test_rebuild_command(app, facade, place, owner, guest):
+    review(facade, place, guest, 2)
+    review(facade, place, owner, 5)
+    db.session.execute(db.text(
+        'UPDATE place SET avg_rating = 0, review_count = 0'))
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=['rebuild-ratings'])
+    assert 'of 1 places' in result.output
+    assert aggregates(place) == (3.5, 2)
+
+
+def test_rating_sort_reads_no_reviews(client, facade, owner, guest,
+                                      count_queries):
+    for rating in (2, 5):
+        review(facade, make_place(facade, owner), guest, rating)
+    with count_queries() as statements:
+        response = client.get('/api/v1/places/?sort=rating&min_rating=1')
+    assert [p['avg_rating'] for p in response.get_json()] == [5.0, 2.0]
+    assert not any('FROM review' in s for s in statements)
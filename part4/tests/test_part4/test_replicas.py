@@ -0,0 +1,142 @@
+import sqlite3
+import pytest
+from app import create_app, db
+from app.persistence import replicas
+from app.persistence.unit_of_work import unit_of_work
+from app.services.cache import LRUCache
+from app.services.facade import hbnb_facade
+from config import TestingConfig
+
+
+@pytest.fixture
+def replica_app(tmp_path, monkeypatch):
+    """An app with a file primary and one replica, copied on demand."""
+    primary, replica = tmp_path / 'primary.db', tmp_path / 'replica.db'
+    config = type('ReplicaConfig', (TestingConfig,), {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{primary}',
+        'DATABASE_REPLICA_URLS': [f'sqlite:///{replica}'],
+        'REPLICA_STICKY_SECONDS': 60,
+        'CACHE_ENABLED': False,
+    })
+    monkeypatch.setattr(replicas, '_recent_writers',
+                        LRUCache(replicas.MAX_TRACKED_WRITERS, float('inf')))
+    app = create_app(config)
+
+    def sync():
+        """Copy the primary over the replica, like replication would."""
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose()
+        source, target = sqlite3.connect(primary), sqlite3.connect(replica)
+        with target:
+            source.backup(target)
+        source.close()
+        target.close()
+
+    app.sync_replica = sync
+    sync()
+    yield app
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def amenity_names():
+    return sorted(amenity.name for amenity
+                  in hbnb_facade.amenity_repository.get_all())
+
+
+def create_amenity(app, name):
+    with app.app_context():
+        return hbnb_facade.create_amenity({'name': name}).id
+
+
+def test_reads_go_to_the_replica(replica_app):
+    create_amenity(replica_app, 'Wifi')
+    replica_app.sync_replica()
+    create_amenity(replica_app, 'Pool')
+
+    with replica_app.app_context():
+        assert amenity_names() == ['Wifi']
+        assert hbnb_facade.amenity_repository.get_by_attribute(
+            'name', 'Pool') is None
+
+
+def test_writes_go_to_the_primary(replica_app):
+    amenity_id = create_amenity(replica_app, 'Wifi')
+    replica_app.sync_replica()
+
+    with replica_app.app_context():
+        hbnb_facade.amenity_repository.update(amenity_id, {'name': 'Fiber'})
+        # the session wrote, so it now reads from the primary
+        assert amenity_names() == ['Fiber']
+    with replica_app.app_context():
+        assert amenity_names() == ['Wifi']
+    replica_app.sync_replica()
+    with replica_app.app_context():
+        assert amenity_names() == ['Fiber']
+
+
+def test_principals_read_their_own_writes(replica_app):
+    with replica_app.app_context():
+        alice_id = hbnb_facade.create_user({
+            'first_name': 'Alice', 'last_name': 'Smith',
+            'email': 'alice.smith@example.com', 'password': 'password123'}).id
+        bob_id = hbnb_facade.create_user({
+            'first_name': 'Bob', 'last_name': 'Jones',
+            'email': 'bob.jones@example.com', 'password': 'password123'}).id
+    replica_app.sync_replica()
+
+    def as_user(user_id):
+        from flask_jwt_extended import create_access_token
+        with replica_app.app_context():
+            token = create_access_token(identity={'id': user_id})
+        return replica_app.test_request_context(
+            headers={'Authorization': f'Bearer {token}'})
+
+    with as_user(alice_id):
+        hbnb_facade.create_amenity({'name': 'Wifi'})
+    with as_user(alice_id):
+        assert amenity_names() == ['Wifi']
+    with as_user(bob_id):
+        assert amenity_names() == []
+
+
+def test_units_of_work_read_the_primary(replica_app):
+    create_amenity(replica_app, 'Wifi')
+
+    with replica_app.app_context():
+        with unit_of_work():
+            assert amenity_names() == ['Wifi']
+        db.session.remove()
+        assert amenity_names() == []
+
+
+def test_writes_load_their_object_from_the_primary(replica_app):
+    amenity_id = create_amenity(replica_app, 'Wifi')
+    replica_app.sync_replica()
+
+    with replica_app.app_context():
+        # loaded from the replica before the primary changes
+        assert hbnb_facade.get_amenity(amenity_id).name == 'Wifi'
+        primary = replica_app.config['SQLALCHEMY_DATABASE_URI'][10:]
+        with sqlite3.connect(primary) as connection:
+            connection.execute("UPDATE amenity SET name = 'Fiber'")
+        amenity = hbnb_facade.update_amenity(amenity_id,
+                                             {'description': 'Fast'})
+        assert (amenity.name, amenity.description) == ('Fiber', 'Fast')
+
+    # created on the primary only, not replicated yet
+    new_amenity_id = create_amenity(replica_app, 'Pool')
+    with replica_app.app_context():
+        assert hbnb_facade.update_amenity(new_amenity_id,
+                                          {'name': 'Spa'}) is not None
+
+
+def test_recent_writers_are_bounded(replica_app, monkeypatch):
+    monkeypatch.setattr(replicas, '_recent_writers', LRUCache(2, 60))
+    for address in ('10.0.0.1', '10.0.0.2', '10.0.0.3'):
+        with replica_app.test_request_context(
+                environ_base={'REMOTE_ADDR': address}):
+            replicas.record_write(db.session)
+    assert len(replicas._recent_writers) == 2
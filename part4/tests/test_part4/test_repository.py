@@ -0,0 +1,61 @@
+import pytest
+from app.models.amenity import Amenity
+from app.persistence.repository import SQLAlchemyRepository
+
+
+@pytest.fixture
+def repository(app):
+    return SQLAlchemyRepository(Amenity)
+
+
+def test_add_many_commits_once(owner, count_commits):
+    from app.models.place import Place
+
+    repository = SQLAlchemyRepository(Place)
+    places = [Place(title=f'Place {i}', description='', price=10.0,
+                    latitude=0.0, longitude=0.0, owner=owner)
+              for i in range(3)]
+    with count_commits() as commits:
+        repository.add_many(places)
+    assert len(commits) == 1
+    assert len(repository.get_all()) == 3
+
+
+def test_add_mappings_applies_column_defaults(repository):
+    assert repository.add_mappings([{'name': 'Pool'}, {'name': 'Gym'}]) == 2
+
+    amenities = repository.get_all()
+    assert sorted(a.name for a in amenities) == ['Gym', 'Pool']
+    assert all(a.id and a.created_at for a in amenities)
+
+
+def test_update_many_and_delete_many(facade, repository):
+    pool, gym, spa = [facade.create_amenity({'name': name})
+                      for name in ('Pool', 'Gym', 'Spa')]
+
+    updated = repository.update_many({pool.id: {'description': 'Heated'},
+                                      'unknown': {'description': 'x'}})
+    assert updated == [pool]
+    assert repository.get(pool.id).description == 'Heated'
+
+    assert repository.delete_many([gym.id, spa.id, 'unknown']) == 2
+    assert repository.get_all() == [pool]
+
+
+def test_unit_of_work_commits_once(facade, count_commits):
+    with count_commits() as commits:
+        with facade.unit_of_work():
+            for name in ('Pool', 'Gym', 'Spa'):
+                facade.create_amenity({'name': name})
+            with facade.unit_of_work():
+                facade.create_amenity({'name': 'Sauna'})
+    assert len(commits) == 1
+    assert len(facade.get_all_amenities()) == 4
+
+
+def test_unit_of_work_rolls_back_on_error(facade):
+    with pytest.raises(ValueError):
+        with facade.unit_of_work():
+            facade.create_amenity({'name': 'Pool'})
+            facade.create_amenity({'name': ''})
+    assert facade.get_all_amenities() == []
@@ -0,0 +1,113 @@
+import time
+from flask_jwt_extended import create_access_token
+from app.services.revocation import ExpiringMap, Revocations, revocations
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def bearer(token):
+    return {'Authorization': f'Bearer {token}'}
+
+
+def test_entries_are_dropped_by_bucket_after_expiry():
+    clock = FakeClock()
+    entries = ExpiringMap(granularity=10, clock=clock)
+    entries.set('a', 1, expires_at=1005)
+    entries.set('b', 2, expires_at=1012)
+    entries.set('c', 3)
+    assert (entries.get('a'), entries.get('b')) == (1, 2)
+
+    clock.now = 1009  # 'a' expired, its bucket ends at 1010
+    assert entries.get('a') == 1
+    clock.now = 1010
+    assert entries.get('a') is None
+    assert len(entries) == 2
+    clock.now = 1_000_000
+    assert (entries.get('b'), entries.get('c')) == (None, 3)
+    assert len(entries) == 1
+
+
+def test_replaced_entry_takes_its_new_expiry():
+    clock = FakeClock()
+    entries = ExpiringMap(granularity=10, clock=clock)
+    entries.set('a', 1, expires_at=1005)
+    entries.set('a', 2, expires_at=1025)
+    clock.now = 1015
+    assert entries.get('a') == 2
+    assert entries.get('a', expires_at=1025) == 2
+    assert entries.get('a', expires_at=1005) is None
+
+
+def test_logout_revokes_the_token(client, owner, auth_headers):
+    headers = auth_headers(owner)
+    assert client.get('/api/v1/auth/protected',
+                      headers=headers).status_code == 200
+    assert client.post('/api/v1/auth/logout',
+                       headers=headers).status_code == 200
+    assert client.get('/api/v1/auth/protected',
+                      headers=headers).status_code == 401
+    assert client.get('/api/v1/auth/protected',
+                      headers=auth_headers(owner)).status_code == 200
+
+
+def test_admin_revokes_the_tokens_of_a_user(client, owner, guest,
+                                            auth_headers):
+    guest_headers = auth_headers(guest)
+    assert client.post(f'/api/v1/auth/revoke/{owner.id}',
+                       headers=guest_headers).status_code == 403
+
+    owner.is_admin = True
+    response = client.post(f'/api/v1/auth/revoke/{guest.id}',
+                           headers=auth_headers(owner))
+    assert response.status_code == 200
+    assert client.get('/api/v1/auth/protected',
+                      headers=guest_headers).status_code == 401
+
+
+def test_tokens_issued_after_the_revocation_are_accepted(client, guest,
+                                                         auth_headers):
+    earlier = create_access_token(
+        identity={'id': guest.id, 'is_admin': False},
+        additional_claims={'iat': int(time.time()) - 10})
+    revocations.revoke_user(guest.id, before=time.time() - 5)
+    assert client.get('/api/v1/auth/protected',
+                      headers=bearer(earlier)).status_code == 401
+    assert client.get('/api/v1/auth/protected',
+                      headers=auth_headers(guest)).status_code == 200
+
+
+def test_revocations_go_through_the_shared_backend(app, owner):
+    shared = ExpiringMap()
+    workers = [Revocations(), Revocations()]
+    for worker in workers:
+        worker.shared = shared
+    payload = {'jti': 'abc', 'exp': time.time() + 60, 'iat': time.time(),
+               'sub': {'id': owner.id, 'is_admin': False}}
+
+    workers[0].revoke_token(payload)
+    assert workers[1].is_revoked({}, payload)
+    assert not workers[1].is_revoked({}, dict(payload, jti='other'))
+    workers[1].revoke_user(owner.id)
+    assert workers[0].is_revoked({}, dict(payload, jti='other'))
+    assert not revocations.is_revoked({}, payload)
+
+
+def test_later_user_revocation_of_another_process_wins(app, owner):
+    shared = ExpiringMap()
+    workers = [Revocations(), Revocations()]
+    for worker in workers:
+        worker.shared = shared
+    now = time.time()
+    payload = {'jti': 'abc', 'exp': now + 60, 'iat': now - 10,
+               'sub': {'id': owner.id, 'is_admin': False}}
+
+    workers[0].revoke_user(owner.id, before=now - 20)
+    assert not workers[0].is_revoked({}, payload)
+    workers[1].revoke_user(owner.id, before=now - 5)
+    assert workers[0].is_revoked({}, payload)
@@ -0,0 +1,117 @@
+import logging
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from flask_migrate import upgrade
+from sqlalchemy import event, select, text
+from sqlalchemy.engine import Engine
+from app import MIGRATIONS_DIR, create_app, db
+from app.models.place import Place
+from app.models.table_version import TableVersion
+from app.persistence.geo import grid_cell
+from app.persistence.schema import SCHEMA_REVISION
+from config import TestingConfig
+
+
+@pytest.fixture
+def file_config(tmp_path):
+    return type('FileConfig', (TestingConfig,), {
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'hbnb.db'}",
+        'SCHEMA_AUTO_CREATE': False, 'LAZY_STARTUP': False})
+
+
+def dispose(app):
+    with app.app_context():
+        db.engine.dispose()
+
+
+def test_schema_revision_is_the_migrations_head():
+    assert ScriptDirectory(MIGRATIONS_DIR).get_current_head() == \
+        SCHEMA_REVISION
+
+
+def test_outdated_database_is_refused(file_config, caplog):
+    with caplog.at_level(logging.ERROR, logger='app.persistence.schema'):
+        app = create_app(file_config)
+    assert 'db upgrade' in caplog.text
+    response = app.test_client().get('/api/v1/amenities/')
+    assert response.status_code == 503
+    assert 'db upgrade' in response.json['message']
+    dispose(app)
+
+
+def test_migrations_build_the_model_schema(file_config):
+    app = create_app(file_config)
+    with app.app_context():
+        upgrade(directory=MIGRATIONS_DIR)
+        with db.engine.connect() as connection:
+            context = MigrationContext.configure(
+                connection, opts={'render_as_batch': True})
+            assert compare_metadata(context, db.metadata) == []
+    dispose(app)
+
+    app = create_app(file_config)
+    assert app.test_client().get('/api/v1/amenities/').status_code == 200
+    with app.app_context():
+        # every table has its change counter
+        assert set(db.session.scalars(select(TableVersion.name))) == \
+            set(db.metadata.tables)
+    dispose(app)
+
+
+def test_create_app_checks_the_schema_with_one_query(file_config):
+    app = create_app(file_config)
+    with app.app_context():
+        upgrade(directory=MIGRATIONS_DIR)
+    dispose(app)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if not statement.startswith('PRAGMA'):
+            statements.append(statement)
+
+    event.listen(Engine, 'before_cursor_execute', record)
+    try:
+        app = create_app(file_config)
+    finally:
+        event.remove(Engine, 'before_cursor_execute', record)
+    assert len(statements) == 1
+    assert 'alembic_version' in statements[0]
+    dispose(app)
+
+
+def test_baseline_database_is_upgraded_with_its_data(file_config):
+    app = create_app(file_config)
+    with app.app_context():
+        # a database created before migrations, stamped at the baseline
+        upgrade(directory=MIGRATIONS_DIR, revision='0001')
+        now = '2024-01-01 00:00:00'
+        with db.engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO user (id, email, password, first_name, "
+                "last_name, is_admin, is_owner, created_at, updated_at) "
+                "VALUES ('u1', 'a@example.com', 'x', 'A', 'B', 0, 1, "
+                ":now, :now)"), {'now': now})
+            connection.execute(text(
+                "INSERT INTO place (id, title, price, latitude, longitude, "
+                "owner_id, created_at, updated_at) VALUES ('p1', 'Loft', "
+                "100, 48.85, 2.35, 'u1', :now, :now)"), {'now': now})
+            for i, rating in enumerate((4, 5)):
+                connection.execute(text(
+                    "INSERT INTO review (id, text, rating, user_id, "
+                    "place_id, created_at, updated_at) VALUES (:id, 'ok', "
+                    ":rating, 'u1', 'p1', :now, :now)"),
+                    {'id': f'r{i}', 'rating': rating, 'now': now})
+        upgrade(directory=MIGRATIONS_DIR)
+    dispose(app)
+
+    app = create_app(file_config)
+    response = app.test_client().get('/api/v1/places/')
+    assert response.status_code == 200
+    with app.app_context():
+        place = db.session.get(Place, 'p1')
+        assert place.grid_cell == grid_cell(48.85, 2.35)
+        assert (place.review_count, place.avg_rating) == (2, 4.5)
+    dispose(app)
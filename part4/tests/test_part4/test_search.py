@@ -0,0 +1,133 @@
+import pytest
+from sqlalchemy import inspect
+from conftest import make_place
+from app import db
+from app.persistence import geo
+
+PARIS = (48.8566, 2.3522)
+VERSAILLES = (48.8049, 2.1204)   # ~18 km from Paris
+LYON = (45.7640, 4.8357)         # ~390 km from Paris
+FIJI_EAST = (-17.0, 179.95)
+FIJI_WEST = (-17.0, -179.95)
+
+
+@pytest.fixture
+def places(facade, owner):
+    return {name: make_place(facade, owner, title=name,
+                             latitude=lat, longitude=lon)
+            for name, (lat, lon) in (('Paris', PARIS),
+                                     ('Versailles', VERSAILLES),
+                                     ('Lyon', LYON),
+                                     ('Fiji East', FIJI_EAST),
+                                     ('Fiji West', FIJI_WEST))}
+
+
+def titles(response):
+    return [place['title'] for place in response.get_json()]
+
+
+def test_radius_search_returns_nearest_first(client, places):
+    response = client.get('/api/v1/places/search'
+                          f'?lat={PARIS[0]}&lon={PARIS[1]}&radius_km=25')
+    assert response.status_code == 200
+    assert titles(response) == ['Paris', 'Versailles']
+    assert response.get_json()[1]['distance_km'] == pytest.approx(18, abs=1)
+
+    response = client.get('/api/v1/places/search'
+                          f'?lat={PARIS[0]}&lon={PARIS[1]}&radius_km=400')
+    assert titles(response) == ['Paris', 'Versailles', 'Lyon']
+
+
+def test_radius_search_across_the_antimeridian(client, places):
+    response = client.get('/api/v1/places/search'
+                          '?lat=-17&lon=179.99&radius_km=20')
+    assert sorted(titles(response)) == ['Fiji East', 'Fiji West']
+
+
+def test_radius_search_preloads_only_the_results(facade, owner,
+                                                 count_queries):
+    for i in range(12):
+        make_place(facade, owner, title=f'Place {i}',
+                   latitude=PARIS[0] + 0.01 * i, longitude=PARIS[1])
+    db.session.expunge_all()
+
+    with count_queries() as statements:
+        matches = facade.search_places_by_radius(*PARIS, 50, 2)
+    assert [place.title for place, _ in matches] == ['Place 0', 'Place 1']
+    # candidates capped in SQL, then one reload and one amenity query
+    assert len(statements) == 3
+    assert 'LIMIT' in statements[0]
+    assert 'amenity' not in statements[0]
+    # the amenities of the two results only
+    assert 'place_amenity' in statements[2]
+    assert statements[2].count('?') == 2
+    for place, _ in matches:
+        assert 'amenities' not in inspect(place).unloaded
+
+
+def test_radius_search_finds_the_nearest_toward_the_pole(facade, owner):
+    # Ranked in SQL after the four places south of the centre
+    for i in range(4):
+        make_place(facade, owner, title=f'South {i}', latitude=56,
+                   longitude=4 + 0.05 * i)
+    make_place(facade, owner, title='North', latitude=64, longitude=4.2)
+
+    for limit in (1, 10):
+        matches = facade.search_places_by_radius(60, 0, 600, limit)
+        place, distance = matches[0]
+        assert place.title == 'North'
+        assert distance == pytest.approx(495.6, abs=0.1)
+        assert [d for _, d in matches] == sorted(d for _, d in matches)
+
+
+def test_nearest_order_keys_bound_the_distance():
+    centre = (60, 0)
+    order = geo.NearestOrder(*centre, geo.radius_boxes(*centre, 600))
+    for point in ((56, 4), (64, 4.2), (65.3, -10), (60, 10.7), (55, 0)):
+        assert order.lower_bound_km(order.key(*point)) <= \
+            geo.haversine_km(*centre, *point)
+
+
+def test_box_search(client, places):
+    response = client.get('/api/v1/places/search/bbox?min_lat=45'
+                          '&min_lon=2.2&max_lat=49&max_lon=5')
+    assert sorted(titles(response)) == ['Lyon', 'Paris']
+
+    response = client.get('/api/v1/places/search/bbox?min_lat=-20'
+                          '&min_lon=179&max_lat=-10&max_lon=-179')
+    assert sorted(titles(response)) == ['Fiji East', 'Fiji West']
+
+
+def test_search_follows_updated_coordinates(client, facade, places):
+    facade.update_place(places['Lyon'].id,
+                        {'latitude': 48.86, 'longitude': 2.35})
+    response = client.get('/api/v1/places/search'
+                          f'?lat={PARIS[0]}&lon={PARIS[1]}&radius_km=5')
+    assert sorted(titles(response)) == ['Lyon', 'Paris']
+
+
+@pytest.mark.parametrize('query', [
+    'lat=91&lon=0&radius_km=1',
+    'lat=0&lon=0&radius_km=0',
+    'lat=0&lon=0&radius_km=100000',
+    'lat=0&lon=0',
+])
+def test_invalid_radius_search(client, query):
+    response = client.get(f'/api/v1/places/search?{query}')
+    assert response.status_code == 400
+
+
+def test_grid_cell_is_set_on_insert_and_bulk_insert(facade, owner):
+    place = make_place(facade, owner, latitude=PARIS[0], longitude=PARIS[1])
+    assert place.grid_cell == geo.grid_cell(*PARIS)
+
+    facade.place_repository.add_mappings([dict(
+        title='Bulk', price=10.0, latitude=LYON[0], longitude=LYON[1],
+        owner_id=owner.id)])
+    bulk = facade.place_repository.get_by_attribute('title', 'Bulk')
+    assert bulk.grid_cell == geo.grid_cell(*LYON)
+
+
+def test_radius_boxes_cover_every_longitude_near_a_pole():
+    (box,) = geo.radius_boxes(89.99, 0, 10)
+    assert box[1:] == (90.0, -180.0, 180.0)
@@ -0,0 +1,120 @@
+import pytest
+from flask_jwt_extended import create_access_token, decode_token
+from app import create_app
+from app.services.signing import signing_keys
+from config import TestingConfig
+
+cryptography = pytest.importorskip('cryptography')
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa  # noqa
+
+
+def write_key(tmp_path, name, algorithm):
+    """Write a new key pair as ``name.pem`` and ``name.pub``; return the
+    two paths."""
+    if algorithm == 'RS256':
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        key = ed25519.Ed25519PrivateKey.generate()
+    private, public = tmp_path / f'{name}.pem', tmp_path / f'{name}.pub'
+    private.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()))
+    public.write_bytes(key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo))
+    return str(private), str(public)
+
+
+def signing_app(algorithm, private_key_file, public_key_files=()):
+    return create_app(type('SigningConfig', (TestingConfig,), {
+        'JWT_ALGORITHM': algorithm,
+        'JWT_PRIVATE_KEY_FILE': private_key_file,
+        'JWT_PUBLIC_KEY_FILES': list(public_key_files)}))
+
+
+def issue(app, user_id='u1'):
+    with app.app_context():
+        return create_access_token(identity={'id': user_id,
+                                             'is_admin': False})
+
+
+@pytest.mark.parametrize('algorithm', ['RS256', 'EdDSA'])
+def test_tokens_verify_against_the_jwks(tmp_path, algorithm):
+    import jwt
+    app = signing_app(algorithm, write_key(tmp_path, 'key', algorithm)[0])
+    token = issue(app)
+
+    header = jwt.get_unverified_header(token)
+    assert header['alg'] == algorithm
+    jwks = app.test_client().get('/.well-known/jwks.json').json
+    assert [key['kid'] for key in jwks['keys']] == [header['kid']]
+    key = jwt.PyJWKSet.from_dict(jwks)[header['kid']]
+    claims = jwt.decode(token, key.key, algorithms=[algorithm],
+                        options={'verify_sub': False})
+    assert claims['sub'] == {'id': 'u1', 'is_admin': False}
+
+
+def test_protected_endpoint_accepts_signed_tokens(tmp_path):
+    app = signing_app('EdDSA', write_key(tmp_path, 'key', 'EdDSA')[0])
+    with app.app_context():
+        from app.services.facade import hbnb_facade
+        user = hbnb_facade.create_user({
+            'first_name': 'Alice', 'last_name': 'Smith',
+            'email': 'alice.smith@example.com', 'password': 'password123'})
+        token = issue(app, user.id)
+        response = app.test_client().get(
+            '/api/v1/auth/protected',
+            headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 200
+
+
+def test_rotated_keys_stay_valid_until_removed(tmp_path):
+    old_private, old_public = write_key(tmp_path, 'old', 'RS256')
+    new_private = write_key(tmp_path, 'new', 'EdDSA')[0]
+    old_token = issue(signing_app('RS256', old_private))
+
+    app = signing_app('EdDSA', new_private, [old_public])
+    with app.app_context():
+        assert decode_token(old_token)['sub']['id'] == 'u1'
+        assert decode_token(issue(app))['sub']['id'] == 'u1'
+    jwks = app.test_client().get('/.well-known/jwks.json').json
+    assert [key['alg'] for key in jwks['keys']] == ['EdDSA', 'RS256']
+
+    app = signing_app('EdDSA', new_private)
+    response = app.test_client().post(
+        '/api/v1/auth/logout',
+        headers={'Authorization': f'Bearer {old_token}'})
+    assert response.status_code == 422
+
+
+def test_keys_are_parsed_once(tmp_path, monkeypatch):
+    import jwt.algorithms
+    app = signing_app('RS256', write_key(tmp_path, 'key', 'RS256')[0])
+
+    def parse(*args, **kwargs):
+        raise AssertionError("PEM parsed per token")
+    for name in ('load_pem_private_key', 'load_pem_public_key'):
+        monkeypatch.setattr(jwt.algorithms, name, parse)
+    with app.app_context():
+        assert decode_token(issue(app))['sub']['id'] == 'u1'
+
+
+def test_jwks_is_revalidated_with_its_etag(tmp_path):
+    app = signing_app('EdDSA', write_key(tmp_path, 'key', 'EdDSA')[0])
+    client = app.test_client()
+    response = client.get('/.well-known/jwks.json')
+    assert response.headers['Cache-Control'] == 'public, max-age=300'
+    response = client.get('/.well-known/jwks.json',
+                          headers={'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
+
+
+def test_symmetric_signing_publishes_no_keys(client):
+    assert client.get('/.well-known/jwks.json').status_code == 404
+    assert not signing_keys.asymmetric
+
+
+def test_asymmetric_signing_needs_a_private_key():
+    with pytest.raises(RuntimeError):
+        signing_app('RS256', None)
@@ -0,0 +1,60 @@
+import json
+import pytest
+from flask_restx.swagger import Swagger
+from app import create_app
+from app.api.v1 import spec
+from config import TestingConfig
+
+
+def test_spec_is_served_with_a_strong_etag(client):
+    response = client.get('/swagger.json')
+    assert response.status_code == 200
+    assert response.json['info']['title'] == 'HBnB API'
+    etag = response.headers['ETag']
+    assert not etag.startswith('W/')
+
+    response = client.get('/swagger.json', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+
+def test_spec_is_serialized_once_per_process(app, client, monkeypatch):
+    calls = []
+    render_spec = spec.render_spec
+    monkeypatch.setattr(spec, 'render_spec',
+                        lambda api: calls.append(api) or render_spec(api))
+    first = client.get('/swagger.json')
+    second = client.get('/swagger.json')
+    assert len(calls) == 1
+    assert first.data == second.data
+
+
+def test_exported_spec_replaces_runtime_generation(app, tmp_path,
+                                                   monkeypatch):
+    path = tmp_path / 'swagger.json'
+    result = app.test_cli_runner().invoke(args=['export-spec', str(path)])
+    assert result.exit_code == 0, result.output
+    etag = app.test_client().get('/swagger.json').headers['ETag']
+
+    generated = []
+    monkeypatch.setattr(Swagger, 'as_dict', generated.append)
+
+    config = type('StaticSpecConfig', (TestingConfig,), {
+        'SWAGGER_SPEC_FILE': str(path)})
+    client = create_app(config).test_client()
+    response = client.get('/swagger.json')
+    assert response.data == path.read_bytes()
+    assert response.headers['ETag'] == etag
+    assert json.loads(response.data)['info']['title'] == 'HBnB API'
+    # payload validation resolves the models against the exported spec
+    response = client.post('/api/v1/users/', json={'first_name': 'Jane'})
+    assert response.status_code == 400
+    assert generated == []
+
+
+def test_missing_spec_file_fails_at_startup(tmp_path):
+    config = type('StaticSpecConfig', (TestingConfig,), {
+        'SWAGGER_SPEC_FILE': str(tmp_path / 'missing.json'),
+        'LAZY_STARTUP': False})
+    with pytest.raises(FileNotFoundError):
+        create_app(config)
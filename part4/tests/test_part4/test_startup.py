@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+import click
+from app import create_app
+from config import TestingConfig
+
+PART4 = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+
+class EagerConfig(TestingConfig):
+    LAZY_STARTUP = False
+
+
+def api_rules(app):
+    return [rule for rule in app.url_map.iter_rules()
+            if rule.rule.startswith('/api/v1/')]
+
+
+def loaded_modules(code):
+    output = subprocess.run(
+        [sys.executable, '-c', f"{code}\nimport sys; print(*sys.modules)"],
+        cwd=PART4, capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+def test_lazy_app_builds_the_api_on_the_first_request():
+    app = create_app(TestingConfig)
+    assert 'hbnb_api' not in app.extensions
+    assert api_rules(app) == []
+
+    assert app.test_client().get('/api/v1/amenities/').status_code == 200
+    assert 'hbnb_api' in app.extensions
+    assert api_rules(app)
+
+
+def test_eager_app_builds_the_api_up_front():
+    app = create_app(EagerConfig)
+    assert api_rules(app)
+    assert 'migrate' in app.extensions
+
+
+def test_lazy_app_sets_up_migrations_for_the_cli_only():
+    assert 'migrate' not in create_app(TestingConfig).extensions
+    with click.Context(click.Command('db')):
+        app = create_app(TestingConfig)
+    assert 'migrate' in app.extensions
+
+
+def test_lazy_startup_skips_the_heavy_imports():
+    modules = loaded_modules(
+        "from app import create_app\n"
+        "create_app('config.TestingConfig')")
+    for heavy in ('flask_restx', 'alembic', 'multiprocessing',
+                  'app.services.facade'):
+        assert heavy not in modules
@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import text
+from app import create_app, db
+from app import warmup
+from config import TestingConfig
+
+
+@pytest.fixture
+def file_app(tmp_path):
+    config = type('FileConfig', (TestingConfig,), {
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'hbnb.db'}"})
+    app = create_app(config)
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+def test_warm_up_opens_the_pool_and_runs_the_warmup_requests(file_app):
+    with file_app.app_context():
+        db.engine.dispose()
+    timings = warmup.warm_up(file_app, connections=3)
+    assert set(timings) == {'pool', *warmup.WARMUP_PATHS}
+    with file_app.app_context():
+        assert db.engine.pool.checkedin() == 3
+
+
+def test_reset_after_fork_drops_inherited_connections(file_app):
+    warmup.warm_up(file_app, connections=2)
+    warmup.reset_after_fork(file_app)
+    with file_app.app_context():
+        assert db.engine.pool.checkedin() == 0
+        assert db.session.execute(text('SELECT 1')).scalar() == 1
+
+
+def test_failed_warmup_request_stops_the_worker(file_app, monkeypatch):
+    file_app.add_url_rule('/unavailable', 'unavailable',
+                          lambda: ('', 503))
+    monkeypatch.setattr(warmup, 'WARMUP_PATHS', ('/unavailable',))
+    with pytest.raises(RuntimeError):
+        warmup.warm_up(file_app)